@@ -54,12 +54,14 @@ OUTPUT_FILE = Path(__file__).parent / "workspace-launcher.py"
 # Imports that should only appear once (in _header.py)
 STDLIB_IMPORTS = {
     "import asyncio",
+    "import fnmatch",
     "import glob",
     "import json",
     "import os",
     "import re",
     "import shlex",
     "import shutil",
+    "import stat",
     "import subprocess",
     "import sys",
     "import time",
@@ -69,8 +71,10 @@ STDLIB_IMPORTS = {
     "from contextvars import ContextVar",
     "from dataclasses import dataclass, field",
     "from enum import Enum",
+    "from functools import cached_property, lru_cache",
+    "from itertools import chain",
     "from pathlib import Path",
-    "from typing import Generic, TypeVar",
+    "from typing import Generic, NamedTuple, TypeVar",
     "from uuid import uuid4",
 }
 
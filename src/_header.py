@@ -24,12 +24,14 @@ Features:
 """
 
 import asyncio
+import fnmatch
 import glob
 import json
 import os
 import re
 import shlex
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
@@ -39,8 +41,10 @@ import traceback
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Callable, Generic, TypeVar
+from typing import Callable, Generic, NamedTuple, TypeVar
 from uuid import uuid4
 
 # =============================================================================
@@ -120,6 +124,8 @@ def show_import_error_dialog(package: str, error_msg: str) -> None:
 
 
 # Import external packages with visible error dialogs
+# iterm2 stays an eager import: the entry point itself runs under
+# iterm2.run_until_complete(), so deferring it would not shorten startup.
 try:
     import iterm2
 except ImportError as e:
@@ -10,15 +10,46 @@
 # Workspace Launcher Configuration
 # =============================================================================
 
-CONFIG_DIR = Path("~/.config/workspace-launcher").expanduser()
 WORKSPACE_PATTERN = "workspace-*.toml"
-PREFERENCES_PATH = CONFIG_DIR / "preferences.toml"
-
-# Legacy paths (for backward compatibility / migration)
-LEGACY_CONFIG_DIR = Path("~/.config/iterm2").expanduser()
 LEGACY_LAYOUT_PATTERN = "layout-*.toml"
-LEGACY_CONFIG_PATH = LEGACY_CONFIG_DIR / "layout.toml"
-LEGACY_PREFERENCES_PATH = LEGACY_CONFIG_DIR / "selector-preferences.toml"
+
+
+class _Paths:
+    """
+    Config file locations, resolved on first use.
+
+    expanduser() is deferred until a path is actually consulted rather than
+    running for every path at import time.
+    """
+
+    @cached_property
+    def config_dir(self) -> Path:
+        return Path("~/.config/workspace-launcher").expanduser()
+
+    @cached_property
+    def preferences(self) -> Path:
+        return self.config_dir / "preferences.toml"
+
+    # Legacy paths (for backward compatibility / migration)
+    @cached_property
+    def legacy_config_dir(self) -> Path:
+        return Path("~/.config/iterm2").expanduser()
+
+    @cached_property
+    def legacy_config(self) -> Path:
+        return self.legacy_config_dir / "layout.toml"
+
+    @cached_property
+    def legacy_preferences(self) -> Path:
+        return self.legacy_config_dir / "selector-preferences.toml"
+
+    @cached_property
+    def discovery_cache(self) -> Path:
+        # macOS: ~/Library/Caches/workspace-launcher/
+        return Path(platformdirs.user_cache_dir(appname="workspace-launcher")) / "discovery.json"
+
+
+PATHS = _Paths()
 
 # Default configuration - safe values that work without user config
 # Uses universally available commands (no broot, no custom tools)
@@ -54,6 +85,18 @@ SAFE_RIGHT_COMMAND = "zsh"
 # Query zsh for aliases at runtime, with fallback to hardcoded known aliases.
 
 
+# PATH lookups per binary name, cached for session (PATH is fixed after
+# _augment_path and validate_command runs twice per tab with the same commands)
+_which_cache: dict[str, str | None] = {}
+
+
+def _which_cached(binary: str) -> str | None:
+    """Return shutil.which(binary), caching the result for the session."""
+    if binary not in _which_cache:
+        _which_cache[binary] = shutil.which(binary)
+    return _which_cache[binary]
+
+
 def get_shell_aliases() -> dict[str, str]:
     """
     Query zsh for defined aliases at runtime.
@@ -137,7 +180,7 @@ class CommandResolver:
         """Resolve command through aliases and PATH."""
         aliases = cls.get_aliases()
         resolved = aliases.get(cmd, cmd)
-        return shutil.which(resolved)
+        return _which_cached(resolved)
 
 
 # Fallback aliases when runtime shell query fails
@@ -179,34 +222,33 @@ def validate_command(command: str, fallback: str) -> str:
 
     binary = parts[0]
 
-    # Check if binary exists in PATH
-    if shutil.which(binary):
+    # Check if binary exists in PATH (before touching aliases: the runtime
+    # alias query spawns an interactive zsh)
+    if _which_cached(binary):
         return command
 
-    # Try runtime shell alias resolution (queries zsh, cached for session)
+    # Alias candidates in resolution order: runtime shell alias (queries zsh,
+    # cached for session), then hardcoded KNOWN_ALIASES. Each distinct
+    # target is looked up once.
+    candidates = []
     runtime_aliases = CommandResolver.get_aliases()
     if binary in runtime_aliases:
-        actual_binary = runtime_aliases[binary]
-        if shutil.which(actual_binary):
-            logger.debug(
-                "Using runtime shell alias",
-                operation="validate_command",
-                alias=binary,
-                actual_binary=actual_binary,
-                source="zsh"
-            )
-            return command  # Keep original command - shell will resolve alias
-
-    # Fall back to hardcoded aliases if runtime query returned empty
+        candidates.append((runtime_aliases[binary], "zsh"))
     if binary in KNOWN_ALIASES:
-        actual_binary = KNOWN_ALIASES[binary]
-        if shutil.which(actual_binary):
+        candidates.append((KNOWN_ALIASES[binary], "KNOWN_ALIASES"))
+
+    seen = {binary}
+    for actual_binary, source in candidates:
+        if actual_binary in seen:
+            continue
+        seen.add(actual_binary)
+        if _which_cached(actual_binary):
             logger.debug(
-                "Using fallback known alias",
+                "Using shell alias",
                 operation="validate_command",
                 alias=binary,
                 actual_binary=actual_binary,
-                source="KNOWN_ALIASES"
+                source=source
             )
             return command  # Keep original command - shell will resolve alias
 
@@ -243,13 +285,15 @@ def extract_toml_error_context(error: tomllib.TOMLDecodeError, file_path: Path)
         line_number = int(line_match.group(1))
 
     # If we have a line number, read that line from the file
-    if line_number and file_path.exists():
+    # Stream lines and stop at the target (avoids loading the whole file)
+    if line_number and line_number > 0 and file_path.exists():
         try:
             with open(file_path, "r") as f:
-                lines = f.readlines()
-                if 0 < line_number <= len(lines):
-                    line_content = lines[line_number - 1].rstrip()
-        except OSError:
+                for current, raw in enumerate(f, 1):
+                    if current == line_number:
+                        line_content = raw.rstrip()
+                        break
+        except (OSError, UnicodeDecodeError):
             pass
 
     # Format helpful message
@@ -289,20 +333,20 @@ def load_config() -> dict | None:
     Returns:
         dict: Merged configuration, or None if config file missing/invalid
     """
-    if not LEGACY_CONFIG_PATH.exists():
+    if not PATHS.legacy_config.exists():
         return None
 
     try:
-        with open(LEGACY_CONFIG_PATH, "rb") as f:
+        with open(PATHS.legacy_config, "rb") as f:
             user_config = tomllib.load(f)
         return deep_merge(DEFAULT_CONFIG, user_config)
     except tomllib.TOMLDecodeError as e:
-        error_context = extract_toml_error_context(e, LEGACY_CONFIG_PATH)
+        error_context = extract_toml_error_context(e, PATHS.legacy_config)
         logger.error(
             "Invalid TOML syntax in configuration file",
             operation="load_config",
             status="failed",
-            file=str(LEGACY_CONFIG_PATH),
+            file=str(PATHS.legacy_config),
             line_number=error_context["line_number"],
             line_content=error_context["line_content"],
             error=error_context["formatted_message"]
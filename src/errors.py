@@ -16,19 +16,21 @@ class ErrorType(Enum):
     TIMEOUT_ERROR = "timeout_error"
 
 
-@dataclass
-class Error:
+# Error and Result are immutable values built on every config load, so they
+# are NamedTuples (tuple subclasses: no per-instance __dict__, cheap to build).
+# ErrorReport accumulates state and stays a dataclass (slotted: one per run,
+# no __dict__).
+class Error(NamedTuple):
     error_type: ErrorType
     message: str
-    context: dict = field(default_factory=dict)
-    original_exception: Exception = None
+    context: dict | None = None
+    original_exception: Exception | None = None
 
 
-@dataclass
-class Result(Generic[T]):
+class Result(NamedTuple, Generic[T]):
     success: bool
-    value: T = None
-    error: Error = None
+    value: T | None = None
+    error: Error | None = None
 
     @staticmethod
     def ok(value: T) -> 'Result[T]':
@@ -45,7 +47,7 @@ class Result(Generic[T]):
         return not self.success
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorReport:
     errors: list[Error] = field(default_factory=list)
     warnings: list[Error] = field(default_factory=list)
@@ -57,7 +59,7 @@ class ErrorReport:
             operation="error_report",
             status="error",
             error_type=error.error_type.value,
-            **error.context
+            **(error.context or {})
         )
 
     def add_warning(self, error: Error):
@@ -67,7 +69,7 @@ class ErrorReport:
             operation="error_report",
             status="warning",
             error_type=error.error_type.value,
-            **error.context
+            **(error.context or {})
         )
 
     def collect_result(self, result: Result, context: str = "") -> bool:
@@ -7,7 +7,7 @@
 # =============================================================================
 
 
-def show_manage_layouts_swiftdialog(
+async def show_manage_layouts_swiftdialog(
     layouts: list[dict],
     disabled_layouts: list[str]
 ) -> list[str] | None:
@@ -19,7 +19,8 @@ def show_manage_layouts_swiftdialog(
         disabled_layouts: Current list of disabled workspace names
 
     Returns:
-        Updated list of disabled workspace names, or None if cancelled
+        Updated list of disabled workspace names (the disabled_layouts
+        object itself if nothing changed), or None if cancelled
     """
     if not layouts:
         logger.warning(
@@ -29,9 +30,10 @@ def show_manage_layouts_swiftdialog(
         return None
 
     # Build checkboxes: checked = ENABLED (will show in selector)
+    disabled_set = frozenset(disabled_layouts)
     checkboxes = []
     for layout in layouts:
-        is_enabled = layout["name"] not in disabled_layouts
+        is_enabled = layout["name"] not in disabled_set
         checkboxes.append({
             "label": layout["display"],
             "checked": is_enabled,
@@ -70,7 +72,7 @@ def show_manage_layouts_swiftdialog(
         disabled_count=len(disabled_layouts)
     )
 
-    return_code, output = run_swiftdialog(dialog_config)
+    return_code, output = await run_swiftdialog_async(dialog_config)
 
     if return_code == 2:
         logger.debug(
@@ -96,6 +98,15 @@ def show_manage_layouts_swiftdialog(
         if not is_checked:
             new_disabled.append(layout["name"])
 
+    # Saved without edits: hand back the input list itself so the caller
+    # can detect "no change" by identity and skip the preferences write
+    if sorted(new_disabled) == sorted(disabled_layouts):
+        logger.debug(
+            "Workspaces unchanged",
+            operation="show_manage_layouts_swiftdialog"
+        )
+        return disabled_layouts
+
     logger.info(
         "Workspaces updated",
         operation="show_manage_layouts_swiftdialog",
@@ -120,7 +131,7 @@ async def show_manage_layouts(
         prefs: Current preferences dict
 
     Returns:
-        Updated preferences dict, or None if cancelled
+        Updated preferences dict, or None if cancelled or unchanged
     """
     if not is_swiftdialog_available():
         logger.warning(
@@ -131,20 +142,10 @@ async def show_manage_layouts(
 
     disabled_layouts = prefs.get("disabled_layouts", [])
 
-    # Run SwiftDialog in executor (non-blocking)
-    loop = asyncio.get_event_loop()
-    new_disabled = await loop.run_in_executor(
-        None,
-        show_manage_layouts_swiftdialog,
-        layouts,
-        disabled_layouts
-    )
+    new_disabled = await show_manage_layouts_swiftdialog(layouts, disabled_layouts)
 
-    if new_disabled is None:
-        return None
+    if new_disabled is None or new_disabled is disabled_layouts:
+        return None  # Cancelled or unchanged: nothing to save
 
     # Update preferences with new disabled list
-    updated_prefs = prefs.copy()
-    updated_prefs["disabled_layouts"] = new_disabled
-
-    return updated_prefs
+    return {**prefs, "disabled_layouts": new_disabled}
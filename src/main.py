@@ -15,14 +15,19 @@ async def main(connection):
     5. Create tabs with split panes
     6. Maximize window
     """
+    # Eager tasks (Python 3.12+): gathered coroutines run their synchronous
+    # prefix inline instead of waiting one event-loop iteration to start
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     main_trace_id = str(uuid4())
+    # Bound once: every main() log record carries operation and trace_id
+    log = logger.bind(operation="main", trace_id=main_trace_id)
     report = ErrorReport()
 
-    logger.info(
+    log.info(
         "Workspace Launcher starting",
-        operation="main",
-        status="started",
-        trace_id=main_trace_id
+        status="started"
     )
 
     # =========================================================================
@@ -34,11 +39,7 @@ async def main(connection):
     # Get the current window (or create one if none exists)
     window = app.current_terminal_window
     if window is None:
-        logger.info(
-            "No current window - creating a new one",
-            operation="main",
-            trace_id=main_trace_id
-        )
+        log.info("No current window - creating a new one")
         window = await iterm2.Window.async_create(connection)
 
     # =========================================================================
@@ -46,11 +47,9 @@ async def main(connection):
     # =========================================================================
 
     if needs_migration():
-        logger.info(
+        log.info(
             "Legacy config detected - offering migration",
-            operation="main",
-            status="migration_needed",
-            trace_id=main_trace_id
+            status="migration_needed"
         )
         await run_migration_wizard(connection, window)
 
@@ -59,19 +58,15 @@ async def main(connection):
     # =========================================================================
 
     if is_first_run():
-        logger.info(
+        log.info(
             "First run detected - starting wizard",
-            operation="main",
-            status="first_run",
-            trace_id=main_trace_id
+            status="first_run"
         )
         wizard_success = await run_first_run_wizard(connection, window)
         if not wizard_success:
-            logger.info(
+            log.info(
                 "First-run wizard cancelled or failed",
-                operation="main",
-                status="wizard_cancelled",
-                trace_id=main_trace_id
+                status="wizard_cancelled"
             )
             return
 
@@ -80,36 +75,36 @@ async def main(connection):
     # =========================================================================
 
     prefs = load_preferences()
+    # Read once; save_custom_names rebinds it when Layer 2 renames tabs
+    custom_tab_names = prefs.get("custom_tab_names", {})
 
-    while True:  # Back from tab customization restarts workspace selection
-        all_layouts = discover_layouts()
+    # Scanned once: going back from tab customization reuses the list, and
+    # only the setup wizard (which writes new workspace files) rescans
+    all_layouts = discover_layouts()
 
-        # Filter out disabled layouts for selector display
-        disabled_layouts = prefs.get("disabled_layouts", [])
+    while True:  # Back from tab customization restarts workspace selection
+        # Filter out disabled layouts for selector display (set: O(1) lookups)
+        disabled_layouts = frozenset(prefs.get("disabled_layouts", []))
         layouts = [layout for layout in all_layouts if layout["name"] not in disabled_layouts]
 
         if not all_layouts:
             # Fallback: Check for legacy layout.toml (backward compatibility)
-            if LEGACY_CONFIG_PATH.exists():
-                logger.info(
+            if PATHS.legacy_config.exists():
+                log.info(
                     "Using legacy config",
-                    operation="main",
                     status="legacy_fallback",
-                    trace_id=main_trace_id,
-                    config_path=str(LEGACY_CONFIG_PATH)
+                    config_path=str(PATHS.legacy_config)
                 )
                 config = load_config()
                 if config is None:
                     return
                 # Skip to tab creation with legacy config
-                selected_layout = {"name": "legacy", "path": LEGACY_CONFIG_PATH}
+                selected_layout = {"name": "legacy", "path": PATHS.legacy_config}
             else:
-                logger.error(
+                log.error(
                     "No workspace files found",
-                    operation="main",
                     status="failed",
-                    trace_id=main_trace_id,
-                    expected_location=f"{CONFIG_DIR}/workspace-*.toml"
+                    expected_location=f"{PATHS.config_dir}/workspace-*.toml"
                 )
                 return
         else:
@@ -132,35 +127,27 @@ async def main(connection):
                     )
                     if auto_result == "open":
                         selected_layout = last_layout_match
-                        logger.info(
+                        log.info(
                             "Auto-opening last workspace",
-                            operation="main",
                             status="auto_open",
-                            trace_id=main_trace_id,
                             layout_name=last_name,
                         )
                     elif auto_result == "cancel":
-                        logger.info(
+                        log.info(
                             "Auto-open cancelled",
-                            operation="main",
                             status="cancelled",
-                            trace_id=main_trace_id,
                         )
                         return
                     else:
                         # "change" — fall through to full selector
-                        logger.info(
+                        log.info(
                             "User chose to change workspace",
-                            operation="main",
                             status="change_workspace",
-                            trace_id=main_trace_id,
                         )
                 else:
-                    logger.warning(
+                    log.warning(
                         "Last workspace not found, showing selector",
-                        operation="main",
                         status="last_not_found",
-                        trace_id=main_trace_id,
                         last_layout=last_name,
                     )
 
@@ -172,11 +159,9 @@ async def main(connection):
                 )
 
                 if selector_result is None:
-                    logger.info(
+                    log.info(
                         "Workspace selection cancelled",
-                        operation="main",
-                        status="cancelled",
-                        trace_id=main_trace_id
+                        status="cancelled"
                     )
                     return
 
@@ -185,33 +170,27 @@ async def main(connection):
                     action = selector_result.get("action")
 
                     if action == "manage_directories":
-                        logger.info(
+                        log.info(
                             "Opening directory management",
-                            operation="main",
-                            status="settings",
-                            trace_id=main_trace_id
+                            status="settings"
                         )
                         # Show directory management dialog
                         updated_prefs = await show_directory_management(prefs)
                         if updated_prefs is not None:
                             prefs = updated_prefs
                             save_preferences(prefs)
-                            logger.info(
+                            log.info(
                                 "Scan directories updated",
-                                operation="main",
                                 status="directories_updated",
-                                trace_id=main_trace_id,
                                 enabled_dirs=sum(1 for d in prefs.get("scan_directories", []) if d.get("enabled"))
                             )
                         # Continue loop to show selector again
                         continue
 
                     if action == "manage_layouts":
-                        logger.info(
+                        log.info(
                             "Opening workspace management",
-                            operation="main",
-                            status="manage_layouts",
-                            trace_id=main_trace_id
+                            status="manage_layouts"
                         )
                         # Show layout management dialog with ALL layouts
                         updated_prefs = await show_manage_layouts(all_layouts, prefs)
@@ -219,13 +198,11 @@ async def main(connection):
                             prefs = updated_prefs
                             save_preferences(prefs)
                             # Refresh filtered layouts list
-                            disabled_layouts = prefs.get("disabled_layouts", [])
+                            disabled_layouts = frozenset(prefs.get("disabled_layouts", []))
                             layouts = [layout for layout in all_layouts if layout["name"] not in disabled_layouts]
-                            logger.info(
+                            log.info(
                                 "Workspace visibility updated",
-                                operation="main",
                                 status="layouts_updated",
-                                trace_id=main_trace_id,
                                 disabled_count=len(disabled_layouts),
                                 visible_count=len(layouts)
                             )
@@ -233,17 +210,15 @@ async def main(connection):
                         continue
 
                     if action == "run_wizard":
-                        logger.info(
+                        log.info(
                             "Running setup wizard (manual trigger)",
-                            operation="main",
-                            status="wizard_manual",
-                            trace_id=main_trace_id
+                            status="wizard_manual"
                         )
                         # Run wizard - creates new layout file without overwriting existing
                         await run_setup_wizard_for_veteran(connection, window)
                         # Refresh layouts after wizard
                         all_layouts = discover_layouts()
-                        disabled_layouts = prefs.get("disabled_layouts", [])
+                        disabled_layouts = frozenset(prefs.get("disabled_layouts", []))
                         layouts = [layout for layout in all_layouts if layout["name"] not in disabled_layouts]
                         # Continue loop to show selector again
                         continue
@@ -257,22 +232,18 @@ async def main(connection):
                 save_preferences(prefs)
 
             # Load the selected workspace config
-            logger.info(
+            log.info(
                 "Loading workspace",
-                operation="main",
                 status="loading",
-                trace_id=main_trace_id,
                 layout_name=selected_layout["name"]
             )
             config_result = load_config_from_path(selected_layout["path"])
 
             # Use collect_result to aggregate errors
             if not report.collect_result(config_result, "load_config"):
-                logger.error(
+                log.error(
                     "Failed to load workspace config",
-                    operation="main",
-                    status="config_load_failed",
-                    trace_id=main_trace_id
+                    status="config_load_failed"
                 )
                 report.log_summary(main_trace_id)
                 return
@@ -283,125 +254,110 @@ async def main(connection):
             return
 
         tabs = config.get("tabs", [])
+        config_path = str(selected_layout["path"])
         if not tabs:
-            logger.warning(
+            log.warning(
                 "No tabs configured in workspace",
-                operation="main",
                 status="no_tabs",
-                trace_id=main_trace_id,
-                config_path=str(selected_layout["path"])
+                config_path=config_path
             )
             return
 
-        # =========================================================================
-        # Window Activation (ensure focus before creating tabs)
-        # =========================================================================
-
-        # Ensure window has focus before creating tabs
-        await app.async_activate()
-        await window.async_activate()
-        logger.debug(
-            "Window activated and focused",
-            operation="main",
-            trace_id=main_trace_id
-        )
-
         left_pane_ratio = config["layout"]["left_pane_ratio"]
-        logger.info(
+        log.info(
             "Creating workspace",
-            operation="main",
             status="creating",
-            trace_id=main_trace_id,
             layout_name=selected_layout["name"],
             left_pane_ratio=int(left_pane_ratio * 100),
-            config_path=str(selected_layout["path"])
+            config_path=config_path
         )
 
         # =========================================================================
         # Worktree Discovery (Universal - All Git Repos)
         # =========================================================================
 
+        # Universal discovery (single filesystem pass for repos + untracked)
+        scan_directories = get_enabled_scan_directories(prefs)
+
         # Legacy worktree discovery (config-based, for backward compatibility)
-        legacy_worktrees = discover_worktrees(config)
+        # and the single-pass repo/untracked scan (plus worktrees of the repos
+        # found) are independent: run both on worker threads concurrently
+        legacy_worktrees, (all_git_repos, universal_worktrees, untracked_folders) = await asyncio.gather(
+            asyncio.to_thread(discover_worktrees, config),
+            asyncio.to_thread(
+                discover_scan_tree,
+                scan_directories=scan_directories,
+                exclude_dirs=set()
+            ),
+        )
         if legacy_worktrees:
-            logger.info(
+            log.info(
                 "Legacy worktrees discovered",
-                operation="main",
-                trace_id=main_trace_id,
                 metrics={"count": len(legacy_worktrees)},
                 worktrees=[{"name": wt["name"], "dir": wt["dir"]} for wt in legacy_worktrees]
             )
 
-        # Universal discovery (single filesystem pass for repos + untracked)
-        layout_dirs = {Path(tab["dir"]).expanduser() for tab in tabs}
-        scan_directories = get_enabled_scan_directories(prefs)
-
-        # Single-pass discovery: git repos and untracked folders together
-        all_git_repos, untracked_folders = discover_all_directories(
-            scan_directories=scan_directories,
-            exclude_dirs=set()
-        )
-        additional_repos = [r for r in all_git_repos if Path(r["dir"]).expanduser() not in layout_dirs]
-
-        # Filter untracked folders to exclude layout directories
-        untracked_folders = [
-            f for f in untracked_folders
-            if Path(f["dir"]).expanduser() not in layout_dirs
-        ]
+        # Check if user wants to skip tab customization: additional repos and
+        # untracked folders only feed the Layer 2 dialog, so skip filtering
+        # them (left as discovered; the logs below report the raw counts)
+        skip_customization = prefs.get("skip_tab_customization", False)
 
-        # Discover worktrees from git repos
-        universal_worktrees = discover_all_worktrees(all_git_repos)
+        if skip_customization:
+            additional_repos = all_git_repos
+        else:
+            layout_dirs = {os.path.normpath(expand_tab_path(tab["dir"])) for tab in tabs}
+            additional_repos = [
+                r for r in all_git_repos
+                if os.path.normpath(expand_tab_path(r["dir"])) not in layout_dirs
+            ]
+
+            # Filter untracked folders to exclude layout directories
+            untracked_folders = [
+                f for f in untracked_folders
+                if os.path.normpath(expand_tab_path(f["dir"])) not in layout_dirs
+            ]
 
         if universal_worktrees:
-            logger.info(
+            log.info(
                 "Universal worktrees discovered",
-                operation="main",
-                trace_id=main_trace_id,
                 metrics={"count": len(universal_worktrees)},
                 worktrees=[{"name": wt["name"], "dir": wt["dir"]} for wt in universal_worktrees]
             )
 
         if untracked_folders:
-            logger.info(
+            log.info(
                 "Untracked folders discovered",
-                operation="main",
-                trace_id=main_trace_id,
                 metrics={"count": len(untracked_folders)},
                 folders=[{"name": f["name"], "dir": f["dir"]} for f in untracked_folders]
             )
 
-        logger.info(
+        log.info(
             "Discovery complete",
-            operation="main",
             status="discovery_complete",
-            trace_id=main_trace_id,
             metrics={
                 "layout_tabs": len(tabs),
                 "legacy_worktrees": len(legacy_worktrees),
                 "universal_worktrees": len(universal_worktrees),
                 "additional_repos": len(additional_repos),
                 "untracked_folders": len(untracked_folders)
-            }
+            },
+            layer2_skipped=skip_customization
         )
 
         # =========================================================================
         # Layer 2: Tab Customization (Optional)
         # =========================================================================
 
-        # Check if user wants to skip tab customization
-        skip_customization = prefs.get("skip_tab_customization", False)
-
         if not skip_customization and (universal_worktrees or additional_repos or untracked_folders):
             # Show Layer 2 dialog for tab selection
-            logger.info(
+            log.info(
                 "Showing tab customization dialog",
-                operation="main",
-                status="layer2_start",
-                trace_id=main_trace_id
+                status="layer2_start"
             )
             # Callback to save custom tab names when user renames
             def save_custom_names(new_names: dict[str, str], _prefs=prefs) -> None:
-                _prefs["custom_tab_names"] = new_names
+                nonlocal custom_tab_names
+                _prefs["custom_tab_names"] = custom_tab_names = new_names
                 save_preferences(_prefs)
 
             final_tabs = await show_tab_customization(
@@ -411,35 +367,29 @@ async def main(connection):
                 additional_repos=additional_repos,
                 untracked_folders=untracked_folders,
                 last_tab_selections=prefs.get("last_tab_selections"),
-                custom_tab_names=prefs.get("custom_tab_names", {}),
+                custom_tab_names=custom_tab_names,
                 save_preferences_callback=save_custom_names
             )
 
             if final_tabs == "BACK_TO_SELECTOR":
-                logger.info(
+                log.info(
                     "Returning to workspace selector",
-                    operation="main",
-                    status="back_to_selector",
-                    trace_id=main_trace_id
+                    status="back_to_selector"
                 )
                 continue  # Re-enter outer workspace selection loop
 
             if final_tabs is None:
-                logger.info(
+                log.info(
                     "Workspace creation cancelled at tab customization",
-                    operation="main",
-                    status="cancelled",
-                    trace_id=main_trace_id
+                    status="cancelled"
                 )
                 return
 
             # Validate that user selected at least one tab
             if len(final_tabs) == 0:
-                logger.warning(
+                log.warning(
                     "No tabs selected - showing confirmation dialog",
-                    operation="main",
-                    status="empty_selection",
-                    trace_id=main_trace_id
+                    status="empty_selection"
                 )
                 # Show confirmation dialog for empty selection
                 confirm_alert = iterm2.Alert(
@@ -461,7 +411,7 @@ async def main(connection):
                         additional_repos=additional_repos,
                         untracked_folders=untracked_folders,
                         last_tab_selections=prefs.get("last_tab_selections"),
-                        custom_tab_names=prefs.get("custom_tab_names", {}),
+                        custom_tab_names=custom_tab_names,
                         save_preferences_callback=save_custom_names
                     )
                     if final_tabs is None:
@@ -472,20 +422,23 @@ async def main(connection):
             saved_order = prefs.get("last_tab_order")
             if saved_order and len(final_tabs) > 1:
                 order_map = {normalize_tab_path(d): i for i, d in enumerate(saved_order)}
-                final_tabs.sort(
-                    key=lambda t: order_map.get(normalize_tab_path(get_tab_dir(t)), 999)
-                )
+                # (rank, index, tab): the index keeps ties in their original
+                # order and ensures the tab dicts themselves are never compared
+                keyed = [
+                    (order_map.get(normalize_tab_path(get_tab_dir(t)), 999), i, t)
+                    for i, t in enumerate(final_tabs)
+                ]
+                keyed.sort()
+                final_tabs = [t for _, _, t in keyed]
 
             all_tabs = final_tabs
 
             # Offer tab reorder if more than 1 tab selected
             if len(all_tabs) > 1 and is_swiftdialog_available():
-                reordered = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda _tabs=all_tabs, _prefs=prefs: show_tab_reorder_dialog(
-                        _tabs,
-                        custom_tab_names=_prefs.get("custom_tab_names", {}),
-                    ),
+                reordered = await asyncio.to_thread(
+                    show_tab_reorder_dialog,
+                    all_tabs,
+                    custom_tab_names=custom_tab_names,
                 )
                 if reordered is not None:
                     all_tabs = reordered
@@ -519,21 +472,45 @@ async def main(connection):
             break
 
     # =========================================================================
-    # Detect Already-Open Tabs
+    # Detect Already-Open Tabs + Window Preparation
     # =========================================================================
 
-    # Get custom tab names early - used by filter and display throughout
-    custom_tab_names = prefs.get("custom_tab_names", {})
+    # Ensure window has focus before creating tabs: the two activation RPCs
+    # are sent together
+    activate_task = asyncio.gather(app.async_activate(), window.async_activate())
+
+    # Open tabs are queried only now, after the dialogs, so tabs opened while
+    # they were showing are seen. The query and the tab directory checks (on
+    # worker threads: a stat can stall on network mounts or sleeping disks)
+    # run during activation and while the window is maximized
+    open_dirs_task = asyncio.create_task(get_open_tab_directories(window))
+    tab_dirs = [get_tab_dir(t) for t in all_tabs]
+    dirs_exist_task = asyncio.gather(
+        *(asyncio.to_thread(os.path.isdir, expand_tab_path(d)) for d in tab_dirs)
+    )
+    try:
+        await activate_task
+        log.debug("Window activated and focused")
+
+        # Maximize window first
+        log.info("Maximizing window")
+        await maximize_window(window)
+
+        open_dirs = await open_dirs_task
+        dirs_exist = await dirs_exist_task
+    finally:
+        # No-ops once finished; on failure nothing is left pending
+        activate_task.cancel()
+        open_dirs_task.cancel()
+        dirs_exist_task.cancel()
 
-    open_dirs = await get_open_tab_directories(window)
     if open_dirs:
-        logger.info(
+        log.info(
             "Detected open directories",
-            operation="main",
-            trace_id=main_trace_id,
             count=len(open_dirs),
         )
 
+    dir_exists = dict(zip(tab_dirs, dirs_exist))
     tabs_to_create, tabs_skipped = filter_already_open_tabs(
         all_tabs, open_dirs, custom_tab_names
     )
@@ -543,14 +520,6 @@ async def main(connection):
     # Window and Tab Creation
     # =========================================================================
 
-    # Maximize window first
-    logger.info(
-        "Maximizing window",
-        operation="main",
-        trace_id=main_trace_id
-    )
-    await maximize_window(window)
-
     # Track whether we've used the initial tab (for is_first logic)
     # When tabs were skipped (already open), never reuse the active tab —
     # the user's focused tab should not be overwritten.
@@ -558,20 +527,21 @@ async def main(connection):
 
     # Track created tabs for reordering (dir_path → Tab object)
     created_tabs: dict[str, object] = {}
+    # Names of the tabs actually created (for the tabs_created metric)
+    created_names: list[str] = []
+
+    # Display names resolved once, in all_tabs order: used for tab creation
+    # and again for the last_tab_selections saved below
+    tab_names = [get_tab_display_name(t, custom_tab_names) for t in all_tabs]
 
     # Validate all tabs first and filter out invalid ones
     valid_tabs: list[tuple[dict, str, str]] = []  # (tab_config, tab_dir, tab_name)
-    for idx, tab_config in enumerate(all_tabs):
+    for idx, (tab_config, tab_name) in enumerate(zip(all_tabs, tab_names)):
         tab_dir = get_tab_dir(tab_config)
-        tab_name = get_tab_display_name(tab_config, custom_tab_names)
-        expanded_dir = expand_tab_path(tab_dir)
-
-        if not os.path.isdir(expanded_dir):
-            logger.warning(
+        if not dir_exists[tab_dir]:
+            log.warning(
                 "Tab skipped - directory not found",
-                operation="main",
                 status="skip",
-                trace_id=main_trace_id,
                 tab_index=idx + 1,
                 tab_name=tab_name,
                 tab_dir=tab_dir
@@ -587,10 +557,8 @@ async def main(connection):
     # Create first tab (reuses current tab if no tabs were skipped)
     if valid_tabs and not used_initial_tab:
         _, first_dir, first_name = valid_tabs[0]
-        logger.info(
+        log.info(
             "Creating first tab (reusing current)",
-            operation="main",
-            trace_id=main_trace_id,
             tab_index=1,
             tab_name=first_name,
             tab_dir=first_dir
@@ -599,34 +567,53 @@ async def main(connection):
             window, connection, first_dir, first_name, config, is_first=True
         )
         created_tabs[first_dir] = first_tab
+        created_names.append(first_name)
         remaining_tabs = valid_tabs[1:]
     else:
         remaining_tabs = valid_tabs
 
     # Create remaining tabs in PARALLEL using asyncio.gather()
     if remaining_tabs:
-        logger.info(
-            f"Creating {len(remaining_tabs)} tabs in parallel",
-            operation="main",
-            trace_id=main_trace_id
-        )
+        log.info(f"Creating {len(remaining_tabs)} tabs in parallel")
+
+        # Cap in-flight tab creations: each one is a burst of RPCs (create,
+        # split, layout, send text), and iTerm2 serves them on one connection
+        tab_slots = asyncio.Semaphore(4)
 
         async def create_single_tab(tab_info: tuple[dict, str, str]) -> tuple[str, object]:
             """Create a single tab and return (dir, tab) tuple."""
             _, tab_dir, tab_name = tab_info
-            tab = await create_tab_with_splits(
-                window, connection, tab_dir, tab_name, config, is_first=False
-            )
+            async with tab_slots:
+                tab = await create_tab_with_splits(
+                    window, connection, tab_dir, tab_name, config, is_first=False
+                )
             return (tab_dir, tab)
 
-        # Create all remaining tabs concurrently
-        results = await asyncio.gather(*[
-            create_single_tab(tab_info) for tab_info in remaining_tabs
-        ])
+        # Create all remaining tabs concurrently (at most 4 at a time); one
+        # failed tab is reported and skipped instead of aborting the others
+        results = await asyncio.gather(
+            *[create_single_tab(tab_info) for tab_info in remaining_tabs],
+            return_exceptions=True
+        )
 
         # Collect results into created_tabs dict
-        for tab_dir, tab in results:
-            created_tabs[tab_dir] = tab
+        for (_, tab_dir, tab_name), result in zip(remaining_tabs, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result  # Cancellation etc. is not a per-tab failure
+                report.add_warning(Error(
+                    error_type=ErrorType.ASYNC_ERROR,
+                    message=f"Tab creation failed: {tab_name}",
+                    context={
+                        "tab_name": tab_name,
+                        "tab_dir": tab_dir,
+                        "error": f"{type(result).__name__}: {result}",
+                    },
+                    original_exception=result
+                ))
+                continue
+            created_tabs[tab_dir] = result[1]
+            created_names.append(tab_name)
 
     # Reorder all window tabs to match the finalized order
     # Pass created_tabs to bypass path query for newly created tabs
@@ -635,27 +622,21 @@ async def main(connection):
 
     # Save updated preferences with all selected tabs (including skipped ones
     # that were already open — they are still part of the workspace selection)
-    # Use get_tab_display_name for consistent name resolution with custom names
-    all_tab_names = list(tabs_skipped) + [
-        get_tab_display_name(t, custom_tab_names) for t in all_tabs
-    ]
+    # Names come from get_tab_display_name for consistent resolution with custom names
+    all_tab_names = list(tabs_skipped) + tab_names
     prefs["last_tab_selections"] = all_tab_names
     save_preferences(prefs)
 
-    logger.info(
+    log.info(
         "Workspace created successfully",
-        operation="main",
-        status="complete",
-        trace_id=main_trace_id
+        status="complete"
     )
 
-    logger.info(
+    log.info(
         "Workspace creation complete",
-        operation="main",
         status="success",
-        trace_id=main_trace_id,
         metrics={
-            "tabs_created": len(all_tabs),
+            "tabs_created": len(created_names),
             "warnings": len(report.warnings),
             "errors": len(report.errors)
         }
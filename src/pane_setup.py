@@ -6,30 +6,119 @@
 # Pane Setup
 # =============================================================================
 
+# Connections (by id) whose prompt API failed outright: later panes on the
+# same connection skip the probe and send their command directly
+_shell_integration_unavailable: set[int] = set()
+
+# Poll interval while waiting for the shell to show a fresh prompt after cd
+_PROMPT_POLL_INTERVAL = 0.05
+
+
+@lru_cache(maxsize=256)
+def _cd_command(directory: str) -> str:
+    """Shell line that changes to directory (memoized: both panes of a tab
+    cd to the same place)."""
+    # Expand ~ first, then quote for paths with spaces
+    return f"cd {shlex.quote(os.path.expanduser(directory))}\n"
+
+
+def _prompt_probe_failed(connection, directory: str, e: Exception) -> None:
+    """Log a failed prompt query; stop probing if the prompt API is unusable.
+
+    AttributeError/TypeError mean the prompt API itself is unusable, so later
+    panes on this connection skip it; RPC errors may be transient or
+    session-specific and are retried for the next pane.
+    """
+    if not isinstance(e, iterm2.RPCException):
+        _shell_integration_unavailable.add(id(connection))
+    logger.warning(
+        "Shell integration unavailable, falling back to direct send",
+        operation="setup_pane_and_send_command",
+        status="fallback",
+        directory=directory,
+        error=str(e),
+        error_type=type(e).__name__
+    )
+
+
+async def _wait_for_new_prompt(
+    connection, session_id: str, settle_time: float, stale_prompt_id: str | None
+):
+    """Poll until a new prompt is ready for input, for at most settle_time.
+
+    The prompt that was on screen before cd (stale_prompt_id) doesn't count:
+    it is still EDITING until the shell has read the cd line.
+
+    Returns:
+        The ready prompt, or the last prompt seen (None if shell integration
+        reported none) once settle_time has elapsed
+    """
+    deadline = time.monotonic() + settle_time
+    while True:
+        prompt = await iterm2.async_get_last_prompt(connection, session_id)
+        if (
+            prompt
+            and prompt.command_state == iterm2.PromptState.EDITING
+            and prompt.unique_id != stale_prompt_id
+        ):
+            return prompt
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return prompt
+        await asyncio.sleep(min(_PROMPT_POLL_INTERVAL, remaining))
+
 
 async def setup_pane_and_send_command(
     session, connection, directory: str, command: str, settle_time: float
 ):
     """
-    Setup a pane: cd to directory, wait briefly, then send command.
+    Setup a pane: cd to directory, wait for the shell, then send command.
+
+    With shell integration the wait ends as soon as a fresh prompt is ready
+    (settle_time is the upper bound); without it, waits settle_time.
 
     Args:
         session: iTerm2 session object
         connection: iTerm2 connection
         directory: Working directory
         command: Command to execute
-        settle_time: Wait time after cd (seconds)
+        settle_time: Maximum wait after cd (seconds)
     """
-    # Change to target directory (expand ~ first, then quote for paths with spaces)
-    expanded_path = os.path.expanduser(directory)
-    await session.async_send_text(f"cd {shlex.quote(expanded_path)}\n")
+    # Change to target directory
+    cd_text = _cd_command(directory)
 
-    # Wait briefly for cd to complete
-    await asyncio.sleep(settle_time)
+    # Remember the prompt on screen before cd so the wait below only accepts
+    # a newer one
+    probe = id(connection) not in _shell_integration_unavailable
+    stale_prompt_id = None
+    if probe:
+        try:
+            previous = await iterm2.async_get_last_prompt(connection, session.session_id)
+            stale_prompt_id = previous.unique_id if previous else None
+        except (iterm2.RPCException, AttributeError, TypeError) as e:
+            _prompt_probe_failed(connection, directory, e)
+            probe = False
+
+    await session.async_send_text(cd_text)
+
+    if not probe:
+        # No prompt API: wait briefly for cd to complete, then send
+        await asyncio.sleep(settle_time)
+        await session.async_send_text(f"{command}\n")
+        logger.debug(
+            "Command sent without prompt probe (shell integration unavailable)",
+            operation="setup_pane_and_send_command",
+            status="success",
+            directory=directory,
+            shell_integration=False
+        )
+        return True
 
     # Check if shell integration provides prompt state
     try:
-        prompt = await iterm2.async_get_last_prompt(connection, session.session_id)
+        prompt = await _wait_for_new_prompt(
+            connection, session.session_id, settle_time, stale_prompt_id
+        )
         if prompt:
             # Shell integration working - check state
             if prompt.command_state == iterm2.PromptState.EDITING:
@@ -66,14 +155,7 @@ async def setup_pane_and_send_command(
             return True
     except (iterm2.RPCException, AttributeError, TypeError) as e:
         # Shell integration not available or error - send command anyway
-        logger.warning(
-            "Shell integration unavailable, falling back to direct send",
-            operation="setup_pane_and_send_command",
-            status="fallback",
-            directory=directory,
-            error=str(e),
-            error_type=type(e).__name__
-        )
+        _prompt_probe_failed(connection, directory, e)
         await session.async_send_text(f"{command}\n")
         return True
 
@@ -169,28 +251,26 @@ async def maximize_window(window):
         # Get the visible screen area (excludes menu bar and dock)
         screen = NSScreen.mainScreen()
         if screen:
+            # Read the frame across the PyObjC bridge once, as plain ints
             visible_frame = screen.visibleFrame()
+            origin, size = visible_frame.origin, visible_frame.size
+            x, y = int(origin.x), int(origin.y)
+            width, height = int(size.width), int(size.height)
 
             # Debug output
             logger.debug(
                 "Screen dimensions retrieved",
                 operation="maximize_window",
-                width=int(visible_frame.size.width),
-                height=int(visible_frame.size.height),
-                origin_x=int(visible_frame.origin.x),
-                origin_y=int(visible_frame.origin.y)
+                width=width,
+                height=height,
+                origin_x=x,
+                origin_y=y
             )
 
             # Create iTerm2 frame using constructor
             frame = iterm2.Frame(
-                origin=iterm2.Point(
-                    int(visible_frame.origin.x),
-                    int(visible_frame.origin.y)
-                ),
-                size=iterm2.Size(
-                    int(visible_frame.size.width),
-                    int(visible_frame.size.height)
-                )
+                origin=iterm2.Point(x, y),
+                size=iterm2.Size(width, height)
             )
 
             # Set the window frame
@@ -199,8 +279,8 @@ async def maximize_window(window):
                 "Window maximized successfully",
                 operation="maximize_window",
                 status="success",
-                width=int(visible_frame.size.width),
-                height=int(visible_frame.size.height)
+                width=width,
+                height=height
             )
             return True
         else:
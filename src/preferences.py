@@ -11,7 +11,7 @@ def discover_layouts() -> list[dict]:
     """
     Discover available workspace files in config directory.
 
-    Scans CONFIG_DIR for files matching WORKSPACE_PATTERN (workspace-*.toml).
+    Scans PATHS.config_dir for files matching WORKSPACE_PATTERN (workspace-*.toml).
 
     Returns:
         List of dicts with keys: name, display, path, tab_count
@@ -27,18 +27,11 @@ def discover_layouts() -> list[dict]:
         operation="discover_layouts",
         status="started",
         trace_id=op_trace_id,
-        config_dir=str(CONFIG_DIR),
+        config_dir=str(PATHS.config_dir),
         pattern=WORKSPACE_PATTERN
     )
 
-    for path in sorted(CONFIG_DIR.glob(WORKSPACE_PATTERN)):
-        logger.debug(
-            "Found layout file",
-            operation="discover_layouts",
-            trace_id=op_trace_id,
-            file=path.name
-        )
-
+    for path in sorted(PATHS.config_dir.glob(WORKSPACE_PATTERN)):
         # Extract display name: workspace-{name}.toml -> {name}
         match = re.match(r"workspace-(.+)\.toml$", path.name)
         if not match:
@@ -66,14 +59,6 @@ def discover_layouts() -> list[dict]:
             }
             layouts.append(layout)
 
-            logger.debug(
-                "Added layout",
-                operation="discover_layouts",
-                trace_id=op_trace_id,
-                layout_name=name,
-                metrics={"tab_count": tab_count}
-            )
-
         except tomllib.TOMLDecodeError as e:
             error_context = extract_toml_error_context(e, path)
             logger.warning(
@@ -102,6 +87,7 @@ def discover_layouts() -> list[dict]:
         operation="discover_layouts",
         status="success",
         trace_id=op_trace_id,
+        layouts={layout["name"]: layout["tab_count"] for layout in layouts},
         metrics={"layouts_found": len(layouts), "duration_ms": duration_ms}
     )
 
@@ -113,6 +99,20 @@ def discover_layouts() -> list[dict]:
 DEFAULT_SCAN_DIRECTORIES: list[dict[str, str | bool]] = []
 
 
+# Preferences file content as last read or written by this process, with the
+# file's mtime at that point (None = not known). save_preferences skips the
+# atomic write + fsync when it would rewrite identical content to an
+# untouched file.
+_preferences_on_disk: tuple[str, int] | None = None
+
+
+def _preferences_mtime_ns() -> int | None:
+    try:
+        return os.stat(PATHS.preferences).st_mtime_ns
+    except OSError:
+        return None
+
+
 def load_preferences() -> dict:
     """
     Load selector preferences from TOML file.
@@ -121,6 +121,8 @@ def load_preferences() -> dict:
         dict with keys: remember_choice (bool), last_layout (str|None),
         scan_directories (list of {"path": str, "enabled": bool})
     """
+    global _preferences_on_disk
+
     defaults = {
         "remember_choice": False,
         "last_layout": None,
@@ -129,18 +131,21 @@ def load_preferences() -> dict:
         "disabled_layouts": [],  # layout names to hide from selector
     }
 
-    if not PREFERENCES_PATH.exists():
+    if not PATHS.preferences.exists():
         logger.debug(
             "Preferences file does not exist, using defaults",
             operation="load_preferences",
             status="default",
-            file=str(PREFERENCES_PATH)
+            file=str(PATHS.preferences)
         )
         return defaults
 
     try:
-        with open(PREFERENCES_PATH, "rb") as f:
-            prefs = tomllib.load(f)
+        with open(PATHS.preferences, "rb") as f:
+            text = f.read().decode("utf-8")
+            mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+        prefs = tomllib.loads(text)
+        _preferences_on_disk = (text, mtime_ns)
 
         result = {**defaults, **prefs}
 
@@ -158,19 +163,19 @@ def load_preferences() -> dict:
         )
         return result
 
-    except (OSError, tomllib.TOMLDecodeError, KeyError, TypeError) as e:
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError, KeyError, TypeError) as e:
         logger.warning(
             "Failed to load preferences, using defaults",
             operation="load_preferences",
             status="fallback",
-            file=str(PREFERENCES_PATH),
+            file=str(PATHS.preferences),
             error=str(e),
             error_type=type(e).__name__
         )
         return defaults
 
 
-def atomic_write_file(path: Path, content: str) -> None:
+def atomic_write_file(path: Path, content: str | bytes) -> None:
     """
     Write file atomically using temp file → fsync → rename pattern.
 
@@ -179,7 +184,8 @@ def atomic_write_file(path: Path, content: str) -> None:
 
     Args:
         path: Target file path
-        content: Content to write
+        content: Content to write (str is encoded as UTF-8; bytes are
+            written as-is)
 
     Raises:
         OSError: If write fails (including disk full - errno.ENOSPC)
@@ -198,9 +204,10 @@ def atomic_write_file(path: Path, content: str) -> None:
     )
 
     try:
-        # Write content
-        with os.fdopen(temp_fd, "w") as f:
-            f.write(content)
+        # Write content (binary mode: no text-layer wrapper for bytes input)
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        with os.fdopen(temp_fd, "wb") as f:
+            f.write(data)
             f.flush()
             os.fsync(f.fileno())  # Ensure data hits disk
 
@@ -231,6 +238,86 @@ def atomic_write_file(path: Path, content: str) -> None:
         raise
 
 
+# =============================================================================
+# Discovery Cache (persisted across launches)
+# =============================================================================
+# Stores the SwiftDialog path and directory scan results in a JSON file so a
+# new launch can revalidate them with a few stat() calls instead of
+# re-walking scan directories. Entries carry the mtimes they were computed
+# from; see selector.py. Worktrees are not cached (read fresh each launch).
+
+# Version 2 dropped the "worktrees" section: older files are discarded
+DISCOVERY_CACHE_VERSION = 2
+
+# Loaded on first use (None = not loaded yet)
+_discovery_cache: dict | None = None
+_discovery_cache_dirty = False
+
+
+def _empty_discovery_cache() -> dict:
+    return {
+        "version": DISCOVERY_CACHE_VERSION,
+        "swiftdialog_path": None,
+        "directory_scans": {},
+    }
+
+
+def get_discovery_cache() -> dict:
+    """
+    Return the discovery cache, loading it from disk on first call.
+
+    Missing, unreadable, or outdated cache files yield an empty cache.
+    """
+    global _discovery_cache
+
+    if _discovery_cache is not None:
+        return _discovery_cache
+
+    cache = _empty_discovery_cache()
+    try:
+        with open(PATHS.discovery_cache) as f:
+            loaded = json.load(f)
+        if isinstance(loaded, dict) and loaded.get("version") == DISCOVERY_CACHE_VERSION:
+            cache.update(loaded)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.debug(
+            "Ignoring unreadable discovery cache",
+            operation="get_discovery_cache",
+            file=str(PATHS.discovery_cache),
+            error=str(e)
+        )
+
+    _discovery_cache = cache
+    return _discovery_cache
+
+
+def mark_discovery_cache_dirty() -> None:
+    """Flag the discovery cache for writing on the next save."""
+    global _discovery_cache_dirty
+    _discovery_cache_dirty = True
+
+
+def save_discovery_cache() -> None:
+    """Write the discovery cache to disk atomically if it changed."""
+    global _discovery_cache_dirty
+
+    if _discovery_cache is None or not _discovery_cache_dirty:
+        return
+
+    try:
+        atomic_write_file(PATHS.discovery_cache, json.dumps(_discovery_cache))
+        _discovery_cache_dirty = False
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(
+            "Could not save discovery cache",
+            operation="save_discovery_cache",
+            file=str(PATHS.discovery_cache),
+            error=str(e)
+        )
+
+
 def save_preferences(prefs: dict) -> None:
     """
     Save selector preferences to TOML file atomically.
@@ -241,6 +328,8 @@ def save_preferences(prefs: dict) -> None:
     Args:
         prefs: dict with remember_choice, last_layout, scan_directories keys
     """
+    global _preferences_on_disk
+
     lines = [
         "# Workspace Launcher Preferences",
         "# Auto-generated by workspace-launcher.py",
@@ -296,14 +385,29 @@ def save_preferences(prefs: dict) -> None:
 
     content = "\n".join(lines) + "\n"
 
+    if (
+        _preferences_on_disk is not None
+        and _preferences_on_disk[0] == content
+        and _preferences_on_disk[1] == _preferences_mtime_ns()
+    ):
+        logger.debug(
+            "Preferences unchanged, skipping write",
+            operation="save_preferences",
+            status="unchanged",
+            file=str(PATHS.preferences)
+        )
+        return
+
     try:
-        atomic_write_file(PREFERENCES_PATH, content)
+        atomic_write_file(PATHS.preferences, content)
+        mtime_ns = _preferences_mtime_ns()
+        _preferences_on_disk = (content, mtime_ns) if mtime_ns is not None else None
 
         logger.debug(
             "Preferences saved successfully",
             operation="save_preferences",
             status="success",
-            file=str(PREFERENCES_PATH),
+            file=str(PATHS.preferences),
             remember_choice=prefs.get("remember_choice"),
             last_layout=prefs.get("last_layout"),
             scan_directories_count=len(scan_dirs) if scan_dirs else 0
@@ -314,7 +418,7 @@ def save_preferences(prefs: dict) -> None:
             "Failed to save preferences - user choices may not persist",
             operation="save_preferences",
             status="failed",
-            file=str(PREFERENCES_PATH),
+            file=str(PATHS.preferences),
             error=str(e)
         )
 
@@ -359,13 +463,13 @@ async def reset_preferences(connection, window) -> bool:
 
     # Delete preferences file
     try:
-        if PREFERENCES_PATH.exists():
-            PREFERENCES_PATH.unlink()
+        if PATHS.preferences.exists():
+            PATHS.preferences.unlink()
             logger.info(
                 "Preferences reset successfully",
                 operation="reset_preferences",
                 status="success",
-                file=str(PREFERENCES_PATH)
+                file=str(PATHS.preferences)
             )
 
             success_alert = iterm2.Alert(
@@ -6,6 +6,34 @@
 # Directory Management
 # =============================================================================
 
+# Fixed AppleScript source: the prompt arrives as a run-handler argument
+# (argv), so it is never spliced into code and needs no quoting
+_CHOOSE_FOLDER_SCRIPT = [
+    "-e", "on run argv",
+    "-e", "return POSIX path of (choose folder with prompt (item 1 of argv))",
+    "-e", "end run",
+]
+
+
+# Static part of the directory management dialog config (built once)
+_DIR_DIALOG_BASE = {
+    "title": "Manage Scan Directories",
+    "messagefont": "size=13",
+    "appearance": "dark",  # Force dark mode for consistent toggle colors
+    "icon": "SF=folder.badge.gearshape,colour=blue",
+    "iconsize": "50",
+    "checkboxstyle": {
+        "style": "switch",
+        "size": "regular"
+    },
+    "button1text": "Save",
+    "button2text": "Cancel",
+    "width": "700",
+    "moveable": True,
+    "ontop": True,
+    "json": True
+}
+
 
 def choose_folder_native(prompt: str = "Select a folder:") -> str | None:
     """
@@ -20,17 +48,15 @@ def choose_folder_native(prompt: str = "Select a folder:") -> str | None:
     Returns:
         Selected folder path, or None if cancelled
     """
-    # Build AppleScript command
-    # Use shlex.quote to handle special characters in prompt
-    applescript = f'POSIX path of (choose folder with prompt "{prompt}")'
-
     try:
         result = subprocess.run(
-            ["osascript", "-e", applescript],
-            capture_output=True,
+            ["osascript", *_CHOOSE_FOLDER_SCRIPT, prompt],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,  # Cancel message (-128) is never read
             text=True,
             timeout=120,
-            check=False
+            check=False,
+            close_fds=False
         )
 
         if result.returncode == 0 and result.stdout.strip():
@@ -65,7 +91,7 @@ def choose_folder_native(prompt: str = "Select a folder:") -> str | None:
         return None
 
 
-def show_directory_management_swiftdialog(
+async def show_directory_management_swiftdialog(
     current_dirs: list[dict]
 ) -> list[dict] | None:
     """
@@ -73,7 +99,7 @@ def show_directory_management_swiftdialog(
 
     Features:
     - Checkboxes for existing directories (unchecked = DELETE from list)
-    - "Add Folder" button triggers native macOS folder picker (up to 3 per session)
+    - Folder-select textfields to add up to 3 directories in the same dialog
     - Wider window with smaller font for full path visibility
     - All directories (including defaults) can be deleted
 
@@ -83,13 +109,12 @@ def show_directory_management_swiftdialog(
     Returns:
         Updated list of directory configs (only checked items), or None if cancelled
     """
-    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
 
     op_trace_id = str(uuid4())
 
     # Filter to only enabled directories for display
     working_dirs = [d.copy() for d in current_dirs if d.get("enabled", True)]
-    folders_added_this_session = 0
     max_folders_per_session = 3
 
     logger.info(
@@ -100,194 +125,170 @@ def show_directory_management_swiftdialog(
         metrics={"current_dirs": len(working_dirs)}
     )
 
-    # Loop to handle "Add Folder" button clicks
-    while True:
-        # Build checkboxes for current directories
-        checkboxes = [
-            {
-                "label": "─── Directories (uncheck to delete) ───",
-                "checked": False,
-                "disabled": True,
-                "icon": CATEGORY_ICONS["header_repo"]
-            }
-        ]
-
-        for scan_dir in working_dirs:
-            path = scan_dir["path"]
-            expanded = Path(path).expanduser()
-            exists = expanded.exists()
-            display_path = str(expanded) if not path.startswith("~") else path
-
-            checkboxes.append({
-                "label": display_path,
-                "checked": True,
-                "icon": CATEGORY_ICONS["additional_repo"] if exists else CATEGORY_ICONS["missing_path"]
-            })
-
-        # Calculate dynamic height
-        num_checkboxes = len(checkboxes)
-        base_height = 160
-        checkbox_height = num_checkboxes * 40
-        calculated_height = base_height + checkbox_height
-        dialog_height = max(300, min(700, calculated_height))
-
-        # Determine if Add Folder button should be enabled
-        can_add_more = folders_added_this_session < max_folders_per_session
-        add_button_text = f"+ Add Folder ({max_folders_per_session - folders_added_this_session} left)"
-
-        # Build dialog config
-        dialog_config = {
-            "title": "Manage Scan Directories",
-            "message": f"**Checked** = keep, **Unchecked** = delete.\n{len(working_dirs)} directories configured.",
-            "messagefont": "size=13",
-            "appearance": "dark",  # Force dark mode for consistent toggle colors
-            "icon": "SF=folder.badge.gearshape,colour=blue",
-            "iconsize": "50",
-            "checkbox": checkboxes,
-            "checkboxstyle": {
-                "style": "switch",
-                "size": "regular"
-            },
-            "button1text": "Save",
-            "button2text": "Cancel",
-            "height": str(dialog_height),
-            "width": "700",
-            "moveable": True,
-            "ontop": True,
-            "json": True
+    # Build checkboxes for current directories
+    checkboxes = [
+        {
+            "label": "─── Directories (uncheck to delete) ───",
+            "checked": False,
+            "disabled": True,
+            "icon": CATEGORY_ICONS["header_repo"]
         }
+    ]
+
+    # (scan_dir, expanded, display_path) per directory, reused to parse output
+    rows = []
+    for scan_dir in working_dirs:
+        path = scan_dir["path"]
+        expanded = os.path.expanduser(path)
+        display_path = path if path.startswith("~") else expanded
+        rows.append((scan_dir, expanded, display_path))
+
+    # Probe existence concurrently: a slow volume (network mount, sleeping
+    # external disk) would otherwise stall every directory after it
+    expanded_paths = [expanded for _, expanded, _ in rows]
+    if len(expanded_paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(expanded_paths))) as executor:
+            exists_flags = list(executor.map(os.path.exists, expanded_paths))
+    else:
+        exists_flags = [os.path.exists(p) for p in expanded_paths]
+
+    icon_present = CATEGORY_ICONS["additional_repo"]
+    icon_missing = CATEGORY_ICONS["missing_path"]
+    for (_, _, display_path), exists in zip(rows, exists_flags):
+        checkboxes.append({
+            "label": display_path,
+            "checked": True,
+            "icon": icon_present if exists else icon_missing
+        })
+
+    # Folder-select fields for new directories: picked in this same dialog,
+    # so adding folders doesn't tear down and relaunch SwiftDialog
+    add_field_titles = [f"Add folder {i}" for i in range(1, max_folders_per_session + 1)]
+    textfields = [
+        {"title": title, "fileselect": True, "filetype": "folder", "prompt": "Optional"}
+        for title in add_field_titles
+    ]
+
+    # Calculate dynamic height (~45px per textfield, as in the rename dialog)
+    num_checkboxes = len(checkboxes)
+    base_height = 160
+    checkbox_height = num_checkboxes * 40
+    calculated_height = base_height + checkbox_height + len(textfields) * 45
+    dialog_height = max(300, min(800, calculated_height))
+
+    # Build dialog config: fixed keys from _DIR_DIALOG_BASE plus per-session fields
+    dialog_config = {
+        **_DIR_DIALOG_BASE,
+        "message": (
+            f"**Checked** = keep, **Unchecked** = delete.\n{len(working_dirs)} directories configured. "
+            f"Use the fields below to add up to {max_folders_per_session} more."
+        ),
+        "checkbox": checkboxes,
+        "textfield": textfields,
+        "height": str(dialog_height),
+    }
+
+    return_code, output = await run_swiftdialog_async(dialog_config, timeout=300)
+
+    # Return code 4 = timeout, -1 = SwiftDialog missing or failed to launch
+    # (both already logged by run_swiftdialog_async)
+    if return_code in (4, -1):
+        logger.debug(
+            "Directory management dialog did not complete",
+            operation="show_directory_management",
+            status="timeout" if return_code == 4 else "exec_error",
+            trace_id=op_trace_id
+        )
+        return None
 
-        # Add "Add Folder" button if allowed (no action - we handle return code 3)
-        if can_add_more:
-            dialog_config["infobuttontext"] = add_button_text
+    # Return code 2 = Cancel
+    if return_code == 2:
+        logger.info(
+            "Directory management cancelled",
+            operation="show_directory_management",
+            status="cancelled",
+            trace_id=op_trace_id
+        )
+        return None
 
-        try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump(dialog_config, f)
-                config_path = f.name
+    # Return code 0 or 5 = Save
+    if return_code not in (0, 5):
+        logger.error(
+            "SwiftDialog failed",
+            operation="show_directory_management",
+            status="failed",
+            trace_id=op_trace_id,
+            return_code=return_code
+        )
+        return None
 
-            swiftdialog_bin = find_swiftdialog_path()
-            cmd = [swiftdialog_bin, "--jsonfile", config_path, "--json"]
+    # Empty or unparseable output: keep the current list rather than
+    # treating every directory as unchecked
+    if output is None:
+        return None
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-                check=False
-            )
+    # Build final list - only keep checked items
+    updated_dirs = []
+    deleted_paths = []
+    for scan_dir, _, display_path in rows:
+        path = scan_dir["path"]
+        is_checked = output.get(display_path, False)
+        if isinstance(is_checked, dict):
+            is_checked = is_checked.get("checked", False)
+
+        if is_checked:
+            updated_dirs.append({"path": path, "enabled": True})
+        else:
+            deleted_paths.append(path)
+
+    if deleted_paths:
+        logger.info(
+            "Directories deleted",
+            operation="show_directory_management",
+            trace_id=op_trace_id,
+            deleted_paths=deleted_paths
+        )
 
-            Path(config_path).unlink(missing_ok=True)
-
-            # Return code 3 = info button clicked (Add Folder)
-            if result.returncode == 3:
-                logger.debug(
-                    "Add Folder button clicked",
-                    operation="show_directory_management",
-                    trace_id=op_trace_id
-                )
-                # Show folder input dialog
-                new_folder = choose_folder_native("Select folder to add:")
-                if new_folder and Path(new_folder).expanduser().exists():
-                    # Convert to ~ format
-                    home = str(Path.home())
-                    if new_folder.startswith(home):
-                        new_folder = "~" + new_folder[len(home):]
-
-                    # Check if already in list
-                    existing_paths = {d["path"] for d in working_dirs}
-                    if new_folder not in existing_paths:
-                        working_dirs.append({"path": new_folder, "enabled": True})
-                        folders_added_this_session += 1
-                        logger.info(
-                            "Folder added via native picker",
-                            operation="show_directory_management",
-                            trace_id=op_trace_id,
-                            new_path=new_folder
-                        )
-                        # Return immediately with updated list (don't re-show dialog)
-                        return working_dirs
-                # User cancelled folder picker - return to main dialog
-                continue
-
-            # Return code 2 = Cancel
-            if result.returncode == 2:
-                logger.info(
-                    "Directory management cancelled",
-                    operation="show_directory_management",
-                    status="cancelled",
-                    trace_id=op_trace_id
-                )
-                return None
-
-            # Return code 0 or 5 = Save
-            if result.returncode not in (0, 5):
-                logger.error(
-                    "SwiftDialog failed",
-                    operation="show_directory_management",
-                    status="failed",
-                    trace_id=op_trace_id,
-                    return_code=result.returncode
-                )
-                return None
-
-            # Parse output
-            try:
-                output = json.loads(result.stdout) if result.stdout.strip() else {}
-            except json.JSONDecodeError:
-                return None
-
-            # Build final list - only keep checked items
-            updated_dirs = []
-            for scan_dir in working_dirs:
-                path = scan_dir["path"]
-                expanded = Path(path).expanduser()
-                display_path = str(expanded) if not path.startswith("~") else path
-
-                is_checked = output.get(display_path, False)
-                if isinstance(is_checked, dict):
-                    is_checked = is_checked.get("checked", False)
-
-                if is_checked:
-                    updated_dirs.append({"path": path, "enabled": True})
-                else:
-                    logger.info(
-                        "Directory deleted",
-                        operation="show_directory_management",
-                        trace_id=op_trace_id,
-                        deleted_path=path
-                    )
-
-            logger.info(
-                "Directory management complete",
+    # Append folders chosen in the add fields
+    known_paths = {d["path"] for d in working_dirs}
+    folders_added = 0
+    for title in add_field_titles:
+        new_folder = output.get(title)
+        if not isinstance(new_folder, str) or not new_folder.strip():
+            continue
+        new_folder = new_folder.strip().rstrip("/")
+        if not os.path.isdir(os.path.expanduser(new_folder)):
+            logger.warning(
+                "Ignoring added folder that does not exist",
                 operation="show_directory_management",
-                status="success",
                 trace_id=op_trace_id,
-                metrics={"total_dirs": len(updated_dirs), "added": folders_added_this_session}
+                new_path=new_folder
             )
+            continue
+
+        # Convert to ~ format
+        new_folder = _shorten_home(new_folder)
+        if new_folder in known_paths:
+            continue
+        known_paths.add(new_folder)
+        updated_dirs.append({"path": new_folder, "enabled": True})
+        folders_added += 1
+        logger.info(
+            "Folder added",
+            operation="show_directory_management",
+            trace_id=op_trace_id,
+            new_path=new_folder
+        )
 
-            return updated_dirs
-
-        except subprocess.TimeoutExpired:
-            logger.error(
-                "SwiftDialog timed out",
-                operation="show_directory_management",
-                status="timeout",
-                trace_id=op_trace_id
-            )
-            Path(config_path).unlink(missing_ok=True)
-            return None
+    logger.info(
+        "Directory management complete",
+        operation="show_directory_management",
+        status="success",
+        trace_id=op_trace_id,
+        metrics={"total_dirs": len(updated_dirs), "added": folders_added}
+    )
 
-        except (OSError, subprocess.SubprocessError) as e:
-            logger.error(
-                "SwiftDialog execution failed",
-                operation="show_directory_management",
-                status="exec_error",
-                trace_id=op_trace_id,
-                error=str(e)
-            )
-            Path(config_path).unlink(missing_ok=True)
-            return None
+    return updated_dirs
 
 
 async def show_directory_management(prefs: dict) -> dict | None:
@@ -311,19 +312,10 @@ async def show_directory_management(prefs: dict) -> dict | None:
 
     current_dirs = prefs.get("scan_directories", DEFAULT_SCAN_DIRECTORIES.copy())
 
-    # Run SwiftDialog in executor (non-blocking)
-    loop = asyncio.get_event_loop()
-    updated_dirs = await loop.run_in_executor(
-        None,
-        show_directory_management_swiftdialog,
-        current_dirs
-    )
+    updated_dirs = await show_directory_management_swiftdialog(current_dirs)
 
     if updated_dirs is None:
         return None
 
     # Update preferences with new directories
-    updated_prefs = prefs.copy()
-    updated_prefs["scan_directories"] = updated_dirs
-
-    return updated_prefs
+    return {**prefs, "scan_directories": updated_dirs}
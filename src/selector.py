@@ -62,6 +62,15 @@ async def show_auto_open_dialog(
         return "cancel"
 
 
+# Action buttons appended after the layout buttons, keyed by offset
+# from the first action button ("Cancel" follows them)
+SELECTOR_ACTIONS = {
+    0: "manage_directories",  # Scan Folders...
+    1: "manage_layouts",      # Manage Workspaces...
+    2: "run_wizard",          # Setup Wizard...
+}
+
+
 async def show_layout_selector(
     connection, layouts: list[dict], last_layout: str | None = None
 ) -> dict | None:
@@ -80,18 +89,18 @@ async def show_layout_selector(
     # Manage Layouts (to re-enable), Scan Folders, Setup Wizard buttons
 
     # Reorder layouts so last_layout is first (becomes default blue button)
-    ordered_layouts = list(layouts)
+    last = None
     if last_layout:
-        for i, layout in enumerate(ordered_layouts):
-            if layout["name"] == last_layout:
-                # Move to front
-                ordered_layouts.insert(0, ordered_layouts.pop(i))
-                logger.debug(
-                    "Reordered layouts, last used first",
-                    operation="show_layout_selector",
-                    last_layout=last_layout
-                )
-                break
+        last = next((layout for layout in layouts if layout["name"] == last_layout), None)
+    if last is not None:
+        ordered_layouts = [last] + [layout for layout in layouts if layout is not last]
+        logger.debug(
+            "Reordered layouts, last used first",
+            operation="show_layout_selector",
+            last_layout=last_layout
+        )
+    else:
+        ordered_layouts = list(layouts)
 
     # Build alert with layout buttons
     logger.debug(
@@ -115,11 +124,11 @@ async def show_layout_selector(
     # Add button for each layout (last used first as default)
     for layout in ordered_layouts:
         alert.add_button(layout["display"])
-        logger.debug(
-            "Added button to dialog",
-            operation="show_layout_selector",
-            layout_display=layout["display"]
-        )
+    logger.debug(
+        "Added layout buttons to dialog",
+        operation="show_layout_selector",
+        layout_displays=[layout["display"] for layout in ordered_layouts]
+    )
 
     # Add Scan Folders button (for directory management)
     alert.add_button("Scan Folders...")
@@ -162,54 +171,27 @@ async def show_layout_selector(
             button_index=button_index
         )
 
-        # Check if Scan Folders was clicked
-        if button_index == len(ordered_layouts):
+        # Layout buttons come first, then the action buttons in the order
+        # they were added above; anything past those is Cancel
+        layout_count = len(ordered_layouts)
+        if 0 <= button_index < layout_count:
+            selected = ordered_layouts[button_index]
             logger.debug(
-                "Scan Folders clicked",
+                "Layout selected",
                 operation="show_layout_selector",
-                status="scan_folders"
+                status="success",
+                layout_name=selected["name"]
             )
-            # Return special action dict
-            return {"action": "manage_directories"}
+            return selected
 
-        # Check if Manage Layouts was clicked
-        if button_index == len(ordered_layouts) + 1:
-            logger.debug(
-                "Manage Layouts clicked",
-                operation="show_layout_selector",
-                status="manage_layouts"
-            )
-            # Return special action dict
-            return {"action": "manage_layouts"}
-
-        # Check if Setup Wizard was clicked
-        if button_index == len(ordered_layouts) + 2:
-            logger.debug(
-                "Setup Wizard clicked",
-                operation="show_layout_selector",
-                status="wizard"
-            )
-            # Return special action dict
-            return {"action": "run_wizard"}
-
-        # Check if Cancel was clicked (last button)
-        if button_index > len(ordered_layouts) + 2:
-            logger.debug(
-                "Cancel clicked or invalid selection",
-                operation="show_layout_selector",
-                status="cancelled"
-            )
-            return None
-
-        selected = ordered_layouts[button_index]
+        action = SELECTOR_ACTIONS.get(button_index - layout_count)
         logger.debug(
-            "Layout selected",
+            "Selector action chosen" if action else "Cancel clicked or invalid selection",
             operation="show_layout_selector",
-            status="success",
-            layout_name=selected["name"]
+            status=action or "cancelled"
         )
-
-        return selected
+        # Return special action dict (None for Cancel)
+        return {"action": action} if action else None
 
     except (iterm2.RPCException, ValueError, TypeError) as e:
         logger.error(
@@ -253,8 +235,48 @@ def generate_acronym(slug: str) -> str:
 
     Example: feature-branch-name → fbn
     """
-    words = slug.split("-")
-    return "".join(word[0].lower() for word in words if word)
+    # Single pass: take the first character after each run of "-"
+    chars = []
+    take_next = True
+    for c in slug:
+        if c == "-":
+            take_next = True
+        elif take_next:
+            chars.append(c.lower())
+            take_next = False
+    return "".join(chars)
+
+
+def _match_sibling_dirs(parent_dir: str, pattern: str) -> list[str]:
+    """
+    Return paths of directories in parent_dir whose names match pattern.
+
+    Equivalent to glob.glob(os.path.join(parent_dir, pattern)) for
+    single-component patterns (hidden entries only match a leading "."),
+    but uses one os.scandir pass. Plain "<prefix>*" patterns (the derived
+    default) are matched with str.startswith instead of fnmatch.
+    """
+    if os.sep in pattern:
+        return glob.glob(os.path.join(parent_dir, pattern))
+
+    stem = pattern[:-1]
+    if pattern.endswith("*") and not any(c in stem for c in "*?["):
+        def matches(name: str) -> bool:
+            return name.startswith(stem)
+    else:
+        matches = re.compile(fnmatch.translate(pattern)).match
+
+    match_hidden = pattern.startswith(".")
+    try:
+        with os.scandir(parent_dir) as entries:
+            return [
+                entry.path for entry in entries
+                if (match_hidden or not entry.name.startswith("."))
+                and matches(entry.name)
+                and entry.is_dir()
+            ]
+    except OSError:
+        return []
 
 
 def discover_worktrees(config: dict) -> list[dict]:
@@ -285,10 +307,9 @@ def discover_worktrees(config: dict) -> list[dict]:
         root_name = os.path.basename(root)
         pattern = f"{root_name}.worktree-*"
 
-    # Build glob pattern in parent directory
+    # Match pattern against entries of the parent directory
     parent_dir = os.path.dirname(root)
-    glob_pattern = os.path.join(parent_dir, pattern)
-    candidates = glob.glob(glob_pattern)
+    candidates = _match_sibling_dirs(parent_dir, pattern)
 
     if not candidates:
         return []
@@ -315,13 +336,10 @@ def discover_worktrees(config: dict) -> list[dict]:
             return []
 
         # Parse valid worktree paths from output
-        valid_paths = set()
-        for line in result.stdout.strip().split("\n"):
-            if line:
-                # Format: /path/to/worktree  abc1234 [branch-name]
-                parts = line.split()
-                if parts:
-                    valid_paths.add(parts[0])
+        # Format: /path/to/worktree  abc1234 [branch-name]
+        valid_paths = {
+            line.partition(" ")[0] for line in result.stdout.splitlines() if line
+        }
     except subprocess.TimeoutExpired:
         logger.error(
             "Git worktree list timed out",
@@ -344,14 +362,14 @@ def discover_worktrees(config: dict) -> list[dict]:
     # Derive prefix for slug extraction (e.g., "my-project.worktree-")
     root_name = os.path.basename(root)
     prefix = f"{root_name}.worktree-"
+    # Use root basename for tab prefix (e.g., "MP" for my-project)
+    tab_prefix = generate_acronym(root_name).upper()
 
     tabs = []
     for path in sorted(candidates):
         if path in valid_paths:
             slug = extract_slug(path, prefix)
             acronym = generate_acronym(slug)
-            # Use root basename for tab prefix (e.g., "MP" for my-project)
-            tab_prefix = "".join(word[0].upper() for word in root_name.split("-") if word)
             tabs.append({"name": f"{tab_prefix}-{acronym}", "dir": path})
 
     return tabs
@@ -383,6 +401,28 @@ def get_enabled_scan_directories(prefs: dict) -> list[Path]:
     return enabled_dirs
 
 
+# Discovery caches, revalidated by directory mtime.
+# A directory's mtime changes only when entries are added/removed/renamed,
+# so unchanged scan dirs (and repos) skip the filesystem walk / git subprocess.
+# Both caches live in the persisted discovery cache (see preferences.py), so
+# they also carry over to the next launch.
+
+
+def _scan_cache_key(
+    scan_directories: list[Path], exclude_dirs: set[Path]
+) -> str | None:
+    """Build cache key from scan dir mtimes, or None if any dir can't be stat'ed."""
+    stamps = []
+    for base_dir in scan_directories:
+        try:
+            stamps.append([str(base_dir), base_dir.stat().st_mtime_ns])
+        except FileNotFoundError:
+            stamps.append([str(base_dir), None])
+        except OSError:
+            return None
+    return json.dumps([stamps, sorted(str(d) for d in exclude_dirs)])
+
+
 def discover_all_directories(
     scan_directories: list[Path] | None = None,
     exclude_dirs: set[Path] | None = None
@@ -406,6 +446,26 @@ def discover_all_directories(
     if exclude_dirs is None:
         exclude_dirs = set()
 
+    scan_cache = get_discovery_cache()["directory_scans"]
+    cache_key = _scan_cache_key(scan_directories, exclude_dirs)
+    cached = scan_cache.get(cache_key) if cache_key else None
+    # `git init` inside an existing folder (or deleting a repo's .git, or
+    # replacing it with a worktree .git file) doesn't touch the scan dir
+    # mtime, so re-check each cached entry's .git before trusting the entry
+    if cached is not None and (
+        any(os.path.lexists(os.path.join(f["dir"], ".git")) for f in cached["untracked"])
+        or not all(os.path.isdir(os.path.join(r["dir"], ".git")) for r in cached["repos"])
+    ):
+        cached = None
+    if cached is not None:
+        logger.debug(
+            "Directory discovery cache hit",
+            operation="discover_all_directories",
+            status="cached",
+            metrics={"repos_found": len(cached["repos"]), "untracked_found": len(cached["untracked"])}
+        )
+        return list(cached["repos"]), list(cached["untracked"])
+
     git_repos = []
     untracked = []
     op_trace_id = str(uuid4())
@@ -418,34 +478,61 @@ def discover_all_directories(
         discovery_dirs=[str(d) for d in scan_directories]
     )
 
+    # Stat each child's .git relative to an fd on the scan dir (fstatat)
+    # instead of resolving the full path from / for every child
+    use_dir_fd = os.stat in os.supports_dir_fd and os.scandir in os.supports_fd
+
     for base_dir in scan_directories:
-        if not base_dir.exists():
+        base_str = str(base_dir)
+        try:
+            dir_fd = os.open(base_str, os.O_RDONLY | os.O_DIRECTORY) if use_dir_fd else None
+        except FileNotFoundError:
             continue
 
-        for child in base_dir.iterdir():
-            if not child.is_dir():
-                continue
-            if child in exclude_dirs:
+        try:
+            # os.scandir entries carry the file type from readdir, so is_dir()
+            # needs no extra stat for regular dirs; one stat per child for .git
+            try:
+                entries = os.scandir(base_str if dir_fd is None else dir_fd)
+            except FileNotFoundError:
                 continue
-            # Skip hidden directories for untracked (but not for git repos)
-            is_hidden = child.name.startswith(".")
-
-            git_path = child / ".git"
-            if git_path.exists():
-                # Has .git - check if it's a repo (directory) or worktree (file)
-                if git_path.is_dir():
-                    # Real git repository
-                    git_repos.append({
-                        "name": child.name,
-                        "dir": str(child)
-                    })
-                # else: worktree (.git is file) - skip, discovered separately
-            elif not is_hidden:
-                # No .git and not hidden - untracked folder
-                untracked.append({
-                    "name": child.name,
-                    "dir": str(child)
-                })
+
+            with entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    # fd-based scandir yields bare names in entry.path
+                    entry_path = os.path.join(base_str, entry.name)
+                    if exclude_dirs and Path(entry_path) in exclude_dirs:
+                        continue
+
+                    try:
+                        if dir_fd is not None:
+                            git_mode = os.stat(f"{entry.name}/.git", dir_fd=dir_fd).st_mode
+                        else:
+                            git_mode = os.stat(os.path.join(entry_path, ".git")).st_mode
+                    except OSError:
+                        git_mode = None
+
+                    if git_mode is not None:
+                        # Has .git - check if it's a repo (directory) or worktree (file)
+                        if stat.S_ISDIR(git_mode):
+                            # Real git repository
+                            git_repos.append({
+                                "name": entry.name,
+                                "dir": entry_path
+                            })
+                        # else: worktree (.git is file) - skip, discovered separately
+                    elif not entry.name.startswith("."):
+                        # No .git and not hidden - untracked folder
+                        # (hidden directories are skipped for untracked, not for git repos)
+                        untracked.append({
+                            "name": entry.name,
+                            "dir": entry_path
+                        })
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
 
     duration_ms = int((time.perf_counter() - start_time) * 1000)
     logger.debug(
@@ -460,10 +547,16 @@ def discover_all_directories(
         }
     )
 
-    return (
-        sorted(git_repos, key=lambda x: x["name"]),
-        sorted(untracked, key=lambda x: x["name"])
-    )
+    git_repos = sorted(git_repos, key=lambda x: x["name"])
+    untracked = sorted(untracked, key=lambda x: x["name"])
+    if cache_key:
+        # Keep only the latest scan set (stale keys would never be hit again)
+        scan_cache.clear()
+        scan_cache[cache_key] = {"repos": git_repos, "untracked": untracked}
+        mark_discovery_cache_dirty()
+        save_discovery_cache()
+
+    return list(git_repos), list(untracked)
 
 
 def discover_git_repos(
@@ -512,7 +605,9 @@ def _discover_worktrees_for_repo(repo: dict) -> list[dict]:
     """
     Discover worktrees for a single git repository.
 
-    Internal helper for parallel execution.
+    Internal helper for parallel execution. Not cached: `git switch` in a
+    linked worktree only touches .git/worktrees/<id>/, so a stamp would need
+    about as many syscalls as re-reading the metadata.
 
     Args:
         repo: Dict with "name" and "dir" keys
@@ -524,6 +619,83 @@ def _discover_worktrees_for_repo(repo: dict) -> list[dict]:
     if not repo_path.exists():
         return []
 
+    worktrees = _read_repo_worktrees(repo, repo_path)
+    if worktrees is None:
+        worktrees = _list_repo_worktrees(repo, repo_path)
+    return worktrees or []
+
+
+def _read_repo_worktrees(repo: dict, repo_path: Path) -> list[dict] | None:
+    """
+    Read linked worktrees straight from .git/worktrees/<id>/ metadata.
+
+    Avoids a git subprocess per repo. Produces the same dicts as the
+    porcelain parser in _list_repo_worktrees: branch name from HEAD, or the
+    directory name for detached HEADs; entries whose directory is gone
+    (git's "prunable") are skipped.
+
+    Returns:
+        List of worktree dicts, or None if the metadata is unreadable and
+        the caller should fall back to `git worktree list`
+    """
+    worktrees_dir = os.path.join(repo_path, ".git", "worktrees")
+    try:
+        entries = sorted(os.scandir(worktrees_dir), key=lambda e: e.name)
+    except FileNotFoundError:
+        return []  # No linked worktrees
+    except OSError:
+        return None
+
+    abbrev = repo["name"][:2].upper()
+    worktrees = []
+    for entry in entries:
+        if not entry.is_dir():
+            continue
+        try:
+            with open(os.path.join(entry.path, "gitdir")) as f:
+                gitdir = f.read().strip()
+            with open(os.path.join(entry.path, "HEAD")) as f:
+                head = f.read().strip()
+        except FileNotFoundError:
+            continue  # Missing gitdir: git reports this worktree as prunable
+        except OSError:
+            return None
+
+        # gitdir points at <worktree>/.git (relative to this entry if
+        # worktree.useRelativePaths is set)
+        if not os.path.isabs(gitdir):
+            gitdir = os.path.normpath(os.path.join(entry.path, gitdir))
+        wt_dir = os.path.dirname(gitdir)
+        if not os.path.exists(gitdir):
+            continue  # Prunable: worktree directory was removed
+
+        if head.startswith("ref: "):
+            branch = head.split("/")[-1]
+            worktrees.append({
+                "dir": wt_dir,
+                "parent": repo["name"],
+                "name": f"{abbrev}.wt-{branch}",
+            })
+        else:
+            worktrees.append({
+                "dir": wt_dir,
+                "parent": repo["name"],
+                "name": f"{abbrev}.wt-{os.path.basename(wt_dir)}",
+                "detached": True,
+            })
+
+    return worktrees
+
+
+def _list_repo_worktrees(repo: dict, repo_path: Path) -> list[dict] | None:
+    """
+    Run `git worktree list --porcelain` for a repo and parse the output.
+
+    Fallback for _read_repo_worktrees when .git/worktrees can't be read.
+
+    Returns:
+        List of worktree dicts, or None if git failed
+    """
     try:
         result = subprocess.run(
             ["git", "worktree", "list", "--porcelain"],
@@ -531,12 +703,13 @@ def _discover_worktrees_for_repo(repo: dict) -> list[dict]:
             capture_output=True,
             text=True,
             check=True,
-            timeout=5  # Reduced timeout for parallel execution
+            timeout=3  # Short timeout: repos are scanned concurrently
         )
 
         worktrees = []
         current_worktree = {}
         is_prunable = False
+        is_main_worktree = True
 
         for line in result.stdout.split("\n"):
             if line.startswith("worktree "):
@@ -545,15 +718,14 @@ def _discover_worktrees_for_repo(repo: dict) -> list[dict]:
                 current_worktree = {}
                 is_prunable = False
 
-                wt_path = Path(line[9:])
-                if wt_path.resolve() == repo_path.resolve():
-                    current_worktree = {}
-                    continue
-                if not wt_path.is_dir():
-                    current_worktree = {}
+                # git always lists the main worktree (the repo itself) first,
+                # so skip it by position instead of resolving and comparing paths.
+                # Missing linked worktree dirs are reported as "prunable" below.
+                if is_main_worktree:
+                    is_main_worktree = False
                     continue
                 current_worktree = {
-                    "dir": str(wt_path),
+                    "dir": line[9:],
                     "parent": repo["name"]
                 }
             elif line.startswith("branch "):
@@ -575,8 +747,15 @@ def _discover_worktrees_for_repo(repo: dict) -> list[dict]:
 
         return worktrees
 
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-        return []
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+        logger.debug(
+            "git worktree list failed for repo",
+            operation="discover_all_worktrees",
+            repo=repo["name"],
+            error=str(e),
+            error_type=type(e).__name__
+        )
+        return None
 
 
 def discover_all_worktrees(git_repos: list[dict]) -> list[dict]:
@@ -595,7 +774,6 @@ def discover_all_worktrees(git_repos: list[dict]) -> list[dict]:
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
     start_time = time.perf_counter()
-    discovered = []
     op_trace_id = str(uuid4())
 
     logger.debug(
@@ -610,31 +788,38 @@ def discover_all_worktrees(git_repos: list[dict]) -> list[dict]:
     # Use max 16 workers to avoid overwhelming the system
     max_workers = min(16, len(git_repos)) if git_repos else 1
 
+    # Results are slotted by repo index so output order matches git_repos
+    # (stable across runs) regardless of which subprocess finishes first
+    per_repo: list[list[dict]] = [[] for _ in git_repos]
+
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(_discover_worktrees_for_repo, repo): repo for repo in git_repos}
+        futures = {
+            executor.submit(_discover_worktrees_for_repo, repo): idx
+            for idx, repo in enumerate(git_repos)
+        }
 
         for future in as_completed(futures):
+            idx = futures[future]
             try:
-                worktrees = future.result()
-                discovered.extend(worktrees)
+                per_repo[idx] = future.result()
             except (OSError, subprocess.SubprocessError, ValueError) as e:
-                repo = futures[future]
                 logger.warning(
                     "Failed to discover worktrees",
                     operation="discover_all_worktrees",
                     trace_id=op_trace_id,
-                    repo=repo["name"],
+                    repo=git_repos[idx]["name"],
                     error=str(e)
                 )
 
+    discovered = [wt for worktrees in per_repo for wt in worktrees]
+
     # Deduplicate by directory path (same worktree can be found from multiple repos)
-    seen_dirs = set()
-    unique_worktrees = []
+    # Worktree paths are absolute, so compare strings without resolve();
+    # setdefault keeps the first-seen entry (dicts preserve insertion order)
+    unique_by_dir: dict[str, dict] = {}
     for wt in discovered:
-        wt_dir = Path(wt["dir"]).resolve()
-        if wt_dir not in seen_dirs:
-            seen_dirs.add(wt_dir)
-            unique_worktrees.append(wt)
+        unique_by_dir.setdefault(wt["dir"], wt)
+    unique_worktrees = list(unique_by_dir.values())
 
     duration_ms = int((time.perf_counter() - start_time) * 1000)
     logger.debug(
@@ -651,3 +836,25 @@ def discover_all_worktrees(git_repos: list[dict]) -> list[dict]:
 
     return unique_worktrees
 
+
+def discover_scan_tree(
+    scan_directories: list[Path] | None = None,
+    exclude_dirs: set[Path] | None = None
+) -> tuple[list[dict], list[dict], list[dict]]:
+    """
+    Discover git repos, their worktrees, and untracked folders in one call.
+
+    Runs the single-pass directory scan, then worktree discovery over the
+    repos it found, so callers can hand the whole discovery to one worker
+    thread instead of scanning and then listing worktrees separately.
+
+    Args:
+        scan_directories: List of directories to scan (from preferences)
+        exclude_dirs: Set of paths to exclude (optional)
+
+    Returns:
+        Tuple of (git_repos, worktrees, untracked_folders)
+    """
+    git_repos, untracked = discover_all_directories(scan_directories, exclude_dirs)
+    return git_repos, discover_all_worktrees(git_repos), untracked
+
@@ -6,6 +6,51 @@
 # Setup Wizard
 # =============================================================================
 
+# Entry names per config directory, listed once per launch (None = directory
+# missing). needs_migration() and is_first_run() run back-to-back at startup
+# and share these listings instead of globbing the same directories again.
+_config_dir_names: dict[Path, list[str] | None] = {}
+
+
+def _list_config_dir(directory: Path) -> list[str] | None:
+    """
+    List entry names in a config directory, cached for the session.
+
+    Returns:
+        Sorted entry names, or None if the directory doesn't exist
+    """
+    if directory not in _config_dir_names:
+        try:
+            with os.scandir(directory) as entries:
+                _config_dir_names[directory] = sorted(entry.name for entry in entries)
+        except (FileNotFoundError, NotADirectoryError):
+            _config_dir_names[directory] = None
+    return _config_dir_names[directory]
+
+
+# Whether PATHS.config_dir has been created this session
+_config_dir_ready = False
+
+
+def _ensure_config_dir() -> None:
+    """Create the config directory once per session."""
+    global _config_dir_ready
+    if not _config_dir_ready:
+        PATHS.config_dir.mkdir(parents=True, exist_ok=True)
+        _config_dir_ready = True
+
+
+# Config file name matchers, compiled once from the glob patterns: a single
+# regex match per name instead of fnmatch's per-call normcase + cache lookup
+_is_workspace_name = re.compile(fnmatch.translate(WORKSPACE_PATTERN)).match
+_is_legacy_layout_name = re.compile(fnmatch.translate(LEGACY_LAYOUT_PATTERN)).match
+
+
+def _config_files_matching(directory: Path, is_match: Callable) -> list[Path]:
+    """Return paths in directory whose names satisfy is_match (cached listing)."""
+    names = _list_config_dir(directory) or []
+    return [directory / name for name in names if is_match(name)]
+
 
 def needs_migration() -> bool:
     """
@@ -19,32 +64,45 @@ def needs_migration() -> bool:
         True if migration should be offered
     """
     # Check if legacy config exists
-    if not LEGACY_CONFIG_DIR.exists():
+    legacy_names = _list_config_dir(PATHS.legacy_config_dir)
+    if legacy_names is None:
         return False
 
     # Check if legacy has layout files
-    legacy_layouts = list(LEGACY_CONFIG_DIR.glob(LEGACY_LAYOUT_PATTERN))
-    legacy_prefs = LEGACY_PREFERENCES_PATH.exists()
+    legacy_layouts = _config_files_matching(PATHS.legacy_config_dir, _is_legacy_layout_name)
+    legacy_prefs = PATHS.legacy_preferences.name in legacy_names
 
     if not legacy_layouts and not legacy_prefs:
         return False
 
-    # Check if new config already has workspace files
-    if CONFIG_DIR.exists():
-        new_workspaces = list(CONFIG_DIR.glob(WORKSPACE_PATTERN))
-        if new_workspaces:
-            return False  # Already migrated or new config exists
+    # Check if new config already has workspace files (stop at the first match;
+    # no Path objects built)
+    config_names = _list_config_dir(PATHS.config_dir) or []
+    if any(_is_workspace_name(name) for name in config_names):
+        return False  # Already migrated or new config exists
 
     logger.debug(
         "Migration needed from legacy config",
         operation="needs_migration",
-        legacy_dir=str(LEGACY_CONFIG_DIR),
+        legacy_dir=str(PATHS.legacy_config_dir),
         legacy_layouts=len(legacy_layouts),
         legacy_prefs=legacy_prefs
     )
     return True
 
 
+def _copy_config_file(src: Path, dst: Path) -> None:
+    """
+    Copy a config file, keeping its timestamps.
+
+    Lighter than shutil.copy2: TOML configs need their contents and mtime,
+    not the mode/flags/xattr copying that copystat adds per file.
+    """
+    shutil.copyfile(src, dst)
+    st = os.stat(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
 def migrate_config_files() -> tuple[int, int]:
     """
     Migrate files from legacy to new config directory.
@@ -56,22 +114,21 @@ def migrate_config_files() -> tuple[int, int]:
     Returns:
         Tuple of (layouts_migrated, prefs_migrated)
     """
-    import shutil
-
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_config_dir()
 
     layouts_migrated = 0
     prefs_migrated = 0
 
     # Migrate layout files
-    for legacy_path in LEGACY_CONFIG_DIR.glob(LEGACY_LAYOUT_PATTERN):
-        # layout-foo.toml -> workspace-foo.toml
+    for legacy_path in _config_files_matching(PATHS.legacy_config_dir, _is_legacy_layout_name):
+        # layout-foo.toml -> workspace-foo.toml (swap the prefix only;
+        # str.replace would also rewrite "layout-" inside the name)
         old_name = legacy_path.name
-        new_name = old_name.replace("layout-", "workspace-")
-        new_path = CONFIG_DIR / new_name
+        new_name = "workspace-" + old_name[len("layout-"):]
+        new_path = PATHS.config_dir / new_name
 
-        if not new_path.exists():
-            shutil.copy2(legacy_path, new_path)
+        if not os.path.lexists(new_path):
+            _copy_config_file(legacy_path, new_path)
             layouts_migrated += 1
             logger.info(
                 "Migrated layout file",
@@ -81,16 +138,19 @@ def migrate_config_files() -> tuple[int, int]:
             )
 
     # Migrate preferences
-    if LEGACY_PREFERENCES_PATH.exists() and not PREFERENCES_PATH.exists():
-        shutil.copy2(LEGACY_PREFERENCES_PATH, PREFERENCES_PATH)
+    if PATHS.legacy_preferences.exists() and not PATHS.preferences.exists():
+        _copy_config_file(PATHS.legacy_preferences, PATHS.preferences)
         prefs_migrated = 1
         logger.info(
             "Migrated preferences file",
             operation="migrate_config_files",
-            old_path=str(LEGACY_PREFERENCES_PATH),
-            new_path=str(PREFERENCES_PATH)
+            old_path=str(PATHS.legacy_preferences),
+            new_path=str(PATHS.preferences)
         )
 
+    # New config dir contents changed: drop its cached listing
+    _config_dir_names.pop(PATHS.config_dir, None)
+
     return layouts_migrated, prefs_migrated
 
 
@@ -106,14 +166,14 @@ async def run_migration_wizard(connection, window) -> bool:
         True if migration completed, False if skipped/cancelled
     """
     # Count legacy files
-    legacy_layouts = list(LEGACY_CONFIG_DIR.glob(LEGACY_LAYOUT_PATTERN))
+    legacy_layouts = _config_files_matching(PATHS.legacy_config_dir, _is_legacy_layout_name)
 
     migrate_alert = iterm2.Alert(
         "Migrate Configuration?",
         f"Found {len(legacy_layouts)} workspace(s) in legacy location:\n"
-        f"  {LEGACY_CONFIG_DIR}\n\n"
+        f"  {PATHS.legacy_config_dir}\n\n"
         f"Migrate to new location?\n"
-        f"  {CONFIG_DIR}\n\n"
+        f"  {PATHS.config_dir}\n\n"
         "Your original files will be kept as backup.",
         window_id=window.window_id
     )
@@ -136,7 +196,7 @@ async def run_migration_wizard(connection, window) -> bool:
         "Migration Complete",
         f"Migrated {layouts_migrated} workspace(s) and "
         f"{prefs_migrated} preference file(s).\n\n"
-        f"New location: {CONFIG_DIR}\n\n"
+        f"New location: {PATHS.config_dir}\n\n"
         "Original files kept in legacy location.",
         window_id=window.window_id
     )
@@ -159,37 +219,50 @@ def is_first_run() -> bool:
     Detect if this is the first run for a new user.
 
     Returns True if:
-    - No workspace-*.toml files exist in CONFIG_DIR
+    - No workspace-*.toml files exist in PATHS.config_dir
     - No legacy layout.toml exists
     - No preferences.toml exists
 
     Returns:
         True if this appears to be a first-time run
     """
-    # Check for any layout files
-    layout_files = list(CONFIG_DIR.glob(WORKSPACE_PATTERN))
-    if layout_files:
-        return False
-
-    # Check for legacy layout.toml
-    legacy_layout = CONFIG_DIR / "layout.toml"
-    if legacy_layout.exists():
-        return False
-
-    # Check for preferences (indicates previous use)
-    if PREFERENCES_PATH.exists():
-        return False
+    # One pass over the (cached) listing, stopping at the first file that
+    # indicates previous use: a workspace file, legacy layout.toml, or
+    # preferences.toml
+    markers = {"layout.toml", PATHS.preferences.name}
+    for name in _list_config_dir(PATHS.config_dir) or []:
+        if name in markers or _is_workspace_name(name):
+            return False
 
     logger.debug(
         "First-run detected",
         operation="is_first_run",
-        config_dir=str(CONFIG_DIR),
+        config_dir=str(PATHS.config_dir),
         layout_files_count=0
     )
     return True
 
 
-def generate_default_layout_content(home_dir: bool = True, project_dir: str | None = None) -> str:
+# Invariant parts of the generated layout file (blocks are joined by a
+# blank line in generate_default_layout_content)
+_DEFAULT_LAYOUT_HEADER = (
+    b"# Workspace Launcher Configuration\n"
+    b"# Auto-generated by first-run wizard\n"
+    b"# Edit this file to customize your workspace tabs\n"
+    b"\n"
+    b"[layout]\n"
+    b"left_pane_ratio = 0.25\n"
+    b"settle_time = 0.3\n"
+    b"\n"
+    b"[commands]\n"
+    b"# Safe defaults - customize after verifying tool availability\n"
+    b'left = "ls -la"    # Try: br --sort-by-type-dirs-first (requires broot)\n'
+    b'right = "zsh"      # Try: css (requires Claude Code)\n'
+)
+_DEFAULT_HOME_TAB = b'[[tabs]]\nname = "home"\ndir = "~"\n'
+
+
+def generate_default_layout_content(home_dir: bool = True, project_dir: str | None = None) -> bytes:
     """
     Generate default layout TOML content.
 
@@ -198,47 +271,20 @@ def generate_default_layout_content(home_dir: bool = True, project_dir: str | No
         project_dir: Optional project directory to include
 
     Returns:
-        TOML content string
+        TOML content as UTF-8 bytes (written as-is by atomic_write_file)
     """
-    lines = [
-        "# Workspace Launcher Configuration",
-        "# Auto-generated by first-run wizard",
-        "# Edit this file to customize your workspace tabs",
-        "",
-        "[layout]",
-        "left_pane_ratio = 0.25",
-        "settle_time = 0.3",
-        "",
-        "[commands]",
-        "# Safe defaults - customize after verifying tool availability",
-        'left = "ls -la"    # Try: br --sort-by-type-dirs-first (requires broot)',
-        'right = "zsh"      # Try: css (requires Claude Code)',
-        "",
-    ]
+    blocks = [_DEFAULT_LAYOUT_HEADER]
 
     if home_dir:
-        lines.extend([
-            "[[tabs]]",
-            'name = "home"',
-            'dir = "~"',
-            "",
-        ])
+        blocks.append(_DEFAULT_HOME_TAB)
 
     if project_dir:
         # Convert to ~ format if in home directory
-        home = str(Path.home())
-        if project_dir.startswith(home):
-            project_dir = "~" + project_dir[len(home):]
-
+        project_dir = _shorten_home(project_dir)
         project_name = Path(project_dir).name
-        lines.extend([
-            "[[tabs]]",
-            f'name = "{project_name}"',
-            f'dir = "{project_dir}"',
-            "",
-        ])
+        blocks.append(f'[[tabs]]\nname = "{project_name}"\ndir = "{project_dir}"\n'.encode())
 
-    return "\n".join(lines)
+    return b"\n".join(blocks)
 
 
 async def run_first_run_wizard(connection, window) -> bool:
@@ -316,14 +362,14 @@ async def run_first_run_wizard(connection, window) -> bool:
             )
 
     # Step 3: Create config file
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_config_dir()
 
     layout_content = generate_default_layout_content(
         home_dir=True,
         project_dir=project_dir
     )
 
-    layout_path = CONFIG_DIR / "workspace-default.toml"
+    layout_path = PATHS.config_dir / "workspace-default.toml"
 
     try:
         atomic_write_file(layout_path, layout_content)
@@ -435,14 +481,14 @@ async def run_setup_wizard_for_veteran(connection, window) -> bool:
         project_dir = choose_folder_native("Select your project folder:")
 
     # Step 3: Create config file
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_config_dir()
 
     layout_content = generate_default_layout_content(
         home_dir=True,
         project_dir=project_dir
     )
 
-    layout_path = CONFIG_DIR / "workspace-wizard.toml"
+    layout_path = PATHS.config_dir / "workspace-wizard.toml"
 
     try:
         atomic_write_file(layout_path, layout_content)
@@ -23,27 +23,49 @@ CATEGORY_ICONS = {
     "header_untracked": "SF=questionmark.folder,colour=gray,scale=large",
 }
 
-# Cached SwiftDialog path (None = not checked yet, False = not found)
-_swiftdialog_path_cache: str | None | bool = None
+# Home directory as a string, resolved once (used to shorten paths to ~)
+_HOME_STR = str(Path.home())
 
 
+def _shorten_home(path: str) -> str:
+    """Replace a leading home directory with ~ (prefix check, no full scan)."""
+    if path.startswith(_HOME_STR) and (
+        len(path) == len(_HOME_STR) or path[len(_HOME_STR)] == "/"
+    ):
+        return "~" + path[len(_HOME_STR):]
+    return path
+
+
+def _remember_swiftdialog_path(path: str) -> None:
+    """Persist the SwiftDialog path for the next launch."""
+    disk_cache = get_discovery_cache()
+    if disk_cache.get("swiftdialog_path") != path:
+        disk_cache["swiftdialog_path"] = path
+        mark_discovery_cache_dirty()
+        save_discovery_cache()
+
+
+@lru_cache(maxsize=1)
 def find_swiftdialog_path() -> str | None:
     """
     Find SwiftDialog binary across Intel and Apple Silicon Homebrew paths.
 
-    Search order:
+    Search order (after the path persisted by a previous launch):
     1. /opt/homebrew/bin/dialog (Apple Silicon Homebrew)
     2. /usr/local/bin/dialog (Intel Homebrew)
     3. shutil.which("dialog") (fallback to PATH)
 
+    The result is cached for the session (find_swiftdialog_path.cache_clear()
+    forces a fresh search).
+
     Returns:
         Path to SwiftDialog binary, or None if not found
     """
-    global _swiftdialog_path_cache
-
-    # Return cached result if already checked
-    if _swiftdialog_path_cache is not None:
-        return _swiftdialog_path_cache if _swiftdialog_path_cache else None
+    # Path found by a previous launch: one exists() check instead of a search
+    disk_cache = get_discovery_cache()
+    cached_path = disk_cache.get("swiftdialog_path")
+    if cached_path and os.path.exists(cached_path):
+        return cached_path
 
     # Search paths in order of preference
     search_paths = [
@@ -52,8 +74,8 @@ def find_swiftdialog_path() -> str | None:
     ]
 
     for path in search_paths:
-        if Path(path).exists():
-            _swiftdialog_path_cache = path
+        if os.path.exists(path):
+            _remember_swiftdialog_path(path)
             logger.debug(
                 "Found SwiftDialog",
                 path=path,
@@ -64,7 +86,7 @@ def find_swiftdialog_path() -> str | None:
     # Fallback to PATH lookup
     path_result = shutil.which("dialog")
     if path_result:
-        _swiftdialog_path_cache = path_result
+        _remember_swiftdialog_path(path_result)
         logger.debug(
             "Found SwiftDialog via PATH",
             path=path_result,
@@ -73,7 +95,6 @@ def find_swiftdialog_path() -> str | None:
         return path_result
 
     # Not found
-    _swiftdialog_path_cache = False
     logger.debug(
         "SwiftDialog not found",
         searched=search_paths,
@@ -91,10 +112,35 @@ def is_homebrew_available() -> bool:
     """
     Check if Homebrew is installed and available.
 
+    PATH lookup is cached for the session (Homebrew's install state doesn't
+    change mid-session).
+
     Returns:
         True if brew command is available in PATH
     """
-    return shutil.which("brew") is not None
+    return _which_cached("brew") is not None
+
+
+def swiftdialog_command(swiftdialog_bin: str, config: dict) -> list[str]:
+    """
+    Build the SwiftDialog argv for a config passed inline via --jsonstring.
+
+    The config is serialized compactly (no spaces after separators): the
+    text is only parsed by SwiftDialog, and large select/checkbox lists
+    shrink noticeably.
+
+    Args:
+        swiftdialog_bin: Path from find_swiftdialog_path()
+        config: Dialog configuration dict
+
+    Returns:
+        Command list for subprocess
+    """
+    return [
+        swiftdialog_bin,
+        "--jsonstring", json.dumps(config, separators=(",", ":")),
+        "--json",
+    ]
 
 
 def run_swiftdialog(config: dict) -> tuple[int, dict | None]:
@@ -102,7 +148,7 @@ def run_swiftdialog(config: dict) -> tuple[int, dict | None]:
     Run SwiftDialog with given configuration.
 
     Args:
-        config: Dialog configuration dict (will be written as JSON)
+        config: Dialog configuration dict (passed as JSON via --jsonstring)
 
     Returns:
         Tuple of (return_code, parsed_output_dict or None)
@@ -118,44 +164,28 @@ def run_swiftdialog(config: dict) -> tuple[int, dict | None]:
         logger.error("SwiftDialog not available", operation="run_swiftdialog")
         return (-1, None)
 
-    config_path = None
-    # Write config to temp file
+    # Pass config inline via --jsonstring (no temp file to create/clean up)
     try:
-        with tempfile.NamedTemporaryFile(
-            mode='w', suffix='.json', delete=False
-        ) as f:
-            json.dump(config, f)
-            config_path = f.name
-
-        # Run SwiftDialog
-        cmd = [swiftdialog_bin, "--jsonfile", config_path, "--json"]
+        cmd = swiftdialog_command(swiftdialog_bin, config)
         logger.debug(
             "Running SwiftDialog",
-            config_path=config_path,
             operation="run_swiftdialog"
         )
 
+        # stdout stays bytes: json.loads decodes UTF-8 itself.
+        # close_fds=False: Python's own fds are non-inheritable (PEP 446), so
+        # there is nothing to close and the spawn can take the posix_spawn path
+        # instead of looping close() up to the fd limit (same for the other
+        # SwiftDialog/osascript spawns)
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=600,  # 10 min timeout
-            check=False
+            check=False,
+            close_fds=False
         )
 
-        # Parse JSON output if available
-        output_dict = None
-        if result.stdout.strip():
-            try:
-                output_dict = json.loads(result.stdout)
-            except json.JSONDecodeError:
-                logger.warning(
-                    "Could not parse SwiftDialog output",
-                    stdout=result.stdout[:200],
-                    operation="run_swiftdialog"
-                )
-
-        return (result.returncode, output_dict)
+        return (result.returncode, _parse_swiftdialog_output(result.stdout, "run_swiftdialog"))
 
     except subprocess.TimeoutExpired:
         logger.error("SwiftDialog timed out", operation="run_swiftdialog")
@@ -167,18 +197,74 @@ def run_swiftdialog(config: dict) -> tuple[int, dict | None]:
             operation="run_swiftdialog"
         )
         return (-1, None)
-    finally:
-        # Clean up temp file
-        if config_path:
-            try:
-                Path(config_path).unlink(missing_ok=True)
-            except OSError as e:
-                logger.debug(
-                    "Could not delete temp config file",
-                    path=config_path,
-                    error=str(e),
-                    operation="run_swiftdialog"
-                )
+
+
+async def run_swiftdialog_async(config: dict, timeout: float = 600) -> tuple[int, dict | None]:
+    """
+    Run SwiftDialog without blocking the event loop.
+
+    Async counterpart of run_swiftdialog: awaits the dialog process via
+    asyncio.create_subprocess_exec instead of holding an executor thread
+    for the dialog's lifetime.
+
+    Args:
+        config: Dialog configuration dict (passed as JSON via --jsonstring)
+        timeout: Seconds before the dialog is killed (default 10 min)
+
+    Returns:
+        Tuple of (return_code, parsed_output_dict or None), with the same
+        return codes as run_swiftdialog
+    """
+    swiftdialog_bin = find_swiftdialog_path()
+    if not swiftdialog_bin:
+        logger.error("SwiftDialog not available", operation="run_swiftdialog_async")
+        return (-1, None)
+
+    cmd = swiftdialog_command(swiftdialog_bin, config)
+    logger.debug(
+        "Running SwiftDialog",
+        operation="run_swiftdialog_async"
+    )
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False
+        )
+    except OSError as e:
+        logger.error(
+            "SwiftDialog OS error",
+            error=str(e),
+            operation="run_swiftdialog_async"
+        )
+        return (-1, None)
+
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except TimeoutError:
+        proc.kill()
+        await proc.wait()
+        logger.error("SwiftDialog timed out", operation="run_swiftdialog_async")
+        return (4, None)
+
+    return (proc.returncode, _parse_swiftdialog_output(stdout, "run_swiftdialog_async"))
+
+
+def _parse_swiftdialog_output(stdout: bytes, operation: str) -> dict | None:
+    """Parse SwiftDialog's raw --json output, or None if empty/invalid."""
+    if not stdout or stdout.isspace():
+        return None
+    try:
+        return json.loads(stdout)
+    except ValueError:  # JSONDecodeError or invalid UTF-8
+        logger.warning(
+            "Could not parse SwiftDialog output",
+            stdout=stdout[:200].decode(errors="replace"),
+            operation=operation
+        )
+        return None
 
 
 def format_tab_label(path: str, name: str, wrap_threshold: int = 50) -> str:
@@ -200,7 +286,7 @@ def format_tab_label(path: str, name: str, wrap_threshold: int = 50) -> str:
         Formatted label string: "shorthand (path)" or "shorthand\\n(path)" if long
     """
     # Replace home directory with ~
-    path_display = path.replace(str(Path.home()), "~")
+    path_display = _shorten_home(path)
 
     # Wrap long paths to second line to avoid clipping
     if len(path_display) > wrap_threshold:
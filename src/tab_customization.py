@@ -17,9 +17,26 @@
 HEADER_L1_WIDTH = 40
 HEADER_L2_WIDTH = 34
 
-
+# Static part of the checkbox dialog configs (category selector, tab
+# customization) - built once, merged into each dialog's per-call fields
+_CATEGORY_DIALOG_BASE = {
+    "titlefont": "size=18",
+    "messagefont": "size=14",
+    "appearance": "dark",  # Force dark mode for consistent toggle colors
+    "hideicon": True,
+    "checkboxstyle": {
+        "style": "switch",
+        "size": "regular"
+    },
+    "moveable": True,
+    "ontop": True,
+    "json": True
+}
+
+
+@lru_cache(maxsize=256)
 def _make_header_label(text: str, char: str, target_width: int = HEADER_L1_WIDTH) -> str:
-    """Create a centered header label with dynamic padding.
+    """Create a centered header label with dynamic padding (memoized).
 
     Args:
         text: The header text (e.g., "LAYOUT TABS", "EON/ (34)")
@@ -38,8 +55,28 @@ def _make_header_label(text: str, char: str, target_width: int = HEADER_L1_WIDTH
     return char * left_pad + content + char * right_pad
 
 
+@lru_cache(maxsize=256)
+def _make_group_sub_header(parent_name: str, count: int) -> str:
+    """Level 2 sub-header for a parent directory group (memoized across redraws)."""
+    # Use 🗂️ emoji on both sides + double-line ═ for Level 2 (6 chars shorter than L1)
+    return f"🗂️ {_make_header_label(f'{parent_name}/ ({count})', '═', HEADER_L2_WIDTH)} 🗂️"
+
+
+# Level 1 category headers for the tab customization dialog (constant text,
+# built once at import): 📌 emoji on both sides + block characters (▓)
+_HEADER_LAYOUT = f"📌 {_make_header_label('LAYOUT TABS', '▓')} 📌"
+_HEADER_WORKTREE = f"📌 {_make_header_label('GIT WORKTREES', '▓')} 📌"
+_HEADER_REPO = f"📌 {_make_header_label('ADDITIONAL REPOS', '▓')} 📌"
+_HEADER_UNTRACKED = f"📌 {_make_header_label('UNTRACKED FOLDERS', '▓')} 📌"
+
+
+@lru_cache(maxsize=4)
 def _get_max_dialog_height(screen_percent: float = 0.90, fallback: int = 900) -> int:
-    """Get maximum dialog height as a percentage of screen height."""
+    """Get maximum dialog height as a percentage of screen height.
+
+    Cached for the session: the main screen's height doesn't change between
+    dialogs, and each NSScreen query crosses the PyObjC bridge.
+    """
     try:
         screen = NSScreen.mainScreen()
         if screen:
@@ -54,12 +91,21 @@ def _is_tab_selected(
     category: str,
     remembered_selections: set[str] | None,
     custom_tab_names: dict[str, str] | None = None,
+    name: str | None = None,
+    path: str | None = None,
 ) -> bool:
-    """Determine if a tab should be pre-checked based on remembered selections."""
+    """Determine if a tab should be pre-checked based on remembered selections.
+
+    Callers that already resolved the tab's display name / dir pass them as
+    name / path to skip resolving them again.
+    """
     if remembered_selections is None:
         return category in ("layout", "worktree")
-    name = get_tab_display_name(tab, custom_tab_names)
-    return name in remembered_selections or get_tab_dir(tab) in remembered_selections
+    if name is None:
+        name = get_tab_display_name(tab, custom_tab_names)
+    if path is None:
+        path = get_tab_dir(tab)
+    return name in remembered_selections or path in remembered_selections
 
 
 def _build_category_checkboxes(
@@ -92,7 +138,9 @@ def _build_category_checkboxes(
         # Skip .exists() check and icons for individual items - faster rendering
         checkboxes.append({
             "label": label,
-            "checked": _is_tab_selected(tab, category_key, remembered_selections, custom_tab_names),
+            "checked": _is_tab_selected(
+                tab, category_key, remembered_selections, name=name, path=path
+            ),
         })
         all_items.append({"label": label, "tab": tab, "category": category_key})
 
@@ -122,28 +170,29 @@ def _build_grouped_category_checkboxes(
     # Group items by parent directory
     groups: dict[str, list[dict]] = {}
     for tab in items:
-        path = get_tab_dir(tab)
-        expanded = Path(path).expanduser()
         # Use full parent path for grouping key to handle same-name dirs
-        parent_key = str(expanded.parent)
-        if parent_key not in groups:
-            groups[parent_key] = []
-        groups[parent_key].append(tab)
-
-    # Sort groups by parent directory name, then sort items within each group
-    sorted_groups = sorted(groups.items(), key=lambda x: Path(x[0]).name.lower())
+        # (string ops: no Path objects per tab)
+        expanded = expand_tab_path(get_tab_dir(tab)).rstrip("/")
+        parent_key = os.path.dirname(expanded) or "."
+        groups.setdefault(parent_key, []).append(tab)
+
+    # Sort groups by parent directory name (resolved once per group and
+    # reused for the sub-header), then sort items within each group
+    sorted_groups = sorted(
+        ((parent_key.rpartition("/")[2], group_items)
+         for parent_key, group_items in groups.items()),
+        key=lambda group: group[0].casefold()
+    )
 
     checkboxes = [
         {"label": header_label, "checked": False, "disabled": True, "icon": header_icon}
     ]
     all_items = []
 
-    for parent_path, group_items in sorted_groups:
+    for parent_basename, group_items in sorted_groups:
         # Add sub-header for this parent directory with double-line box drawing
-        parent_name = Path(parent_path).name.upper()
-        count = len(group_items)
-        # Use 🗂️ emoji on both sides + double-line ═ for Level 2 (6 chars shorter than L1)
-        sub_header = f"🗂️ {_make_header_label(f'{parent_name}/ ({count})', '═', HEADER_L2_WIDTH)} 🗂️"
+        parent_name = parent_basename.upper()
+        sub_header = _make_group_sub_header(parent_name, len(group_items))
         checkboxes.append({
             "label": sub_header,
             "checked": False,
@@ -151,18 +200,23 @@ def _build_grouped_category_checkboxes(
             "icon": "SF=folder.fill.badge.gearshape",
         })
 
-        # Sort items within group alphabetically by display name
-        group_items.sort(key=lambda t: get_tab_display_name(t, custom_tab_names).lower())
+        # Sort items within group alphabetically by display name (each name
+        # is resolved once and reused for the label)
+        named_items = sorted(
+            ((get_tab_display_name(tab, custom_tab_names), tab) for tab in group_items),
+            key=lambda item: item[0].casefold()
+        )
 
-        for tab in group_items:
+        for name, tab in named_items:
             path = get_tab_dir(tab)
-            name = get_tab_display_name(tab, custom_tab_names)
             label = format_tab_label(path, name)
 
             # Skip .exists() check and icons for individual items - faster rendering
             checkboxes.append({
                 "label": label,
-                "checked": _is_tab_selected(tab, category_key, remembered_selections, custom_tab_names),
+                "checked": _is_tab_selected(
+                    tab, category_key, remembered_selections, name=name, path=path
+                ),
             })
             all_items.append({"label": label, "tab": tab, "category": category_key})
 
@@ -199,10 +253,14 @@ def show_category_selector_dialog(
         return None
 
     # Build checkboxes for each category (switch style for visual clarity)
+    # (label_to_name maps each label back to its category name for parsing)
     checkboxes = []
+    label_to_name = {}
     for cat in non_empty:
+        label = f"{cat['name']} ({cat['count']} items)"
+        label_to_name[label] = cat["name"]
         checkboxes.append({
-            "label": f"{cat['name']} ({cat['count']} items)",
+            "label": label,
             "icon": cat.get("icon", "SF=folder.fill"),
             "checked": False
         })
@@ -211,21 +269,14 @@ def show_category_selector_dialog(
     dialog_height = 140 + len(non_empty) * 40
 
     dialog_config = {
+        **_CATEGORY_DIALOG_BASE,
         "title": "Select Category to Edit",
-        "titlefont": "size=18",
         "message": "Choose a category to customize shorthand names:",
-        "messagefont": "size=14",
-        "appearance": "dark",
-        "hideicon": True,
         "checkbox": checkboxes,
-        "checkboxstyle": {"style": "switch", "size": "regular"},
         "button1text": "Edit Selected",
         "button2text": "Cancel",
         "height": str(dialog_height),
-        "width": "600",
-        "moveable": True,
-        "ontop": True,
-        "json": True
+        "width": "600"
     }
 
     logger.info(
@@ -253,21 +304,19 @@ def show_category_selector_dialog(
 
     # Parse selected category from checkbox output
     # SwiftDialog returns: {"Layout Tabs (5 items)": true, "Git Worktrees (3 items)": false, ...}
-    for label, selected in output.items():
-        if selected:
-            # Extract category name (strip the count suffix)
-            # "Layout Tabs (5 items)" -> "Layout Tabs"
-            category_name = label.rsplit(" (", 1)[0] if " (" in label else label
-
-            # Match back to original category names
-            for cat in non_empty:
-                if cat["name"] == category_name:
-                    logger.info(
-                        "Category selected",
-                        category=category_name,
-                        operation="show_category_selector_dialog"
-                    )
-                    return category_name
+    # First checked label that is one of ours wins
+    category_name = next(
+        (label_to_name[label] for label, selected in output.items()
+         if selected and label in label_to_name),
+        None
+    )
+    if category_name is not None:
+        logger.info(
+            "Category selected",
+            category=category_name,
+            operation="show_category_selector_dialog"
+        )
+        return category_name
 
     logger.debug(
         "No category selected",
@@ -362,23 +411,34 @@ def show_rename_tabs_dialog(
         "iTerm2 restarts."
     )
 
+    # Resolve each item's path, display label and basename once; pages (and
+    # Back/Next revisits) slice this list instead of recomputing per render
+    # and per parse
+    item_meta = []
+    for item in items:
+        path = item.get("dir") or item.get("path", "")
+        item_meta.append((item, path, _shorten_home(path), path.rpartition("/")[2]))
+
+    # Title prefix is the same on every page; only the page suffix varies
+    title_base = f"Rename: {category_name}" if category_name else "Rename Tabs"
+    title_base = f"{title_base} ({total_items} items)"
+
     while 0 <= current_page < total_pages:
         start = current_page * max_items_per_page
         end = min(start + max_items_per_page, total_items)
-        page_items = items[start:end]
+        # Single page (the common small-category case): use the list as-is
+        page_meta = item_meta if total_pages == 1 else item_meta[start:end]
         page_num = current_page + 1  # 1-indexed for display
 
         # Build text fields — use previously-edited values from all_results
         textfields = []
-        for item in page_items:
-            path = item.get("dir") or item.get("path", "")
+        for item, path, path_display, basename in page_meta:
             # Priority: edits from this session > saved custom names > item name
             current_name = (
                 all_results.get(path)
                 or custom_names.get(path)
-                or item.get("name", os.path.basename(path))
+                or item.get("name", basename)
             )
-            path_display = path.replace(str(Path.home()), "~")
 
             textfields.append({
                 "title": path_display,
@@ -387,15 +447,13 @@ def show_rename_tabs_dialog(
             })
 
         # Build title with category and page info
-        title = "Rename Tabs"
-        if category_name:
-            title = f"Rename: {category_name}"
-        title = f"{title} ({total_items} items)"
         if total_pages > 1:
-            title = f"{title} \u2014 Page {page_num}/{total_pages}"
+            title = f"{title_base} \u2014 Page {page_num}/{total_pages}"
+        else:
+            title = title_base
 
         # Calculate exact height for this page's content
-        dialog_height = message_overhead + len(page_items) * per_item_height + buttons_height
+        dialog_height = message_overhead + len(page_meta) * per_item_height + buttons_height
 
         # Button layout:
         #   button1 (rc=0): "Next" on non-last pages, "Save" on last page
@@ -430,7 +488,7 @@ def show_rename_tabs_dialog(
             "Showing rename dialog",
             operation="show_rename_tabs_dialog",
             category=category_name,
-            item_count=len(page_items),
+            item_count=len(page_meta),
             page=page_num,
             total_pages=total_pages,
             dialog_height=dialog_height
@@ -440,16 +498,18 @@ def show_rename_tabs_dialog(
         return_code, output = run_swiftdialog(dialog_config)
 
         # Collect edits from this page regardless of navigation direction
+        # (one pass over the output, keyed back to paths by textfield label)
         if output:
-            for item in page_items:
-                path = item.get("dir") or item.get("path", "")
-                path_display = path.replace(str(Path.home()), "~")
-                if path_display in output:
-                    new_name = output[path_display].strip()
-                    if new_name:
-                        all_results[path] = new_name
-                    else:
-                        all_results[path] = os.path.basename(path)
+            display_to_path = {
+                path_display: (path, basename)
+                for _item, path, path_display, basename in page_meta
+            }
+            for label, value in output.items():
+                target = display_to_path.get(label)
+                if target is not None:
+                    path, basename = target
+                    new_name = value.strip()
+                    all_results[path] = new_name or basename
 
         if return_code == 0:
             # Next / Save pressed
@@ -479,6 +539,59 @@ def show_rename_tabs_dialog(
     return all_results if all_results else None
 
 
+def _build_tab_customization_checkboxes(
+    layout_tabs: list[dict],
+    worktrees: list[dict],
+    additional_repos: list[dict],
+    untracked_folders: list[dict],
+    last_tab_selections: list[str] | None,
+    custom_tab_names: dict[str, str],
+) -> tuple[list[dict], list[dict]]:
+    """Build the categorized checkbox list for the tab customization dialog.
+
+    Returns:
+        Tuple of (checkboxes list for SwiftDialog, all_items metadata list).
+    """
+    remembered_selections = set(last_tab_selections) if last_tab_selections else None
+
+    # Build each category independently, then concatenate once at the end
+    sections = []
+
+    # Build category checkboxes using shared helpers (headers: _HEADER_* constants)
+    # Layout tabs and worktrees use flat list
+    flat_categories = [
+        (layout_tabs, "layout", _HEADER_LAYOUT,
+         CATEGORY_ICONS["header_layout"], CATEGORY_ICONS["layout_tab"]),
+        (worktrees, "worktree", _HEADER_WORKTREE,
+         CATEGORY_ICONS["header_worktree"], CATEGORY_ICONS["git_worktree"]),
+    ]
+    for items, cat_key, header, header_icon, item_icon in flat_categories:
+        sections.append(_build_category_checkboxes(
+            items, cat_key, header, header_icon, item_icon,
+            custom_tab_names, remembered_selections,
+        ))
+
+    # Additional repos grouped by parent directory (alphabetically: eon, fork-tools, own)
+    # Level 1 header with 📌 emoji on both sides, Level 2 sub-headers use ═ without emoji
+    sections.append(_build_grouped_category_checkboxes(
+        additional_repos, "discovered", _HEADER_REPO,
+        CATEGORY_ICONS["header_repo"], CATEGORY_ICONS["additional_repo"],
+        custom_tab_names, remembered_selections,
+    ))
+
+    # Untracked folders use flat list with 📌 emoji on both sides
+    sections.append(_build_category_checkboxes(
+        untracked_folders, "untracked", _HEADER_UNTRACKED,
+        CATEGORY_ICONS["header_untracked"], CATEGORY_ICONS["untracked"],
+        custom_tab_names, remembered_selections,
+    ))
+
+    checkboxes = list(chain.from_iterable(cat_checkboxes for cat_checkboxes, _ in sections))
+    all_items = list(chain.from_iterable(cat_items for _, cat_items in sections))
+
+    return checkboxes, all_items
+
+
 def show_tab_customization_swiftdialog(
     layout_tabs: list[dict],
     worktrees: list[dict],
@@ -486,7 +599,8 @@ def show_tab_customization_swiftdialog(
     untracked_folders: list[dict] | None = None,
     last_tab_selections: list[str] | None = None,
     custom_tab_names: dict[str, str] | None = None,
-    on_rename_requested: Callable | None = None
+    on_rename_requested: Callable | None = None,
+    prebuilt: tuple[list[dict], list[dict]] | None = None
 ) -> list[dict] | None:
     """
     Show Layer 2 checkbox dialog using SwiftDialog (modern macOS UI).
@@ -502,6 +616,8 @@ def show_tab_customization_swiftdialog(
         last_tab_selections: Previously selected tab names (for restoring state)
         custom_tab_names: Dict mapping paths to custom shorthand names
         on_rename_requested: Callback when "Rename Tabs" is clicked, receives all_items
+        prebuilt: (checkboxes, all_items) from _build_tab_customization_checkboxes,
+            skips rebuilding when the caller already has them
 
     Returns:
         List of selected tabs, or None if cancelled
@@ -530,90 +646,41 @@ def show_tab_customization_swiftdialog(
         }
     )
 
-    # Build checkbox JSON config with categories
-    checkboxes = []
-    all_items = []
-    remembered_selections = set(last_tab_selections) if last_tab_selections else None
-
-    # Build category checkboxes using shared helpers
-    # Level 1 headers use 📌 emoji on both sides + block characters (▓) for visual impact
-    # Layout tabs and worktrees use flat list
-    flat_categories = [
-        (layout_tabs, "layout", f"📌 {_make_header_label('LAYOUT TABS', '▓')} 📌",
-         CATEGORY_ICONS["header_layout"], CATEGORY_ICONS["layout_tab"]),
-        (worktrees, "worktree", f"📌 {_make_header_label('GIT WORKTREES', '▓')} 📌",
-         CATEGORY_ICONS["header_worktree"], CATEGORY_ICONS["git_worktree"]),
-    ]
-    for items, cat_key, header, header_icon, item_icon in flat_categories:
-        cat_checkboxes, cat_items = _build_category_checkboxes(
-            items, cat_key, header, header_icon, item_icon,
-            custom_tab_names, remembered_selections,
+    # Build checkbox JSON config with categories (reuse the caller's build
+    # when re-showing the dialog with unchanged names)
+    if prebuilt is not None:
+        checkboxes, all_items = prebuilt
+    else:
+        checkboxes, all_items = _build_tab_customization_checkboxes(
+            layout_tabs, worktrees, additional_repos, untracked_folders,
+            last_tab_selections, custom_tab_names,
         )
-        checkboxes.extend(cat_checkboxes)
-        all_items.extend(cat_items)
-
-    # Additional repos grouped by parent directory (alphabetically: eon, fork-tools, own)
-    # Level 1 header with 📌 emoji on both sides, Level 2 sub-headers use ═ without emoji
-    repo_checkboxes, repo_items = _build_grouped_category_checkboxes(
-        additional_repos, "discovered", f"📌 {_make_header_label('ADDITIONAL REPOS', '▓')} 📌",
-        CATEGORY_ICONS["header_repo"], CATEGORY_ICONS["additional_repo"],
-        custom_tab_names, remembered_selections,
-    )
-    checkboxes.extend(repo_checkboxes)
-    all_items.extend(repo_items)
-
-    # Untracked folders use flat list with 📌 emoji on both sides
-    untracked_checkboxes, untracked_items = _build_category_checkboxes(
-        untracked_folders, "untracked", f"📌 {_make_header_label('UNTRACKED FOLDERS', '▓')} 📌",
-        CATEGORY_ICONS["header_untracked"], CATEGORY_ICONS["untracked"],
-        custom_tab_names, remembered_selections,
-    )
-    checkboxes.extend(untracked_checkboxes)
-    all_items.extend(untracked_items)
 
     dialog_height = _get_max_dialog_height(0.90)
 
     # Build SwiftDialog JSON config
     # Wide compact design: larger fonts, tight spacing, path + shorthand labels
     dialog_config = {
+        **_CATEGORY_DIALOG_BASE,
         "title": "Customize Tabs",
-        "titlefont": "size=18",
         "message": f"Select tabs to open ({total_items} available):",
-        "messagefont": "size=14",
-        "appearance": "dark",  # Force dark mode for consistent toggle colors
-        "hideicon": True,
         "checkbox": checkboxes,
-        "checkboxstyle": {
-            "style": "switch",
-            "size": "regular"
-        },
         "button1text": "Open Selected",
         "button2text": "Back",  # Returns to workspace selector
         "infobuttontext": "Rename Tabs",  # Info button triggers rename dialog
         "height": str(dialog_height),
-        "width": "750",  # Match SwiftDialog's 700px checkbox area + padding
-        "moveable": True,
-        "ontop": True,
-        "json": True
+        "width": "750"  # Match SwiftDialog's 700px checkbox area + padding
     }
 
-    # Write config to temp file
+    # Pass config inline via --jsonstring (no temp file to create/clean up)
     try:
-        with tempfile.NamedTemporaryFile(
-            mode='w', suffix='.json', delete=False
-        ) as f:
-            json.dump(dialog_config, f)
-            config_path = f.name
-
-        # Run SwiftDialog
         swiftdialog_bin = find_swiftdialog_path()
-        cmd = [swiftdialog_bin, "--jsonfile", config_path, "--json"]
+        cmd = swiftdialog_command(swiftdialog_bin, dialog_config)
 
         logger.debug(
             "Running SwiftDialog",
             operation="show_tab_customization_swiftdialog",
-            trace_id=op_trace_id,
-            command=" ".join(cmd)
+            trace_id=op_trace_id
         )
 
         result = subprocess.run(
@@ -621,12 +688,10 @@ def show_tab_customization_swiftdialog(
             capture_output=True,
             text=True,
             timeout=300,  # 5 min timeout for user interaction
-            check=False  # We handle return codes manually (0=OK, 2=Cancel, 4=timeout)
+            check=False,  # We handle return codes manually (0=OK, 2=Cancel, 4=timeout)
+            close_fds=False
         )
 
-        # Clean up temp file
-        Path(config_path).unlink(missing_ok=True)
-
         # Check return code (0=button1/OK, 2=button2/Back, 3=info button, 4=timeout)
         if result.returncode == 2:
             logger.info(
@@ -672,7 +737,9 @@ def show_tab_customization_swiftdialog(
 
         # Parse JSON output
         try:
-            output = json.loads(result.stdout) if result.stdout.strip() else {}
+            stdout = result.stdout
+            # isspace() stops at the first non-blank char; strip() would copy
+            output = json.loads(stdout) if stdout and not stdout.isspace() else {}
         except json.JSONDecodeError as e:
             logger.error(
                 "Failed to parse SwiftDialog JSON output",
@@ -686,15 +753,13 @@ def show_tab_customization_swiftdialog(
 
         # Build selected tabs list from JSON output
         # SwiftDialog returns: {"Label": true/false, ...}
-        selected_tabs = []
-        for item in all_items:
-            label = item["label"]
-            # SwiftDialog may return label directly or in a nested structure
-            is_checked = output.get(label, False)
-            if isinstance(is_checked, dict):
-                is_checked = is_checked.get("checked", False)
-            if is_checked:
-                selected_tabs.append(item["tab"])
+        # (may also nest as {"Label": {"checked": ...}}) - normalize each output
+        # entry once, then keep dialog order (tab open order) from all_items
+        checked_labels = {
+            label for label, value in output.items()
+            if (value.get("checked", False) if isinstance(value, dict) else value)
+        }
+        selected_tabs = [item["tab"] for item in all_items if item["label"] in checked_labels]
 
         logger.info(
             "SwiftDialog tab customization complete",
@@ -716,7 +781,6 @@ def show_tab_customization_swiftdialog(
             status="timeout",
             trace_id=op_trace_id
         )
-        Path(config_path).unlink(missing_ok=True)
         return None
 
     except (OSError, subprocess.SubprocessError) as e:
@@ -885,92 +949,87 @@ async def show_tab_customization(
         )
 
         # Loop to handle rename dialog flow
-        import asyncio
-        from functools import partial
-        loop = asyncio.get_event_loop()
+        # Checkbox build is reused across rename round-trips and only redone
+        # when a rename actually changed a name (labels embed display names)
+        prebuilt = None
 
         while True:
-            result = await loop.run_in_executor(
-                None,
-                partial(
-                    show_tab_customization_swiftdialog,
-                    layout_tabs,
-                    worktrees,
-                    additional_repos,
-                    untracked_folders,
-                    last_tab_selections,
-                    custom_tab_names,
-                    None  # on_rename_requested not used - we check return value instead
+            if prebuilt is None:
+                prebuilt = _build_tab_customization_checkboxes(
+                    layout_tabs, worktrees, additional_repos, untracked_folders,
+                    last_tab_selections, custom_tab_names,
                 )
+
+            result = await asyncio.to_thread(
+                show_tab_customization_swiftdialog,
+                layout_tabs,
+                worktrees,
+                additional_repos,
+                untracked_folders,
+                last_tab_selections,
+                custom_tab_names,
+                None,  # on_rename_requested not used - we check return value instead
+                prebuilt
             )
 
             # Check if rename was requested
             if result == "RENAME_REQUESTED":
-                # Build items list with category tags for all inputs
-                # Use get_tab_display_name for consistent name resolution
-                items_to_rename = []
+                # Bucket tabs with a path by category in one sweep; counts come
+                # from the bucket sizes, and rename items are only built for
+                # the category the user picks
                 category_sources = [
-                    (layout_tabs, "Layout Tabs"),
-                    (worktrees, "Git Worktrees"),
-                    (additional_repos, "Additional Repos"),
-                    (untracked_folders, "Untracked Folders"),
+                    (layout_tabs, "Layout Tabs", CATEGORY_ICONS["layout_tab"]),
+                    (worktrees, "Git Worktrees", CATEGORY_ICONS["git_worktree"]),
+                    (additional_repos, "Additional Repos", CATEGORY_ICONS["additional_repo"]),
+                    (untracked_folders, "Untracked Folders", CATEGORY_ICONS["untracked"]),
                 ]
-                for source_list, category_name in category_sources:
+                by_category: dict[str, list[tuple[str, dict]]] = {}
+                categories = []
+                for source_list, category_name, icon in category_sources:
+                    bucket = []
                     for tab in source_list:
-                        items_to_rename.append({
-                            "dir": get_tab_dir(tab),
-                            "name": get_tab_display_name(tab, custom_tab_names),
-                            "category": category_name,
+                        tab_dir = get_tab_dir(tab)
+                        if tab_dir:  # Skip items without paths
+                            bucket.append((tab_dir, tab))
+                    by_category[category_name] = bucket
+                    if bucket:  # Only non-empty categories are selectable
+                        categories.append({
+                            "name": category_name,
+                            "count": len(bucket),
+                            "icon": icon
                         })
 
-                # Filter out items without paths
-                items_to_rename = [i for i in items_to_rename if i.get("dir")]
-
-                # Build category list with counts
-                from collections import Counter
-                category_counts = Counter(i["category"] for i in items_to_rename)
-                categories = [
-                    {
-                        "name": "Layout Tabs",
-                        "count": category_counts.get("Layout Tabs", 0),
-                        "icon": CATEGORY_ICONS["layout_tab"]
-                    },
-                    {
-                        "name": "Git Worktrees",
-                        "count": category_counts.get("Git Worktrees", 0),
-                        "icon": CATEGORY_ICONS["git_worktree"]
-                    },
-                    {
-                        "name": "Additional Repos",
-                        "count": category_counts.get("Additional Repos", 0),
-                        "icon": CATEGORY_ICONS["additional_repo"]
-                    },
-                    {
-                        "name": "Untracked Folders",
-                        "count": category_counts.get("Untracked Folders", 0),
-                        "icon": CATEGORY_ICONS["untracked"]
-                    },
-                ]
-
                 # Show category selector
-                selected_category = await loop.run_in_executor(
-                    None,
-                    partial(show_category_selector_dialog, categories)
+                selected_category = await asyncio.to_thread(
+                    show_category_selector_dialog, categories
                 )
 
                 if selected_category:
-                    # Show rename dialog filtered to selected category
-                    new_names = await loop.run_in_executor(
-                        None,
-                        partial(
-                            show_rename_tabs_dialog,
-                            items_to_rename,
-                            custom_tab_names,
-                            selected_category  # category_name filter
-                        )
+                    # Use get_tab_display_name for consistent name resolution
+                    items_to_rename = [
+                        {
+                            "dir": tab_dir,
+                            "name": get_tab_display_name(tab, custom_tab_names),
+                            "category": selected_category,
+                        }
+                        for tab_dir, tab in by_category[selected_category]
+                    ]
+
+                    # Show rename dialog for the selected category's items
+                    new_names = await asyncio.to_thread(
+                        show_rename_tabs_dialog,
+                        items_to_rename,
+                        custom_tab_names,
+                        selected_category  # dialog title
                     )
 
                     if new_names:
+                        if any(
+                            custom_tab_names.get(path) != name
+                            for path, name in new_names.items()
+                        ):
+                            prebuilt = None  # Labels changed: rebuild on re-show
+
                         # Update custom_tab_names with new values
                         custom_tab_names.update(new_names)
 
@@ -1034,22 +1093,30 @@ def show_tab_reorder_dialog(
         custom_tab_names = {}
 
     current = list(tabs)
+    # Display names are fixed for the dialog's lifetime: resolve once and keep
+    # them in step with current through each re-sort
+    names = [get_tab_display_name(tab, custom_tab_names) for tab in current]
+
+    # Two tabs can only be kept or swapped: one Keep/Swap dialog instead of
+    # the dropdown Sort/Finalize loop
+    if len(current) == 2:
+        return _show_two_tab_order_dialog(current, names)
+
     iteration = 0
 
+    # Dropdown values — 10x range with defaults at 10, 20, 30...
+    # Gives 9 slots between each tab for free insertion without conflicts.
+    # The tab count never changes across Sort iterations, so build once.
+    count = len(current)
+    values = [str(n) for n in range(1, count * 10 + 1)]
+    dialog_height = str(160 + 50 * count)
+
     while True:
-        # Build select dropdowns — 10x range with defaults at 10, 20, 30...
-        # Gives 9 slots between each tab for free insertion without conflicts
-        count = len(current)
-        max_val = count * 10
-        values = [str(n) for n in range(1, max_val + 1)]
-        selectitems = []
-        for i, tab in enumerate(current):
-            name = get_tab_display_name(tab, custom_tab_names)
-            selectitems.append({
-                "title": name,
-                "values": values,
-                "default": str((i + 1) * 10),
-            })
+        # Build select dropdowns in the current order
+        selectitems = [
+            {"title": name, "values": values, "default": str((i + 1) * 10)}
+            for i, name in enumerate(names)
+        ]
 
         if iteration == 0:
             msg = (
@@ -1076,7 +1143,7 @@ def show_tab_reorder_dialog(
             "button2text": "Cancel",
             "infobuttontext": "Finalize",
             "width": "750",
-            "height": str(160 + 50 * count),
+            "height": dialog_height,
             "moveable": True,
             "ontop": True,
             "json": True,
@@ -1087,13 +1154,13 @@ def show_tab_reorder_dialog(
         if return_code == 0:
             # Sort button (button1) — reorder and re-show
             if output:
-                current = _reorder_tabs_by_numbers(current, custom_tab_names, output)
+                current, names = _reorder_tabs_by_numbers(current, names, output)
             iteration += 1
             logger.info(
                 "Tab reorder preview",
                 operation="show_tab_reorder_dialog",
                 iteration=iteration,
-                order=[get_tab_display_name(t, custom_tab_names) for t in current],
+                order=names,
             )
             continue
 
@@ -1103,7 +1170,7 @@ def show_tab_reorder_dialog(
                 "Tab order finalized",
                 operation="show_tab_reorder_dialog",
                 iterations=iteration,
-                final_order=[get_tab_display_name(t, custom_tab_names) for t in current],
+                final_order=names,
             )
             return current
 
@@ -1117,24 +1184,71 @@ def show_tab_reorder_dialog(
             return None
 
 
+def _show_two_tab_order_dialog(tabs: list[dict], names: list[str]) -> list[dict] | None:
+    """Keep/Swap dialog for exactly two tabs (see show_tab_reorder_dialog)."""
+    dialog_config = {
+        "title": "Tab Order",
+        "titlefont": "size=18",
+        "message": f"1. **{names[0]}**\\n2. **{names[1]}**",
+        "messagefont": "size=14",
+        "appearance": "dark",
+        "hideicon": True,
+        "button1text": "Keep Order",
+        "button2text": "Cancel",
+        "infobuttontext": "Swap",
+        "width": "500",
+        "height": "220",
+        "moveable": True,
+        "ontop": True,
+        "json": True,
+    }
+
+    return_code, _ = run_swiftdialog(dialog_config)
+
+    if return_code == 0:
+        order = tabs
+    elif return_code == 3:
+        order = [tabs[1], tabs[0]]
+    else:
+        logger.debug(
+            "Tab reorder cancelled",
+            return_code=return_code,
+            operation="show_tab_reorder_dialog",
+        )
+        return None
+
+    logger.info(
+        "Tab order finalized",
+        operation="show_tab_reorder_dialog",
+        swapped=return_code == 3,
+        final_order=[names[1], names[0]] if return_code == 3 else names,
+    )
+    return order
+
+
 def _reorder_tabs_by_numbers(
     tabs: list[dict],
-    custom_tab_names: dict[str, str],
+    names: list[str],
     output: dict,
-) -> list[dict]:
-    """Sort tabs by the numeric values from the reorder dialog output."""
+) -> tuple[list[dict], list[str]]:
+    """Sort tabs (and their parallel display names) by the numeric values
+    from the reorder dialog output."""
     pairs = []
-    for tab in tabs:
-        name = get_tab_display_name(tab, custom_tab_names)
+    for i, (name, tab) in enumerate(zip(names, tabs)):
         raw = output.get(name, "999")
         # Handle both textfield ("3") and selectitems ({"selectedValue": "3"})
         if isinstance(raw, dict):
             raw = raw.get("selectedValue", "999")
-        try:
-            num = int(raw)
-        except (ValueError, TypeError):
-            num = 999
-        pairs.append((num, tab))
-
-    pairs.sort(key=lambda x: x[0])
-    return [tab for _, tab in pairs]
+        if isinstance(raw, str) and raw.isdecimal():
+            num = int(raw)  # Common case: dropdown values are digit strings
+        else:
+            try:
+                num = int(raw)
+            except (ValueError, TypeError):
+                num = 999
+        pairs.append((num, i, name, tab))
+
+    # Plain tuple sort: (num, i) is unique, so ties keep their current order
+    # and the dicts themselves are never compared
+    pairs.sort()
+    return [tab for *_, tab in pairs], [name for _, _, name, _ in pairs]
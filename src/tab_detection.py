@@ -7,10 +7,24 @@
 # =============================================================================
 
 
+async def _get_session_path(session) -> str | None:
+    """Query a session's ``path`` variable, or None if it can't be read."""
+    try:
+        return await session.async_get_variable("path")
+    except (iterm2.RPCException, AttributeError, TypeError):
+        logger.debug(
+            "Could not query session path",
+            session_id=getattr(session, "session_id", "unknown"),
+        )
+        return None
+
+
 async def get_open_tab_directories(window) -> set[str]:
     """Return normalized directory paths of all sessions in the current window.
 
     Queries each session's ``path`` variable via the iTerm2 Python API.
+    The queries are issued concurrently (one round-trip for the whole
+    window instead of one per session).
     Uses normalize_tab_path for consistent path comparison.
 
     Args:
@@ -19,20 +33,9 @@ async def get_open_tab_directories(window) -> set[str]:
     Returns:
         Set of absolute directory paths currently open in the window.
     """
-    open_dirs: set[str] = set()
-    for tab in window.tabs:
-        for session in tab.sessions:
-            try:
-                path = await session.async_get_variable("path")
-            except (iterm2.RPCException, AttributeError, TypeError):
-                logger.debug(
-                    "Could not query session path",
-                    session_id=getattr(session, "session_id", "unknown"),
-                )
-                continue
-            if path:
-                open_dirs.add(normalize_tab_path(path))
-    return open_dirs
+    sessions = [session for tab in window.tabs for session in tab.sessions]
+    paths = await asyncio.gather(*(_get_session_path(session) for session in sessions))
+    return {normalize_tab_path(path) for path in paths if path}
 
 
 def filter_already_open_tabs(
@@ -50,6 +53,10 @@ def filter_already_open_tabs(
     Returns:
         Tuple of (tabs_to_create, skipped_tab_names).
     """
+    if not open_dirs:
+        # Fresh window: nothing can match, skip the per-tab realpath
+        return list(all_tabs), []
+
     tabs_to_create: list[dict] = []
     tabs_skipped: list[str] = []
 
@@ -78,6 +85,15 @@ def filter_already_open_tabs(
     return tabs_to_create, tabs_skipped
 
 
+async def _get_tab_path(tab) -> str | None:
+    """Return the path of the tab's first session that reports one."""
+    for session in tab.sessions:
+        path = await _get_session_path(session)
+        if path:
+            return path
+    return None
+
+
 async def reorder_window_tabs(
     window,
     desired_order: list[str],
@@ -98,24 +114,19 @@ async def reorder_window_tabs(
 
     # Build map: normalized dir path → Tab object
     # First, add newly created tabs (path variable may not be set yet)
-    dir_to_tab: dict[str, object] = {}
-    for dir_path, tab in created_tabs.items():
-        dir_to_tab[normalize_tab_path(dir_path)] = tab
-
-    # Then query existing tabs (already-open before this session)
-    for tab in window.tabs:
-        if tab.tab_id in {t.tab_id for t in created_tabs.values()}:
-            continue  # Already tracked via created_tabs
-        for session in tab.sessions:
-            try:
-                path = await session.async_get_variable("path")
-            except (iterm2.RPCException, AttributeError, TypeError):
-                continue
-            if path:
-                normalized = normalize_tab_path(path)
-                if normalized not in dir_to_tab:
-                    dir_to_tab[normalized] = tab
-                break  # Use first session's path per tab
+    dir_to_tab: dict[str, object] = {
+        normalize_tab_path(dir_path): tab for dir_path, tab in created_tabs.items()
+    }
+
+    # Then query existing tabs (already-open before this session), all tabs
+    # concurrently; tabs created this session are already tracked
+    created_ids = {t.tab_id for t in created_tabs.values()}
+    existing_tabs = [tab for tab in window.tabs if tab.tab_id not in created_ids]
+    tab_paths = await asyncio.gather(*(_get_tab_path(tab) for tab in existing_tabs))
+    for tab, path in zip(existing_tabs, tab_paths):
+        if path:
+            # Created tabs (and earlier tabs) keep their entry
+            dir_to_tab.setdefault(normalize_tab_path(path), tab)
 
     # Build ordered tab list
     ordered_tabs: list[object] = []
@@ -10,11 +10,13 @@
 # properties are computed differently in different parts of the codebase.
 
 
+@lru_cache(maxsize=512)
 def normalize_tab_path(path: str) -> str:
     """Normalize a tab directory path for consistent comparison.
 
     Expands ~ and resolves symlinks, then strips trailing slashes.
-    Use this whenever comparing tab paths for equality.
+    Use this whenever comparing tab paths for equality. Results are cached
+    for the session (realpath issues a readlink per path component).
 
     Args:
         path: Raw path string (may contain ~ or be relative).
@@ -61,13 +63,17 @@ def get_tab_display_name(
     Returns:
         Display name string for the tab.
     """
-    custom_tab_names = custom_tab_names or {}
     path = tab.get("dir", "")
-    return (
-        custom_tab_names.get(path)
-        or tab.get("name")
-        or os.path.basename(expand_tab_path(path))
-    )
+    name = (custom_tab_names.get(path) if custom_tab_names else None) or tab.get("name")
+    if name:
+        return name
+
+    # basename(expanduser(path)): expansion only changes the last component
+    # for a bare "~" / "~user", so take the tail directly otherwise
+    _, sep, tail = path.rpartition("/")
+    if sep or not path.startswith("~"):
+        return tail
+    return os.path.basename(expand_tab_path(path))
 
 
 def get_tab_dir(tab: dict) -> str:
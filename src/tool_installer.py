@@ -86,16 +86,23 @@ async def offer_tool_installation(
         )
 
         try:
-            # Run brew install
-            result = subprocess.run(
-                ["brew", "install", brew_package],
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 min timeout for installation
-                check=False
+            # Run brew install without blocking the event loop; stdout is
+            # never shown, so only stderr is captured
+            proc = await asyncio.create_subprocess_exec(
+                "brew", "install", brew_package,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
             )
-
-            if result.returncode == 0:
+            try:
+                # 5 min timeout for installation
+                _, stderr_bytes = await asyncio.wait_for(proc.communicate(), timeout=300)
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+            stderr = stderr_bytes.decode(errors="replace")
+
+            if proc.returncode == 0:
                 logger.info(
                     "Tool installed successfully",
                     operation="offer_tool_installation",
@@ -118,14 +125,14 @@ async def offer_tool_installation(
                     operation="offer_tool_installation",
                     tool=tool_name,
                     status="failed",
-                    returncode=result.returncode,
-                    stderr=result.stderr[:500] if result.stderr else None
+                    returncode=proc.returncode,
+                    stderr=stderr[:500] if stderr else None
                 )
 
                 error_alert = iterm2.Alert(
                     "Installation Failed",
                     f"Could not install {tool_name}.\n\n"
-                    f"Error: {result.stderr[:200] if result.stderr else 'Unknown error'}\n\n"
+                    f"Error: {stderr[:200] if stderr else 'Unknown error'}\n\n"
                     f"Try manually: brew install {brew_package}",
                     window_id=window.window_id
                 )
@@ -133,7 +140,7 @@ async def offer_tool_installation(
                 await error_alert.async_run(connection)
                 return False
 
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             logger.error(
                 "Tool installation timed out",
                 operation="offer_tool_installation",
@@ -24,12 +24,14 @@ Features:
 """
 
 import asyncio
+import fnmatch
 import glob
 import json
 import os
 import re
 import shlex
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
@@ -39,8 +41,10 @@ import traceback
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Callable, Generic, TypeVar
+from typing import Callable, Generic, NamedTuple, TypeVar
 from uuid import uuid4
 
 # =============================================================================
@@ -120,6 +124,8 @@ def show_import_error_dialog(package: str, error_msg: str) -> None:
 
 
 # Import external packages with visible error dialogs
+# iterm2 stays an eager import: the entry point itself runs under
+# iterm2.run_until_complete(), so deferring it would not shorten startup.
 try:
     import iterm2
 except ImportError as e:
@@ -247,19 +253,21 @@ class ErrorType(Enum):
     TIMEOUT_ERROR = "timeout_error"
 
 
-@dataclass
-class Error:
+# Error and Result are immutable values built on every config load, so they
+# are NamedTuples (tuple subclasses: no per-instance __dict__, cheap to build).
+# ErrorReport accumulates state and stays a dataclass (slotted: one per run,
+# no __dict__).
+class Error(NamedTuple):
     error_type: ErrorType
     message: str
-    context: dict = field(default_factory=dict)
-    original_exception: Exception = None
+    context: dict | None = None
+    original_exception: Exception | None = None
 
 
-@dataclass
-class Result(Generic[T]):
+class Result(NamedTuple, Generic[T]):
     success: bool
-    value: T = None
-    error: Error = None
+    value: T | None = None
+    error: Error | None = None
 
     @staticmethod
     def ok(value: T) -> 'Result[T]':
@@ -276,7 +284,7 @@ class Result(Generic[T]):
         return not self.success
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorReport:
     errors: list[Error] = field(default_factory=list)
     warnings: list[Error] = field(default_factory=list)
@@ -288,7 +296,7 @@ class ErrorReport:
             operation="error_report",
             status="error",
             error_type=error.error_type.value,
-            **error.context
+            **(error.context or {})
         )
 
     def add_warning(self, error: Error):
@@ -298,7 +306,7 @@ class ErrorReport:
             operation="error_report",
             status="warning",
             error_type=error.error_type.value,
-            **error.context
+            **(error.context or {})
         )
 
     def collect_result(self, result: Result, context: str = "") -> bool:
@@ -340,15 +348,46 @@ class ErrorReport:
 # Workspace Launcher Configuration
 # =============================================================================
 
-CONFIG_DIR = Path("~/.config/workspace-launcher").expanduser()
 WORKSPACE_PATTERN = "workspace-*.toml"
-PREFERENCES_PATH = CONFIG_DIR / "preferences.toml"
-
-# Legacy paths (for backward compatibility / migration)
-LEGACY_CONFIG_DIR = Path("~/.config/iterm2").expanduser()
 LEGACY_LAYOUT_PATTERN = "layout-*.toml"
-LEGACY_CONFIG_PATH = LEGACY_CONFIG_DIR / "layout.toml"
-LEGACY_PREFERENCES_PATH = LEGACY_CONFIG_DIR / "selector-preferences.toml"
+
+
+class _Paths:
+    """
+    Config file locations, resolved on first use.
+
+    expanduser() is deferred until a path is actually consulted rather than
+    running for every path at import time.
+    """
+
+    @cached_property
+    def config_dir(self) -> Path:
+        return Path("~/.config/workspace-launcher").expanduser()
+
+    @cached_property
+    def preferences(self) -> Path:
+        return self.config_dir / "preferences.toml"
+
+    # Legacy paths (for backward compatibility / migration)
+    @cached_property
+    def legacy_config_dir(self) -> Path:
+        return Path("~/.config/iterm2").expanduser()
+
+    @cached_property
+    def legacy_config(self) -> Path:
+        return self.legacy_config_dir / "layout.toml"
+
+    @cached_property
+    def legacy_preferences(self) -> Path:
+        return self.legacy_config_dir / "selector-preferences.toml"
+
+    @cached_property
+    def discovery_cache(self) -> Path:
+        # macOS: ~/Library/Caches/workspace-launcher/
+        return Path(platformdirs.user_cache_dir(appname="workspace-launcher")) / "discovery.json"
+
+
+PATHS = _Paths()
 
 # Default configuration - safe values that work without user config
 # Uses universally available commands (no broot, no custom tools)
@@ -384,6 +423,18 @@ SAFE_RIGHT_COMMAND = "zsh"
 # Query zsh for aliases at runtime, with fallback to hardcoded known aliases.
 
 
+# PATH lookups per binary name, cached for session (PATH is fixed after
+# _augment_path and validate_command runs twice per tab with the same commands)
+_which_cache: dict[str, str | None] = {}
+
+
+def _which_cached(binary: str) -> str | None:
+    """Return shutil.which(binary), caching the result for the session."""
+    if binary not in _which_cache:
+        _which_cache[binary] = shutil.which(binary)
+    return _which_cache[binary]
+
+
 def get_shell_aliases() -> dict[str, str]:
     """
     Query zsh for defined aliases at runtime.
@@ -467,7 +518,7 @@ class CommandResolver:
         """Resolve command through aliases and PATH."""
         aliases = cls.get_aliases()
         resolved = aliases.get(cmd, cmd)
-        return shutil.which(resolved)
+        return _which_cached(resolved)
 
 
 # Fallback aliases when runtime shell query fails
@@ -509,34 +560,33 @@ def validate_command(command: str, fallback: str) -> str:
 
     binary = parts[0]
 
-    # Check if binary exists in PATH
-    if shutil.which(binary):
+    # Check if binary exists in PATH (before touching aliases: the runtime
+    # alias query spawns an interactive zsh)
+    if _which_cached(binary):
         return command
 
-    # Try runtime shell alias resolution (queries zsh, cached for session)
+    # Alias candidates in resolution order: runtime shell alias (queries zsh,
+    # cached for session), then hardcoded KNOWN_ALIASES. Each distinct
+    # target is looked up once.
+    candidates = []
     runtime_aliases = CommandResolver.get_aliases()
     if binary in runtime_aliases:
-        actual_binary = runtime_aliases[binary]
-        if shutil.which(actual_binary):
-            logger.debug(
-                "Using runtime shell alias",
-                operation="validate_command",
-                alias=binary,
-                actual_binary=actual_binary,
-                source="zsh"
-            )
-            return command  # Keep original command - shell will resolve alias
-
-    # Fall back to hardcoded aliases if runtime query returned empty
+        candidates.append((runtime_aliases[binary], "zsh"))
     if binary in KNOWN_ALIASES:
-        actual_binary = KNOWN_ALIASES[binary]
-        if shutil.which(actual_binary):
+        candidates.append((KNOWN_ALIASES[binary], "KNOWN_ALIASES"))
+
+    seen = {binary}
+    for actual_binary, source in candidates:
+        if actual_binary in seen:
+            continue
+        seen.add(actual_binary)
+        if _which_cached(actual_binary):
             logger.debug(
-                "Using fallback known alias",
+                "Using shell alias",
                 operation="validate_command",
                 alias=binary,
                 actual_binary=actual_binary,
-                source="KNOWN_ALIASES"
+                source=source
             )
             return command  # Keep original command - shell will resolve alias
 
@@ -573,13 +623,15 @@ def extract_toml_error_context(error: tomllib.TOMLDecodeError, file_path: Path)
         line_number = int(line_match.group(1))
 
     # If we have a line number, read that line from the file
-    if line_number and file_path.exists():
+    # Stream lines and stop at the target (avoids loading the whole file)
+    if line_number and line_number > 0 and file_path.exists():
         try:
             with open(file_path, "r") as f:
-                lines = f.readlines()
-                if 0 < line_number <= len(lines):
-                    line_content = lines[line_number - 1].rstrip()
-        except OSError:
+                for current, raw in enumerate(f, 1):
+                    if current == line_number:
+                        line_content = raw.rstrip()
+                        break
+        except (OSError, UnicodeDecodeError):
             pass
 
     # Format helpful message
@@ -619,20 +671,20 @@ def load_config() -> dict | None:
     Returns:
         dict: Merged configuration, or None if config file missing/invalid
     """
-    if not LEGACY_CONFIG_PATH.exists():
+    if not PATHS.legacy_config.exists():
         return None
 
     try:
-        with open(LEGACY_CONFIG_PATH, "rb") as f:
+        with open(PATHS.legacy_config, "rb") as f:
             user_config = tomllib.load(f)
         return deep_merge(DEFAULT_CONFIG, user_config)
     except tomllib.TOMLDecodeError as e:
-        error_context = extract_toml_error_context(e, LEGACY_CONFIG_PATH)
+        error_context = extract_toml_error_context(e, PATHS.legacy_config)
         logger.error(
             "Invalid TOML syntax in configuration file",
             operation="load_config",
             status="failed",
-            file=str(LEGACY_CONFIG_PATH),
+            file=str(PATHS.legacy_config),
             line_number=error_context["line_number"],
             line_content=error_context["line_content"],
             error=error_context["formatted_message"]
@@ -723,7 +775,7 @@ def discover_layouts() -> list[dict]:
     """
     Discover available workspace files in config directory.
 
-    Scans CONFIG_DIR for files matching WORKSPACE_PATTERN (workspace-*.toml).
+    Scans PATHS.config_dir for files matching WORKSPACE_PATTERN (workspace-*.toml).
 
     Returns:
         List of dicts with keys: name, display, path, tab_count
@@ -739,18 +791,11 @@ def discover_layouts() -> list[dict]:
         operation="discover_layouts",
         status="started",
         trace_id=op_trace_id,
-        config_dir=str(CONFIG_DIR),
+        config_dir=str(PATHS.config_dir),
         pattern=WORKSPACE_PATTERN
     )
 
-    for path in sorted(CONFIG_DIR.glob(WORKSPACE_PATTERN)):
-        logger.debug(
-            "Found layout file",
-            operation="discover_layouts",
-            trace_id=op_trace_id,
-            file=path.name
-        )
-
+    for path in sorted(PATHS.config_dir.glob(WORKSPACE_PATTERN)):
         # Extract display name: workspace-{name}.toml -> {name}
         match = re.match(r"workspace-(.+)\.toml$", path.name)
         if not match:
@@ -778,14 +823,6 @@ def discover_layouts() -> list[dict]:
             }
             layouts.append(layout)
 
-            logger.debug(
-                "Added layout",
-                operation="discover_layouts",
-                trace_id=op_trace_id,
-                layout_name=name,
-                metrics={"tab_count": tab_count}
-            )
-
         except tomllib.TOMLDecodeError as e:
             error_context = extract_toml_error_context(e, path)
             logger.warning(
@@ -814,6 +851,7 @@ def discover_layouts() -> list[dict]:
         operation="discover_layouts",
         status="success",
         trace_id=op_trace_id,
+        layouts={layout["name"]: layout["tab_count"] for layout in layouts},
         metrics={"layouts_found": len(layouts), "duration_ms": duration_ms}
     )
 
@@ -825,6 +863,20 @@ def discover_layouts() -> list[dict]:
 DEFAULT_SCAN_DIRECTORIES: list[dict[str, str | bool]] = []
 
 
+# Preferences file content as last read or written by this process, with the
+# file's mtime at that point (None = not known). save_preferences skips the
+# atomic write + fsync when it would rewrite identical content to an
+# untouched file.
+_preferences_on_disk: tuple[str, int] | None = None
+
+
+def _preferences_mtime_ns() -> int | None:
+    try:
+        return os.stat(PATHS.preferences).st_mtime_ns
+    except OSError:
+        return None
+
+
 def load_preferences() -> dict:
     """
     Load selector preferences from TOML file.
@@ -833,6 +885,8 @@ def load_preferences() -> dict:
         dict with keys: remember_choice (bool), last_layout (str|None),
         scan_directories (list of {"path": str, "enabled": bool})
     """
+    global _preferences_on_disk
+
     defaults = {
         "remember_choice": False,
         "last_layout": None,
@@ -841,18 +895,21 @@ def load_preferences() -> dict:
         "disabled_layouts": [],  # layout names to hide from selector
     }
 
-    if not PREFERENCES_PATH.exists():
+    if not PATHS.preferences.exists():
         logger.debug(
             "Preferences file does not exist, using defaults",
             operation="load_preferences",
             status="default",
-            file=str(PREFERENCES_PATH)
+            file=str(PATHS.preferences)
         )
         return defaults
 
     try:
-        with open(PREFERENCES_PATH, "rb") as f:
-            prefs = tomllib.load(f)
+        with open(PATHS.preferences, "rb") as f:
+            text = f.read().decode("utf-8")
+            mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+        prefs = tomllib.loads(text)
+        _preferences_on_disk = (text, mtime_ns)
 
         result = {**defaults, **prefs}
 
@@ -870,19 +927,19 @@ def load_preferences() -> dict:
         )
         return result
 
-    except (OSError, tomllib.TOMLDecodeError, KeyError, TypeError) as e:
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError, KeyError, TypeError) as e:
         logger.warning(
             "Failed to load preferences, using defaults",
             operation="load_preferences",
             status="fallback",
-            file=str(PREFERENCES_PATH),
+            file=str(PATHS.preferences),
             error=str(e),
             error_type=type(e).__name__
         )
         return defaults
 
 
-def atomic_write_file(path: Path, content: str) -> None:
+def atomic_write_file(path: Path, content: str | bytes) -> None:
     """
     Write file atomically using temp file → fsync → rename pattern.
 
@@ -891,7 +948,8 @@ def atomic_write_file(path: Path, content: str) -> None:
 
     Args:
         path: Target file path
-        content: Content to write
+        content: Content to write (str is encoded as UTF-8; bytes are
+            written as-is)
 
     Raises:
         OSError: If write fails (including disk full - errno.ENOSPC)
@@ -909,9 +967,10 @@ def atomic_write_file(path: Path, content: str) -> None:
     )
 
     try:
-        # Write content
-        with os.fdopen(temp_fd, "w") as f:
-            f.write(content)
+        # Write content (binary mode: no text-layer wrapper for bytes input)
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        with os.fdopen(temp_fd, "wb") as f:
+            f.write(data)
             f.flush()
             os.fsync(f.fileno())  # Ensure data hits disk
 
@@ -942,6 +1001,86 @@ def atomic_write_file(path: Path, content: str) -> None:
         raise
 
 
+# =============================================================================
+# Discovery Cache (persisted across launches)
+# =============================================================================
+# Stores the SwiftDialog path and directory scan results in a JSON file so a
+# new launch can revalidate them with a few stat() calls instead of
+# re-walking scan directories. Entries carry the mtimes they were computed
+# from; see selector.py. Worktrees are not cached (read fresh each launch).
+
+# Version 2 dropped the "worktrees" section: older files are discarded
+DISCOVERY_CACHE_VERSION = 2
+
+# Loaded on first use (None = not loaded yet)
+_discovery_cache: dict | None = None
+_discovery_cache_dirty = False
+
+
+def _empty_discovery_cache() -> dict:
+    return {
+        "version": DISCOVERY_CACHE_VERSION,
+        "swiftdialog_path": None,
+        "directory_scans": {},
+    }
+
+
+def get_discovery_cache() -> dict:
+    """
+    Return the discovery cache, loading it from disk on first call.
+
+    Missing, unreadable, or outdated cache files yield an empty cache.
+    """
+    global _discovery_cache
+
+    if _discovery_cache is not None:
+        return _discovery_cache
+
+    cache = _empty_discovery_cache()
+    try:
+        with open(PATHS.discovery_cache) as f:
+            loaded = json.load(f)
+        if isinstance(loaded, dict) and loaded.get("version") == DISCOVERY_CACHE_VERSION:
+            cache.update(loaded)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.debug(
+            "Ignoring unreadable discovery cache",
+            operation="get_discovery_cache",
+            file=str(PATHS.discovery_cache),
+            error=str(e)
+        )
+
+    _discovery_cache = cache
+    return _discovery_cache
+
+
+def mark_discovery_cache_dirty() -> None:
+    """Flag the discovery cache for writing on the next save."""
+    global _discovery_cache_dirty
+    _discovery_cache_dirty = True
+
+
+def save_discovery_cache() -> None:
+    """Write the discovery cache to disk atomically if it changed."""
+    global _discovery_cache_dirty
+
+    if _discovery_cache is None or not _discovery_cache_dirty:
+        return
+
+    try:
+        atomic_write_file(PATHS.discovery_cache, json.dumps(_discovery_cache))
+        _discovery_cache_dirty = False
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(
+            "Could not save discovery cache",
+            operation="save_discovery_cache",
+            file=str(PATHS.discovery_cache),
+            error=str(e)
+        )
+
+
 def save_preferences(prefs: dict) -> None:
     """
     Save selector preferences to TOML file atomically.
@@ -952,6 +1091,8 @@ def save_preferences(prefs: dict) -> None:
     Args:
         prefs: dict with remember_choice, last_layout, scan_directories keys
     """
+    global _preferences_on_disk
+
     lines = [
         "# Workspace Launcher Preferences",
         "# Auto-generated by workspace-launcher.py",
@@ -1007,14 +1148,29 @@ def save_preferences(prefs: dict) -> None:
 
     content = "\n".join(lines) + "\n"
 
+    if (
+        _preferences_on_disk is not None
+        and _preferences_on_disk[0] == content
+        and _preferences_on_disk[1] == _preferences_mtime_ns()
+    ):
+        logger.debug(
+            "Preferences unchanged, skipping write",
+            operation="save_preferences",
+            status="unchanged",
+            file=str(PATHS.preferences)
+        )
+        return
+
     try:
-        atomic_write_file(PREFERENCES_PATH, content)
+        atomic_write_file(PATHS.preferences, content)
+        mtime_ns = _preferences_mtime_ns()
+        _preferences_on_disk = (content, mtime_ns) if mtime_ns is not None else None
 
         logger.debug(
             "Preferences saved successfully",
             operation="save_preferences",
             status="success",
-            file=str(PREFERENCES_PATH),
+            file=str(PATHS.preferences),
             remember_choice=prefs.get("remember_choice"),
             last_layout=prefs.get("last_layout"),
             scan_directories_count=len(scan_dirs) if scan_dirs else 0
@@ -1025,7 +1181,7 @@ def save_preferences(prefs: dict) -> None:
             "Failed to save preferences - user choices may not persist",
             operation="save_preferences",
             status="failed",
-            file=str(PREFERENCES_PATH),
+            file=str(PATHS.preferences),
             error=str(e)
         )
 
@@ -1070,13 +1226,13 @@ async def reset_preferences(connection, window) -> bool:
 
     # Delete preferences file
     try:
-        if PREFERENCES_PATH.exists():
-            PREFERENCES_PATH.unlink()
+        if PATHS.preferences.exists():
+            PATHS.preferences.unlink()
             logger.info(
                 "Preferences reset successfully",
                 operation="reset_preferences",
                 status="success",
-                file=str(PREFERENCES_PATH)
+                file=str(PATHS.preferences)
             )
 
             success_alert = iterm2.Alert(
@@ -1181,6 +1337,15 @@ async def show_auto_open_dialog(
         return "cancel"
 
 
+# Action buttons appended after the layout buttons, keyed by offset
+# from the first action button ("Cancel" follows them)
+SELECTOR_ACTIONS = {
+    0: "manage_directories",  # Scan Folders...
+    1: "manage_layouts",      # Manage Workspaces...
+    2: "run_wizard",          # Setup Wizard...
+}
+
+
 async def show_layout_selector(
     connection, layouts: list[dict], last_layout: str | None = None
 ) -> dict | None:
@@ -1199,18 +1364,18 @@ async def show_layout_selector(
     # Manage Layouts (to re-enable), Scan Folders, Setup Wizard buttons
 
     # Reorder layouts so last_layout is first (becomes default blue button)
-    ordered_layouts = list(layouts)
+    last = None
     if last_layout:
-        for i, layout in enumerate(ordered_layouts):
-            if layout["name"] == last_layout:
-                # Move to front
-                ordered_layouts.insert(0, ordered_layouts.pop(i))
-                logger.debug(
-                    "Reordered layouts, last used first",
-                    operation="show_layout_selector",
-                    last_layout=last_layout
-                )
-                break
+        last = next((layout for layout in layouts if layout["name"] == last_layout), None)
+    if last is not None:
+        ordered_layouts = [last] + [layout for layout in layouts if layout is not last]
+        logger.debug(
+            "Reordered layouts, last used first",
+            operation="show_layout_selector",
+            last_layout=last_layout
+        )
+    else:
+        ordered_layouts = list(layouts)
 
     # Build alert with layout buttons
     logger.debug(
@@ -1234,11 +1399,11 @@ async def show_layout_selector(
     # Add button for each layout (last used first as default)
     for layout in ordered_layouts:
         alert.add_button(layout["display"])
-        logger.debug(
-            "Added button to dialog",
-            operation="show_layout_selector",
-            layout_display=layout["display"]
-        )
+    logger.debug(
+        "Added layout buttons to dialog",
+        operation="show_layout_selector",
+        layout_displays=[layout["display"] for layout in ordered_layouts]
+    )
 
     # Add Scan Folders button (for directory management)
     alert.add_button("Scan Folders...")
@@ -1281,54 +1446,27 @@ async def show_layout_selector(
             button_index=button_index
         )
 
-        # Check if Scan Folders was clicked
-        if button_index == len(ordered_layouts):
-            logger.debug(
-                "Scan Folders clicked",
-                operation="show_layout_selector",
-                status="scan_folders"
-            )
-            # Return special action dict
-            return {"action": "manage_directories"}
-
-        # Check if Manage Layouts was clicked
-        if button_index == len(ordered_layouts) + 1:
-            logger.debug(
-                "Manage Layouts clicked",
-                operation="show_layout_selector",
-                status="manage_layouts"
-            )
-            # Return special action dict
-            return {"action": "manage_layouts"}
-
-        # Check if Setup Wizard was clicked
-        if button_index == len(ordered_layouts) + 2:
-            logger.debug(
-                "Setup Wizard clicked",
-                operation="show_layout_selector",
-                status="wizard"
-            )
-            # Return special action dict
-            return {"action": "run_wizard"}
-
-        # Check if Cancel was clicked (last button)
-        if button_index > len(ordered_layouts) + 2:
+        # Layout buttons come first, then the action buttons in the order
+        # they were added above; anything past those is Cancel
+        layout_count = len(ordered_layouts)
+        if 0 <= button_index < layout_count:
+            selected = ordered_layouts[button_index]
             logger.debug(
-                "Cancel clicked or invalid selection",
+                "Layout selected",
                 operation="show_layout_selector",
-                status="cancelled"
+                status="success",
+                layout_name=selected["name"]
             )
-            return None
+            return selected
 
-        selected = ordered_layouts[button_index]
+        action = SELECTOR_ACTIONS.get(button_index - layout_count)
         logger.debug(
-            "Layout selected",
+            "Selector action chosen" if action else "Cancel clicked or invalid selection",
             operation="show_layout_selector",
-            status="success",
-            layout_name=selected["name"]
+            status=action or "cancelled"
         )
-
-        return selected
+        # Return special action dict (None for Cancel)
+        return {"action": action} if action else None
 
     except (iterm2.RPCException, ValueError, TypeError) as e:
         logger.error(
@@ -1372,8 +1510,48 @@ def generate_acronym(slug: str) -> str:
 
     Example: feature-branch-name → fbn
     """
-    words = slug.split("-")
-    return "".join(word[0].lower() for word in words if word)
+    # Single pass: take the first character after each run of "-"
+    chars = []
+    take_next = True
+    for c in slug:
+        if c == "-":
+            take_next = True
+        elif take_next:
+            chars.append(c.lower())
+            take_next = False
+    return "".join(chars)
+
+
+def _match_sibling_dirs(parent_dir: str, pattern: str) -> list[str]:
+    """
+    Return paths of directories in parent_dir whose names match pattern.
+
+    Equivalent to glob.glob(os.path.join(parent_dir, pattern)) for
+    single-component patterns (hidden entries only match a leading "."),
+    but uses one os.scandir pass. Plain "<prefix>*" patterns (the derived
+    default) are matched with str.startswith instead of fnmatch.
+    """
+    if os.sep in pattern:
+        return glob.glob(os.path.join(parent_dir, pattern))
+
+    stem = pattern[:-1]
+    if pattern.endswith("*") and not any(c in stem for c in "*?["):
+        def matches(name: str) -> bool:
+            return name.startswith(stem)
+    else:
+        matches = re.compile(fnmatch.translate(pattern)).match
+
+    match_hidden = pattern.startswith(".")
+    try:
+        with os.scandir(parent_dir) as entries:
+            return [
+                entry.path for entry in entries
+                if (match_hidden or not entry.name.startswith("."))
+                and matches(entry.name)
+                and entry.is_dir()
+            ]
+    except OSError:
+        return []
 
 
 def discover_worktrees(config: dict) -> list[dict]:
@@ -1404,10 +1582,9 @@ def discover_worktrees(config: dict) -> list[dict]:
         root_name = os.path.basename(root)
         pattern = f"{root_name}.worktree-*"
 
-    # Build glob pattern in parent directory
+    # Match pattern against entries of the parent directory
     parent_dir = os.path.dirname(root)
-    glob_pattern = os.path.join(parent_dir, pattern)
-    candidates = glob.glob(glob_pattern)
+    candidates = _match_sibling_dirs(parent_dir, pattern)
 
     if not candidates:
         return []
@@ -1434,13 +1611,10 @@ def discover_worktrees(config: dict) -> list[dict]:
             return []
 
         # Parse valid worktree paths from output
-        valid_paths = set()
-        for line in result.stdout.strip().split("\n"):
-            if line:
-                # Format: /path/to/worktree  abc1234 [branch-name]
-                parts = line.split()
-                if parts:
-                    valid_paths.add(parts[0])
+        # Format: /path/to/worktree  abc1234 [branch-name]
+        valid_paths = {
+            line.partition(" ")[0] for line in result.stdout.splitlines() if line
+        }
     except subprocess.TimeoutExpired:
         logger.error(
             "Git worktree list timed out",
@@ -1463,14 +1637,14 @@ def discover_worktrees(config: dict) -> list[dict]:
     # Derive prefix for slug extraction (e.g., "my-project.worktree-")
     root_name = os.path.basename(root)
     prefix = f"{root_name}.worktree-"
+    # Use root basename for tab prefix (e.g., "MP" for my-project)
+    tab_prefix = generate_acronym(root_name).upper()
 
     tabs = []
     for path in sorted(candidates):
         if path in valid_paths:
             slug = extract_slug(path, prefix)
             acronym = generate_acronym(slug)
-            # Use root basename for tab prefix (e.g., "MP" for my-project)
-            tab_prefix = "".join(word[0].upper() for word in root_name.split("-") if word)
             tabs.append({"name": f"{tab_prefix}-{acronym}", "dir": path})
 
     return tabs
@@ -1502,6 +1676,28 @@ def get_enabled_scan_directories(prefs: dict) -> list[Path]:
     return enabled_dirs
 
 
+# Discovery caches, revalidated by directory mtime.
+# A directory's mtime changes only when entries are added/removed/renamed,
+# so unchanged scan dirs (and repos) skip the filesystem walk / git subprocess.
+# Both caches live in the persisted discovery cache (see preferences.py), so
+# they also carry over to the next launch.
+
+
+def _scan_cache_key(
+    scan_directories: list[Path], exclude_dirs: set[Path]
+) -> str | None:
+    """Build cache key from scan dir mtimes, or None if any dir can't be stat'ed."""
+    stamps = []
+    for base_dir in scan_directories:
+        try:
+            stamps.append([str(base_dir), base_dir.stat().st_mtime_ns])
+        except FileNotFoundError:
+            stamps.append([str(base_dir), None])
+        except OSError:
+            return None
+    return json.dumps([stamps, sorted(str(d) for d in exclude_dirs)])
+
+
 def discover_all_directories(
     scan_directories: list[Path] | None = None,
     exclude_dirs: set[Path] | None = None
@@ -1525,6 +1721,26 @@ def discover_all_directories(
     if exclude_dirs is None:
         exclude_dirs = set()
 
+    scan_cache = get_discovery_cache()["directory_scans"]
+    cache_key = _scan_cache_key(scan_directories, exclude_dirs)
+    cached = scan_cache.get(cache_key) if cache_key else None
+    # `git init` inside an existing folder (or deleting a repo's .git, or
+    # replacing it with a worktree .git file) doesn't touch the scan dir
+    # mtime, so re-check each cached entry's .git before trusting the entry
+    if cached is not None and (
+        any(os.path.lexists(os.path.join(f["dir"], ".git")) for f in cached["untracked"])
+        or not all(os.path.isdir(os.path.join(r["dir"], ".git")) for r in cached["repos"])
+    ):
+        cached = None
+    if cached is not None:
+        logger.debug(
+            "Directory discovery cache hit",
+            operation="discover_all_directories",
+            status="cached",
+            metrics={"repos_found": len(cached["repos"]), "untracked_found": len(cached["untracked"])}
+        )
+        return list(cached["repos"]), list(cached["untracked"])
+
     git_repos = []
     untracked = []
     op_trace_id = str(uuid4())
@@ -1537,34 +1753,61 @@ def discover_all_directories(
         discovery_dirs=[str(d) for d in scan_directories]
     )
 
+    # Stat each child's .git relative to an fd on the scan dir (fstatat)
+    # instead of resolving the full path from / for every child
+    use_dir_fd = os.stat in os.supports_dir_fd and os.scandir in os.supports_fd
+
     for base_dir in scan_directories:
-        if not base_dir.exists():
+        base_str = str(base_dir)
+        try:
+            dir_fd = os.open(base_str, os.O_RDONLY | os.O_DIRECTORY) if use_dir_fd else None
+        except FileNotFoundError:
             continue
 
-        for child in base_dir.iterdir():
-            if not child.is_dir():
-                continue
-            if child in exclude_dirs:
+        try:
+            # os.scandir entries carry the file type from readdir, so is_dir()
+            # needs no extra stat for regular dirs; one stat per child for .git
+            try:
+                entries = os.scandir(base_str if dir_fd is None else dir_fd)
+            except FileNotFoundError:
                 continue
-            # Skip hidden directories for untracked (but not for git repos)
-            is_hidden = child.name.startswith(".")
-
-            git_path = child / ".git"
-            if git_path.exists():
-                # Has .git - check if it's a repo (directory) or worktree (file)
-                if git_path.is_dir():
-                    # Real git repository
-                    git_repos.append({
-                        "name": child.name,
-                        "dir": str(child)
-                    })
-                # else: worktree (.git is file) - skip, discovered separately
-            elif not is_hidden:
-                # No .git and not hidden - untracked folder
-                untracked.append({
-                    "name": child.name,
-                    "dir": str(child)
-                })
+
+            with entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    # fd-based scandir yields bare names in entry.path
+                    entry_path = os.path.join(base_str, entry.name)
+                    if exclude_dirs and Path(entry_path) in exclude_dirs:
+                        continue
+
+                    try:
+                        if dir_fd is not None:
+                            git_mode = os.stat(f"{entry.name}/.git", dir_fd=dir_fd).st_mode
+                        else:
+                            git_mode = os.stat(os.path.join(entry_path, ".git")).st_mode
+                    except OSError:
+                        git_mode = None
+
+                    if git_mode is not None:
+                        # Has .git - check if it's a repo (directory) or worktree (file)
+                        if stat.S_ISDIR(git_mode):
+                            # Real git repository
+                            git_repos.append({
+                                "name": entry.name,
+                                "dir": entry_path
+                            })
+                        # else: worktree (.git is file) - skip, discovered separately
+                    elif not entry.name.startswith("."):
+                        # No .git and not hidden - untracked folder
+                        # (hidden directories are skipped for untracked, not for git repos)
+                        untracked.append({
+                            "name": entry.name,
+                            "dir": entry_path
+                        })
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
 
     duration_ms = int((time.perf_counter() - start_time) * 1000)
     logger.debug(
@@ -1579,10 +1822,16 @@ def discover_all_directories(
         }
     )
 
-    return (
-        sorted(git_repos, key=lambda x: x["name"]),
-        sorted(untracked, key=lambda x: x["name"])
-    )
+    git_repos = sorted(git_repos, key=lambda x: x["name"])
+    untracked = sorted(untracked, key=lambda x: x["name"])
+    if cache_key:
+        # Keep only the latest scan set (stale keys would never be hit again)
+        scan_cache.clear()
+        scan_cache[cache_key] = {"repos": git_repos, "untracked": untracked}
+        mark_discovery_cache_dirty()
+        save_discovery_cache()
+
+    return list(git_repos), list(untracked)
 
 
 def discover_git_repos(
@@ -1631,7 +1880,9 @@ def _discover_worktrees_for_repo(repo: dict) -> list[dict]:
     """
     Discover worktrees for a single git repository.
 
-    Internal helper for parallel execution.
+    Internal helper for parallel execution. Not cached: `git switch` in a
+    linked worktree only touches .git/worktrees/<id>/, so a stamp would need
+    about as many syscalls as re-reading the metadata.
 
     Args:
         repo: Dict with "name" and "dir" keys
@@ -1643,6 +1894,83 @@ def _discover_worktrees_for_repo(repo: dict) -> list[dict]:
     if not repo_path.exists():
         return []
 
+    worktrees = _read_repo_worktrees(repo, repo_path)
+    if worktrees is None:
+        worktrees = _list_repo_worktrees(repo, repo_path)
+    return worktrees or []
+
+
+def _read_repo_worktrees(repo: dict, repo_path: Path) -> list[dict] | None:
+    """
+    Read linked worktrees straight from .git/worktrees/<id>/ metadata.
+
+    Avoids a git subprocess per repo. Produces the same dicts as the
+    porcelain parser in _list_repo_worktrees: branch name from HEAD, or the
+    directory name for detached HEADs; entries whose directory is gone
+    (git's "prunable") are skipped.
+
+    Returns:
+        List of worktree dicts, or None if the metadata is unreadable and
+        the caller should fall back to `git worktree list`
+    """
+    worktrees_dir = os.path.join(repo_path, ".git", "worktrees")
+    try:
+        entries = sorted(os.scandir(worktrees_dir), key=lambda e: e.name)
+    except FileNotFoundError:
+        return []  # No linked worktrees
+    except OSError:
+        return None
+
+    abbrev = repo["name"][:2].upper()
+    worktrees = []
+    for entry in entries:
+        if not entry.is_dir():
+            continue
+        try:
+            with open(os.path.join(entry.path, "gitdir")) as f:
+                gitdir = f.read().strip()
+            with open(os.path.join(entry.path, "HEAD")) as f:
+                head = f.read().strip()
+        except FileNotFoundError:
+            continue  # Missing gitdir: git reports this worktree as prunable
+        except OSError:
+            return None
+
+        # gitdir points at <worktree>/.git (relative to this entry if
+        # worktree.useRelativePaths is set)
+        if not os.path.isabs(gitdir):
+            gitdir = os.path.normpath(os.path.join(entry.path, gitdir))
+        wt_dir = os.path.dirname(gitdir)
+        if not os.path.exists(gitdir):
+            continue  # Prunable: worktree directory was removed
+
+        if head.startswith("ref: "):
+            branch = head.split("/")[-1]
+            worktrees.append({
+                "dir": wt_dir,
+                "parent": repo["name"],
+                "name": f"{abbrev}.wt-{branch}",
+            })
+        else:
+            worktrees.append({
+                "dir": wt_dir,
+                "parent": repo["name"],
+                "name": f"{abbrev}.wt-{os.path.basename(wt_dir)}",
+                "detached": True,
+            })
+
+    return worktrees
+
+
+def _list_repo_worktrees(repo: dict, repo_path: Path) -> list[dict] | None:
+    """
+    Run `git worktree list --porcelain` for a repo and parse the output.
+
+    Fallback for _read_repo_worktrees when .git/worktrees can't be read.
+
+    Returns:
+        List of worktree dicts, or None if git failed
+    """
     try:
         result = subprocess.run(
             ["git", "worktree", "list", "--porcelain"],
@@ -1650,12 +1978,13 @@ def _discover_worktrees_for_repo(repo: dict) -> list[dict]:
             capture_output=True,
             text=True,
             check=True,
-            timeout=5  # Reduced timeout for parallel execution
+            timeout=3  # Short timeout: repos are scanned concurrently
         )
 
         worktrees = []
         current_worktree = {}
         is_prunable = False
+        is_main_worktree = True
 
         for line in result.stdout.split("\n"):
             if line.startswith("worktree "):
@@ -1664,15 +1993,14 @@ def _discover_worktrees_for_repo(repo: dict) -> list[dict]:
                 current_worktree = {}
                 is_prunable = False
 
-                wt_path = Path(line[9:])
-                if wt_path.resolve() == repo_path.resolve():
-                    current_worktree = {}
-                    continue
-                if not wt_path.is_dir():
-                    current_worktree = {}
+                # git always lists the main worktree (the repo itself) first,
+                # so skip it by position instead of resolving and comparing paths.
+                # Missing linked worktree dirs are reported as "prunable" below.
+                if is_main_worktree:
+                    is_main_worktree = False
                     continue
                 current_worktree = {
-                    "dir": str(wt_path),
+                    "dir": line[9:],
                     "parent": repo["name"]
                 }
             elif line.startswith("branch "):
@@ -1694,8 +2022,15 @@ def _discover_worktrees_for_repo(repo: dict) -> list[dict]:
 
         return worktrees
 
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-        return []
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+        logger.debug(
+            "git worktree list failed for repo",
+            operation="discover_all_worktrees",
+            repo=repo["name"],
+            error=str(e),
+            error_type=type(e).__name__
+        )
+        return None
 
 
 def discover_all_worktrees(git_repos: list[dict]) -> list[dict]:
@@ -1714,7 +2049,6 @@ def discover_all_worktrees(git_repos: list[dict]) -> list[dict]:
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
     start_time = time.perf_counter()
-    discovered = []
     op_trace_id = str(uuid4())
 
     logger.debug(
@@ -1729,31 +2063,38 @@ def discover_all_worktrees(git_repos: list[dict]) -> list[dict]:
     # Use max 16 workers to avoid overwhelming the system
     max_workers = min(16, len(git_repos)) if git_repos else 1
 
+    # Results are slotted by repo index so output order matches git_repos
+    # (stable across runs) regardless of which subprocess finishes first
+    per_repo: list[list[dict]] = [[] for _ in git_repos]
+
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(_discover_worktrees_for_repo, repo): repo for repo in git_repos}
+        futures = {
+            executor.submit(_discover_worktrees_for_repo, repo): idx
+            for idx, repo in enumerate(git_repos)
+        }
 
         for future in as_completed(futures):
+            idx = futures[future]
             try:
-                worktrees = future.result()
-                discovered.extend(worktrees)
+                per_repo[idx] = future.result()
             except (OSError, subprocess.SubprocessError, ValueError) as e:
-                repo = futures[future]
                 logger.warning(
                     "Failed to discover worktrees",
                     operation="discover_all_worktrees",
                     trace_id=op_trace_id,
-                    repo=repo["name"],
+                    repo=git_repos[idx]["name"],
                     error=str(e)
                 )
 
+    discovered = [wt for worktrees in per_repo for wt in worktrees]
+
     # Deduplicate by directory path (same worktree can be found from multiple repos)
-    seen_dirs = set()
-    unique_worktrees = []
+    # Worktree paths are absolute, so compare strings without resolve();
+    # setdefault keeps the first-seen entry (dicts preserve insertion order)
+    unique_by_dir: dict[str, dict] = {}
     for wt in discovered:
-        wt_dir = Path(wt["dir"]).resolve()
-        if wt_dir not in seen_dirs:
-            seen_dirs.add(wt_dir)
-            unique_worktrees.append(wt)
+        unique_by_dir.setdefault(wt["dir"], wt)
+    unique_worktrees = list(unique_by_dir.values())
 
     duration_ms = int((time.perf_counter() - start_time) * 1000)
     logger.debug(
@@ -1770,6 +2111,28 @@ def discover_all_worktrees(git_repos: list[dict]) -> list[dict]:
 
     return unique_worktrees
 
+
+def discover_scan_tree(
+    scan_directories: list[Path] | None = None,
+    exclude_dirs: set[Path] | None = None
+) -> tuple[list[dict], list[dict], list[dict]]:
+    """
+    Discover git repos, their worktrees, and untracked folders in one call.
+
+    Runs the single-pass directory scan, then worktree discovery over the
+    repos it found, so callers can hand the whole discovery to one worker
+    thread instead of scanning and then listing worktrees separately.
+
+    Args:
+        scan_directories: List of directories to scan (from preferences)
+        exclude_dirs: Set of paths to exclude (optional)
+
+    Returns:
+        Tuple of (git_repos, worktrees, untracked_folders)
+    """
+    git_repos, untracked = discover_all_directories(scan_directories, exclude_dirs)
+    return git_repos, discover_all_worktrees(git_repos), untracked
+
 # =============================================================================
 # Module: swiftdialog.py
 # =============================================================================
@@ -1799,27 +2162,49 @@ CATEGORY_ICONS = {
     "header_untracked": "SF=questionmark.folder,colour=gray,scale=large",
 }
 
-# Cached SwiftDialog path (None = not checked yet, False = not found)
-_swiftdialog_path_cache: str | None | bool = None
+# Home directory as a string, resolved once (used to shorten paths to ~)
+_HOME_STR = str(Path.home())
+
+
+def _shorten_home(path: str) -> str:
+    """Replace a leading home directory with ~ (prefix check, no full scan)."""
+    if path.startswith(_HOME_STR) and (
+        len(path) == len(_HOME_STR) or path[len(_HOME_STR)] == "/"
+    ):
+        return "~" + path[len(_HOME_STR):]
+    return path
 
 
+def _remember_swiftdialog_path(path: str) -> None:
+    """Persist the SwiftDialog path for the next launch."""
+    disk_cache = get_discovery_cache()
+    if disk_cache.get("swiftdialog_path") != path:
+        disk_cache["swiftdialog_path"] = path
+        mark_discovery_cache_dirty()
+        save_discovery_cache()
+
+
+@lru_cache(maxsize=1)
 def find_swiftdialog_path() -> str | None:
     """
     Find SwiftDialog binary across Intel and Apple Silicon Homebrew paths.
 
-    Search order:
+    Search order (after the path persisted by a previous launch):
     1. /opt/homebrew/bin/dialog (Apple Silicon Homebrew)
     2. /usr/local/bin/dialog (Intel Homebrew)
     3. shutil.which("dialog") (fallback to PATH)
 
+    The result is cached for the session (find_swiftdialog_path.cache_clear()
+    forces a fresh search).
+
     Returns:
         Path to SwiftDialog binary, or None if not found
     """
-    global _swiftdialog_path_cache
-
-    # Return cached result if already checked
-    if _swiftdialog_path_cache is not None:
-        return _swiftdialog_path_cache if _swiftdialog_path_cache else None
+    # Path found by a previous launch: one exists() check instead of a search
+    disk_cache = get_discovery_cache()
+    cached_path = disk_cache.get("swiftdialog_path")
+    if cached_path and os.path.exists(cached_path):
+        return cached_path
 
     # Search paths in order of preference
     search_paths = [
@@ -1828,8 +2213,8 @@ def find_swiftdialog_path() -> str | None:
     ]
 
     for path in search_paths:
-        if Path(path).exists():
-            _swiftdialog_path_cache = path
+        if os.path.exists(path):
+            _remember_swiftdialog_path(path)
             logger.debug(
                 "Found SwiftDialog",
                 path=path,
@@ -1840,7 +2225,7 @@ def find_swiftdialog_path() -> str | None:
     # Fallback to PATH lookup
     path_result = shutil.which("dialog")
     if path_result:
-        _swiftdialog_path_cache = path_result
+        _remember_swiftdialog_path(path_result)
         logger.debug(
             "Found SwiftDialog via PATH",
             path=path_result,
@@ -1849,7 +2234,6 @@ def find_swiftdialog_path() -> str | None:
         return path_result
 
     # Not found
-    _swiftdialog_path_cache = False
     logger.debug(
         "SwiftDialog not found",
         searched=search_paths,
@@ -1867,10 +2251,35 @@ def is_homebrew_available() -> bool:
     """
     Check if Homebrew is installed and available.
 
+    PATH lookup is cached for the session (Homebrew's install state doesn't
+    change mid-session).
+
     Returns:
         True if brew command is available in PATH
     """
-    return shutil.which("brew") is not None
+    return _which_cached("brew") is not None
+
+
+def swiftdialog_command(swiftdialog_bin: str, config: dict) -> list[str]:
+    """
+    Build the SwiftDialog argv for a config passed inline via --jsonstring.
+
+    The config is serialized compactly (no spaces after separators): the
+    text is only parsed by SwiftDialog, and large select/checkbox lists
+    shrink noticeably.
+
+    Args:
+        swiftdialog_bin: Path from find_swiftdialog_path()
+        config: Dialog configuration dict
+
+    Returns:
+        Command list for subprocess
+    """
+    return [
+        swiftdialog_bin,
+        "--jsonstring", json.dumps(config, separators=(",", ":")),
+        "--json",
+    ]
 
 
 def run_swiftdialog(config: dict) -> tuple[int, dict | None]:
@@ -1878,7 +2287,7 @@ def run_swiftdialog(config: dict) -> tuple[int, dict | None]:
     Run SwiftDialog with given configuration.
 
     Args:
-        config: Dialog configuration dict (will be written as JSON)
+        config: Dialog configuration dict (passed as JSON via --jsonstring)
 
     Returns:
         Tuple of (return_code, parsed_output_dict or None)
@@ -1894,44 +2303,28 @@ def run_swiftdialog(config: dict) -> tuple[int, dict | None]:
         logger.error("SwiftDialog not available", operation="run_swiftdialog")
         return (-1, None)
 
-    config_path = None
-    # Write config to temp file
+    # Pass config inline via --jsonstring (no temp file to create/clean up)
     try:
-        with tempfile.NamedTemporaryFile(
-            mode='w', suffix='.json', delete=False
-        ) as f:
-            json.dump(config, f)
-            config_path = f.name
-
-        # Run SwiftDialog
-        cmd = [swiftdialog_bin, "--jsonfile", config_path, "--json"]
+        cmd = swiftdialog_command(swiftdialog_bin, config)
         logger.debug(
             "Running SwiftDialog",
-            config_path=config_path,
             operation="run_swiftdialog"
         )
 
+        # stdout stays bytes: json.loads decodes UTF-8 itself.
+        # close_fds=False: Python's own fds are non-inheritable (PEP 446), so
+        # there is nothing to close and the spawn can take the posix_spawn path
+        # instead of looping close() up to the fd limit (same for the other
+        # SwiftDialog/osascript spawns)
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=600,  # 10 min timeout
-            check=False
+            check=False,
+            close_fds=False
         )
 
-        # Parse JSON output if available
-        output_dict = None
-        if result.stdout.strip():
-            try:
-                output_dict = json.loads(result.stdout)
-            except json.JSONDecodeError:
-                logger.warning(
-                    "Could not parse SwiftDialog output",
-                    stdout=result.stdout[:200],
-                    operation="run_swiftdialog"
-                )
-
-        return (result.returncode, output_dict)
+        return (result.returncode, _parse_swiftdialog_output(result.stdout, "run_swiftdialog"))
 
     except subprocess.TimeoutExpired:
         logger.error("SwiftDialog timed out", operation="run_swiftdialog")
@@ -1943,49 +2336,105 @@ def run_swiftdialog(config: dict) -> tuple[int, dict | None]:
             operation="run_swiftdialog"
         )
         return (-1, None)
-    finally:
-        # Clean up temp file
-        if config_path:
-            try:
-                Path(config_path).unlink(missing_ok=True)
-            except OSError as e:
-                logger.debug(
-                    "Could not delete temp config file",
-                    path=config_path,
-                    error=str(e),
-                    operation="run_swiftdialog"
-                )
 
 
-def format_tab_label(path: str, name: str, wrap_threshold: int = 50) -> str:
+async def run_swiftdialog_async(config: dict, timeout: float = 600) -> tuple[int, dict | None]:
     """
-    Format tab label as 'shorthand (path)' with shorthand name prominent.
-
-    If path exceeds wrap_threshold characters, it wraps to a second line
-    to avoid clipping by SwiftDialog's 700px checkbox area limit.
+    Run SwiftDialog without blocking the event loop.
 
-    Note: SwiftDialog checkbox area is hardcoded to 700px max width in its
-    source code (dataEntryMaxWidth in MessageContentView.swift).
+    Async counterpart of run_swiftdialog: awaits the dialog process via
+    asyncio.create_subprocess_exec instead of holding an executor thread
+    for the dialog's lifetime.
 
     Args:
-        path: Directory path (will be shortened with ~ for home)
-        name: Shorthand name (displayed first, prominently)
-        wrap_threshold: Path length at which to wrap to second line (default 50)
+        config: Dialog configuration dict (passed as JSON via --jsonstring)
+        timeout: Seconds before the dialog is killed (default 10 min)
 
     Returns:
-        Formatted label string: "shorthand (path)" or "shorthand\\n(path)" if long
+        Tuple of (return_code, parsed_output_dict or None), with the same
+        return codes as run_swiftdialog
     """
-    # Replace home directory with ~
-    path_display = path.replace(str(Path.home()), "~")
+    swiftdialog_bin = find_swiftdialog_path()
+    if not swiftdialog_bin:
+        logger.error("SwiftDialog not available", operation="run_swiftdialog_async")
+        return (-1, None)
 
-    # Wrap long paths to second line to avoid clipping
-    if len(path_display) > wrap_threshold:
-        return f"{name}\n({path_display})"
+    cmd = swiftdialog_command(swiftdialog_bin, config)
+    logger.debug(
+        "Running SwiftDialog",
+        operation="run_swiftdialog_async"
+    )
 
-    return f"{name} ({path_display})"
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False
+        )
+    except OSError as e:
+        logger.error(
+            "SwiftDialog OS error",
+            error=str(e),
+            operation="run_swiftdialog_async"
+        )
+        return (-1, None)
 
-# =============================================================================
-# Module: layout_toggle.py
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except TimeoutError:
+        proc.kill()
+        await proc.wait()
+        logger.error("SwiftDialog timed out", operation="run_swiftdialog_async")
+        return (4, None)
+
+    return (proc.returncode, _parse_swiftdialog_output(stdout, "run_swiftdialog_async"))
+
+
+def _parse_swiftdialog_output(stdout: bytes, operation: str) -> dict | None:
+    """Parse SwiftDialog's raw --json output, or None if empty/invalid."""
+    if not stdout or stdout.isspace():
+        return None
+    try:
+        return json.loads(stdout)
+    except ValueError:  # JSONDecodeError or invalid UTF-8
+        logger.warning(
+            "Could not parse SwiftDialog output",
+            stdout=stdout[:200].decode(errors="replace"),
+            operation=operation
+        )
+        return None
+
+
+def format_tab_label(path: str, name: str, wrap_threshold: int = 50) -> str:
+    """
+    Format tab label as 'shorthand (path)' with shorthand name prominent.
+
+    If path exceeds wrap_threshold characters, it wraps to a second line
+    to avoid clipping by SwiftDialog's 700px checkbox area limit.
+
+    Note: SwiftDialog checkbox area is hardcoded to 700px max width in its
+    source code (dataEntryMaxWidth in MessageContentView.swift).
+
+    Args:
+        path: Directory path (will be shortened with ~ for home)
+        name: Shorthand name (displayed first, prominently)
+        wrap_threshold: Path length at which to wrap to second line (default 50)
+
+    Returns:
+        Formatted label string: "shorthand (path)" or "shorthand\\n(path)" if long
+    """
+    # Replace home directory with ~
+    path_display = _shorten_home(path)
+
+    # Wrap long paths to second line to avoid clipping
+    if len(path_display) > wrap_threshold:
+        return f"{name}\n({path_display})"
+
+    return f"{name} ({path_display})"
+
+# =============================================================================
+# Module: layout_toggle.py
 # =============================================================================
 
 # ruff: noqa: F821
@@ -1997,7 +2446,7 @@ def format_tab_label(path: str, name: str, wrap_threshold: int = 50) -> str:
 # =============================================================================
 
 
-def show_manage_layouts_swiftdialog(
+async def show_manage_layouts_swiftdialog(
     layouts: list[dict],
     disabled_layouts: list[str]
 ) -> list[str] | None:
@@ -2009,7 +2458,8 @@ def show_manage_layouts_swiftdialog(
         disabled_layouts: Current list of disabled workspace names
 
     Returns:
-        Updated list of disabled workspace names, or None if cancelled
+        Updated list of disabled workspace names (the disabled_layouts
+        object itself if nothing changed), or None if cancelled
     """
     if not layouts:
         logger.warning(
@@ -2019,9 +2469,10 @@ def show_manage_layouts_swiftdialog(
         return None
 
     # Build checkboxes: checked = ENABLED (will show in selector)
+    disabled_set = frozenset(disabled_layouts)
     checkboxes = []
     for layout in layouts:
-        is_enabled = layout["name"] not in disabled_layouts
+        is_enabled = layout["name"] not in disabled_set
         checkboxes.append({
             "label": layout["display"],
             "checked": is_enabled,
@@ -2060,7 +2511,7 @@ def show_manage_layouts_swiftdialog(
         disabled_count=len(disabled_layouts)
     )
 
-    return_code, output = run_swiftdialog(dialog_config)
+    return_code, output = await run_swiftdialog_async(dialog_config)
 
     if return_code == 2:
         logger.debug(
@@ -2086,6 +2537,15 @@ def show_manage_layouts_swiftdialog(
         if not is_checked:
             new_disabled.append(layout["name"])
 
+    # Saved without edits: hand back the input list itself so the caller
+    # can detect "no change" by identity and skip the preferences write
+    if sorted(new_disabled) == sorted(disabled_layouts):
+        logger.debug(
+            "Workspaces unchanged",
+            operation="show_manage_layouts_swiftdialog"
+        )
+        return disabled_layouts
+
     logger.info(
         "Workspaces updated",
         operation="show_manage_layouts_swiftdialog",
@@ -2110,7 +2570,7 @@ async def show_manage_layouts(
         prefs: Current preferences dict
 
     Returns:
-        Updated preferences dict, or None if cancelled
+        Updated preferences dict, or None if cancelled or unchanged
     """
     if not is_swiftdialog_available():
         logger.warning(
@@ -2121,23 +2581,13 @@ async def show_manage_layouts(
 
     disabled_layouts = prefs.get("disabled_layouts", [])
 
-    # Run SwiftDialog in executor (non-blocking)
-    loop = asyncio.get_event_loop()
-    new_disabled = await loop.run_in_executor(
-        None,
-        show_manage_layouts_swiftdialog,
-        layouts,
-        disabled_layouts
-    )
+    new_disabled = await show_manage_layouts_swiftdialog(layouts, disabled_layouts)
 
-    if new_disabled is None:
-        return None
+    if new_disabled is None or new_disabled is disabled_layouts:
+        return None  # Cancelled or unchanged: nothing to save
 
     # Update preferences with new disabled list
-    updated_prefs = prefs.copy()
-    updated_prefs["disabled_layouts"] = new_disabled
-
-    return updated_prefs
+    return {**prefs, "disabled_layouts": new_disabled}
 
 # =============================================================================
 # Module: scan_dirs.py
@@ -2151,6 +2601,34 @@ async def show_manage_layouts(
 # Directory Management
 # =============================================================================
 
+# Fixed AppleScript source: the prompt arrives as a run-handler argument
+# (argv), so it is never spliced into code and needs no quoting
+_CHOOSE_FOLDER_SCRIPT = [
+    "-e", "on run argv",
+    "-e", "return POSIX path of (choose folder with prompt (item 1 of argv))",
+    "-e", "end run",
+]
+
+
+# Static part of the directory management dialog config (built once)
+_DIR_DIALOG_BASE = {
+    "title": "Manage Scan Directories",
+    "messagefont": "size=13",
+    "appearance": "dark",  # Force dark mode for consistent toggle colors
+    "icon": "SF=folder.badge.gearshape,colour=blue",
+    "iconsize": "50",
+    "checkboxstyle": {
+        "style": "switch",
+        "size": "regular"
+    },
+    "button1text": "Save",
+    "button2text": "Cancel",
+    "width": "700",
+    "moveable": True,
+    "ontop": True,
+    "json": True
+}
+
 
 def choose_folder_native(prompt: str = "Select a folder:") -> str | None:
     """
@@ -2165,17 +2643,15 @@ def choose_folder_native(prompt: str = "Select a folder:") -> str | None:
     Returns:
         Selected folder path, or None if cancelled
     """
-    # Build AppleScript command
-    # Use shlex.quote to handle special characters in prompt
-    applescript = f'POSIX path of (choose folder with prompt "{prompt}")'
-
     try:
         result = subprocess.run(
-            ["osascript", "-e", applescript],
-            capture_output=True,
+            ["osascript", *_CHOOSE_FOLDER_SCRIPT, prompt],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,  # Cancel message (-128) is never read
             text=True,
             timeout=120,
-            check=False
+            check=False,
+            close_fds=False
         )
 
         if result.returncode == 0 and result.stdout.strip():
@@ -2210,7 +2686,7 @@ def choose_folder_native(prompt: str = "Select a folder:") -> str | None:
         return None
 
 
-def show_directory_management_swiftdialog(
+async def show_directory_management_swiftdialog(
     current_dirs: list[dict]
 ) -> list[dict] | None:
     """
@@ -2218,7 +2694,7 @@ def show_directory_management_swiftdialog(
 
     Features:
     - Checkboxes for existing directories (unchecked = DELETE from list)
-    - "Add Folder" button triggers native macOS folder picker (up to 3 per session)
+    - Folder-select textfields to add up to 3 directories in the same dialog
     - Wider window with smaller font for full path visibility
     - All directories (including defaults) can be deleted
 
@@ -2228,12 +2704,12 @@ def show_directory_management_swiftdialog(
     Returns:
         Updated list of directory configs (only checked items), or None if cancelled
     """
+    from concurrent.futures import ThreadPoolExecutor
 
     op_trace_id = str(uuid4())
 
     # Filter to only enabled directories for display
     working_dirs = [d.copy() for d in current_dirs if d.get("enabled", True)]
-    folders_added_this_session = 0
     max_folders_per_session = 3
 
     logger.info(
@@ -2244,194 +2720,170 @@ def show_directory_management_swiftdialog(
         metrics={"current_dirs": len(working_dirs)}
     )
 
-    # Loop to handle "Add Folder" button clicks
-    while True:
-        # Build checkboxes for current directories
-        checkboxes = [
-            {
-                "label": "─── Directories (uncheck to delete) ───",
-                "checked": False,
-                "disabled": True,
-                "icon": CATEGORY_ICONS["header_repo"]
-            }
-        ]
+    # Build checkboxes for current directories
+    checkboxes = [
+        {
+            "label": "─── Directories (uncheck to delete) ───",
+            "checked": False,
+            "disabled": True,
+            "icon": CATEGORY_ICONS["header_repo"]
+        }
+    ]
 
-        for scan_dir in working_dirs:
-            path = scan_dir["path"]
-            expanded = Path(path).expanduser()
-            exists = expanded.exists()
-            display_path = str(expanded) if not path.startswith("~") else path
+    # (scan_dir, expanded, display_path) per directory, reused to parse output
+    rows = []
+    for scan_dir in working_dirs:
+        path = scan_dir["path"]
+        expanded = os.path.expanduser(path)
+        display_path = path if path.startswith("~") else expanded
+        rows.append((scan_dir, expanded, display_path))
+
+    # Probe existence concurrently: a slow volume (network mount, sleeping
+    # external disk) would otherwise stall every directory after it
+    expanded_paths = [expanded for _, expanded, _ in rows]
+    if len(expanded_paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(expanded_paths))) as executor:
+            exists_flags = list(executor.map(os.path.exists, expanded_paths))
+    else:
+        exists_flags = [os.path.exists(p) for p in expanded_paths]
 
-            checkboxes.append({
-                "label": display_path,
-                "checked": True,
-                "icon": CATEGORY_ICONS["additional_repo"] if exists else CATEGORY_ICONS["missing_path"]
-            })
+    icon_present = CATEGORY_ICONS["additional_repo"]
+    icon_missing = CATEGORY_ICONS["missing_path"]
+    for (_, _, display_path), exists in zip(rows, exists_flags):
+        checkboxes.append({
+            "label": display_path,
+            "checked": True,
+            "icon": icon_present if exists else icon_missing
+        })
 
-        # Calculate dynamic height
-        num_checkboxes = len(checkboxes)
-        base_height = 160
-        checkbox_height = num_checkboxes * 40
-        calculated_height = base_height + checkbox_height
-        dialog_height = max(300, min(700, calculated_height))
+    # Folder-select fields for new directories: picked in this same dialog,
+    # so adding folders doesn't tear down and relaunch SwiftDialog
+    add_field_titles = [f"Add folder {i}" for i in range(1, max_folders_per_session + 1)]
+    textfields = [
+        {"title": title, "fileselect": True, "filetype": "folder", "prompt": "Optional"}
+        for title in add_field_titles
+    ]
 
-        # Determine if Add Folder button should be enabled
-        can_add_more = folders_added_this_session < max_folders_per_session
-        add_button_text = f"+ Add Folder ({max_folders_per_session - folders_added_this_session} left)"
+    # Calculate dynamic height (~45px per textfield, as in the rename dialog)
+    num_checkboxes = len(checkboxes)
+    base_height = 160
+    checkbox_height = num_checkboxes * 40
+    calculated_height = base_height + checkbox_height + len(textfields) * 45
+    dialog_height = max(300, min(800, calculated_height))
 
-        # Build dialog config
-        dialog_config = {
-            "title": "Manage Scan Directories",
-            "message": f"**Checked** = keep, **Unchecked** = delete.\n{len(working_dirs)} directories configured.",
-            "messagefont": "size=13",
-            "appearance": "dark",  # Force dark mode for consistent toggle colors
-            "icon": "SF=folder.badge.gearshape,colour=blue",
-            "iconsize": "50",
-            "checkbox": checkboxes,
-            "checkboxstyle": {
-                "style": "switch",
-                "size": "regular"
-            },
-            "button1text": "Save",
-            "button2text": "Cancel",
-            "height": str(dialog_height),
-            "width": "700",
-            "moveable": True,
-            "ontop": True,
-            "json": True
-        }
+    # Build dialog config: fixed keys from _DIR_DIALOG_BASE plus per-session fields
+    dialog_config = {
+        **_DIR_DIALOG_BASE,
+        "message": (
+            f"**Checked** = keep, **Unchecked** = delete.\n{len(working_dirs)} directories configured. "
+            f"Use the fields below to add up to {max_folders_per_session} more."
+        ),
+        "checkbox": checkboxes,
+        "textfield": textfields,
+        "height": str(dialog_height),
+    }
 
-        # Add "Add Folder" button if allowed (no action - we handle return code 3)
-        if can_add_more:
-            dialog_config["infobuttontext"] = add_button_text
+    return_code, output = await run_swiftdialog_async(dialog_config, timeout=300)
 
-        try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump(dialog_config, f)
-                config_path = f.name
-
-            swiftdialog_bin = find_swiftdialog_path()
-            cmd = [swiftdialog_bin, "--jsonfile", config_path, "--json"]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-                check=False
-            )
+    # Return code 4 = timeout, -1 = SwiftDialog missing or failed to launch
+    # (both already logged by run_swiftdialog_async)
+    if return_code in (4, -1):
+        logger.debug(
+            "Directory management dialog did not complete",
+            operation="show_directory_management",
+            status="timeout" if return_code == 4 else "exec_error",
+            trace_id=op_trace_id
+        )
+        return None
 
-            Path(config_path).unlink(missing_ok=True)
+    # Return code 2 = Cancel
+    if return_code == 2:
+        logger.info(
+            "Directory management cancelled",
+            operation="show_directory_management",
+            status="cancelled",
+            trace_id=op_trace_id
+        )
+        return None
 
-            # Return code 3 = info button clicked (Add Folder)
-            if result.returncode == 3:
-                logger.debug(
-                    "Add Folder button clicked",
-                    operation="show_directory_management",
-                    trace_id=op_trace_id
-                )
-                # Show folder input dialog
-                new_folder = choose_folder_native("Select folder to add:")
-                if new_folder and Path(new_folder).expanduser().exists():
-                    # Convert to ~ format
-                    home = str(Path.home())
-                    if new_folder.startswith(home):
-                        new_folder = "~" + new_folder[len(home):]
-
-                    # Check if already in list
-                    existing_paths = {d["path"] for d in working_dirs}
-                    if new_folder not in existing_paths:
-                        working_dirs.append({"path": new_folder, "enabled": True})
-                        folders_added_this_session += 1
-                        logger.info(
-                            "Folder added via native picker",
-                            operation="show_directory_management",
-                            trace_id=op_trace_id,
-                            new_path=new_folder
-                        )
-                        # Return immediately with updated list (don't re-show dialog)
-                        return working_dirs
-                # User cancelled folder picker - return to main dialog
-                continue
+    # Return code 0 or 5 = Save
+    if return_code not in (0, 5):
+        logger.error(
+            "SwiftDialog failed",
+            operation="show_directory_management",
+            status="failed",
+            trace_id=op_trace_id,
+            return_code=return_code
+        )
+        return None
 
-            # Return code 2 = Cancel
-            if result.returncode == 2:
-                logger.info(
-                    "Directory management cancelled",
-                    operation="show_directory_management",
-                    status="cancelled",
-                    trace_id=op_trace_id
-                )
-                return None
+    # Empty or unparseable output: keep the current list rather than
+    # treating every directory as unchecked
+    if output is None:
+        return None
 
-            # Return code 0 or 5 = Save
-            if result.returncode not in (0, 5):
-                logger.error(
-                    "SwiftDialog failed",
-                    operation="show_directory_management",
-                    status="failed",
-                    trace_id=op_trace_id,
-                    return_code=result.returncode
-                )
-                return None
+    # Build final list - only keep checked items
+    updated_dirs = []
+    deleted_paths = []
+    for scan_dir, _, display_path in rows:
+        path = scan_dir["path"]
+        is_checked = output.get(display_path, False)
+        if isinstance(is_checked, dict):
+            is_checked = is_checked.get("checked", False)
+
+        if is_checked:
+            updated_dirs.append({"path": path, "enabled": True})
+        else:
+            deleted_paths.append(path)
 
-            # Parse output
-            try:
-                output = json.loads(result.stdout) if result.stdout.strip() else {}
-            except json.JSONDecodeError:
-                return None
-
-            # Build final list - only keep checked items
-            updated_dirs = []
-            for scan_dir in working_dirs:
-                path = scan_dir["path"]
-                expanded = Path(path).expanduser()
-                display_path = str(expanded) if not path.startswith("~") else path
-
-                is_checked = output.get(display_path, False)
-                if isinstance(is_checked, dict):
-                    is_checked = is_checked.get("checked", False)
-
-                if is_checked:
-                    updated_dirs.append({"path": path, "enabled": True})
-                else:
-                    logger.info(
-                        "Directory deleted",
-                        operation="show_directory_management",
-                        trace_id=op_trace_id,
-                        deleted_path=path
-                    )
+    if deleted_paths:
+        logger.info(
+            "Directories deleted",
+            operation="show_directory_management",
+            trace_id=op_trace_id,
+            deleted_paths=deleted_paths
+        )
 
-            logger.info(
-                "Directory management complete",
+    # Append folders chosen in the add fields
+    known_paths = {d["path"] for d in working_dirs}
+    folders_added = 0
+    for title in add_field_titles:
+        new_folder = output.get(title)
+        if not isinstance(new_folder, str) or not new_folder.strip():
+            continue
+        new_folder = new_folder.strip().rstrip("/")
+        if not os.path.isdir(os.path.expanduser(new_folder)):
+            logger.warning(
+                "Ignoring added folder that does not exist",
                 operation="show_directory_management",
-                status="success",
                 trace_id=op_trace_id,
-                metrics={"total_dirs": len(updated_dirs), "added": folders_added_this_session}
+                new_path=new_folder
             )
+            continue
 
-            return updated_dirs
+        # Convert to ~ format
+        new_folder = _shorten_home(new_folder)
+        if new_folder in known_paths:
+            continue
+        known_paths.add(new_folder)
+        updated_dirs.append({"path": new_folder, "enabled": True})
+        folders_added += 1
+        logger.info(
+            "Folder added",
+            operation="show_directory_management",
+            trace_id=op_trace_id,
+            new_path=new_folder
+        )
 
-        except subprocess.TimeoutExpired:
-            logger.error(
-                "SwiftDialog timed out",
-                operation="show_directory_management",
-                status="timeout",
-                trace_id=op_trace_id
-            )
-            Path(config_path).unlink(missing_ok=True)
-            return None
+    logger.info(
+        "Directory management complete",
+        operation="show_directory_management",
+        status="success",
+        trace_id=op_trace_id,
+        metrics={"total_dirs": len(updated_dirs), "added": folders_added}
+    )
 
-        except (OSError, subprocess.SubprocessError) as e:
-            logger.error(
-                "SwiftDialog execution failed",
-                operation="show_directory_management",
-                status="exec_error",
-                trace_id=op_trace_id,
-                error=str(e)
-            )
-            Path(config_path).unlink(missing_ok=True)
-            return None
+    return updated_dirs
 
 
 async def show_directory_management(prefs: dict) -> dict | None:
@@ -2455,22 +2907,13 @@ async def show_directory_management(prefs: dict) -> dict | None:
 
     current_dirs = prefs.get("scan_directories", DEFAULT_SCAN_DIRECTORIES.copy())
 
-    # Run SwiftDialog in executor (non-blocking)
-    loop = asyncio.get_event_loop()
-    updated_dirs = await loop.run_in_executor(
-        None,
-        show_directory_management_swiftdialog,
-        current_dirs
-    )
+    updated_dirs = await show_directory_management_swiftdialog(current_dirs)
 
     if updated_dirs is None:
         return None
 
     # Update preferences with new directories
-    updated_prefs = prefs.copy()
-    updated_prefs["scan_directories"] = updated_dirs
-
-    return updated_prefs
+    return {**prefs, "scan_directories": updated_dirs}
 
 # =============================================================================
 # Module: setup_wizard.py
@@ -2484,6 +2927,51 @@ async def show_directory_management(prefs: dict) -> dict | None:
 # Setup Wizard
 # =============================================================================
 
+# Entry names per config directory, listed once per launch (None = directory
+# missing). needs_migration() and is_first_run() run back-to-back at startup
+# and share these listings instead of globbing the same directories again.
+_config_dir_names: dict[Path, list[str] | None] = {}
+
+
+def _list_config_dir(directory: Path) -> list[str] | None:
+    """
+    List entry names in a config directory, cached for the session.
+
+    Returns:
+        Sorted entry names, or None if the directory doesn't exist
+    """
+    if directory not in _config_dir_names:
+        try:
+            with os.scandir(directory) as entries:
+                _config_dir_names[directory] = sorted(entry.name for entry in entries)
+        except (FileNotFoundError, NotADirectoryError):
+            _config_dir_names[directory] = None
+    return _config_dir_names[directory]
+
+
+# Whether PATHS.config_dir has been created this session
+_config_dir_ready = False
+
+
+def _ensure_config_dir() -> None:
+    """Create the config directory once per session."""
+    global _config_dir_ready
+    if not _config_dir_ready:
+        PATHS.config_dir.mkdir(parents=True, exist_ok=True)
+        _config_dir_ready = True
+
+
+# Config file name matchers, compiled once from the glob patterns: a single
+# regex match per name instead of fnmatch's per-call normcase + cache lookup
+_is_workspace_name = re.compile(fnmatch.translate(WORKSPACE_PATTERN)).match
+_is_legacy_layout_name = re.compile(fnmatch.translate(LEGACY_LAYOUT_PATTERN)).match
+
+
+def _config_files_matching(directory: Path, is_match: Callable) -> list[Path]:
+    """Return paths in directory whose names satisfy is_match (cached listing)."""
+    names = _list_config_dir(directory) or []
+    return [directory / name for name in names if is_match(name)]
+
 
 def needs_migration() -> bool:
     """
@@ -2497,32 +2985,45 @@ def needs_migration() -> bool:
         True if migration should be offered
     """
     # Check if legacy config exists
-    if not LEGACY_CONFIG_DIR.exists():
+    legacy_names = _list_config_dir(PATHS.legacy_config_dir)
+    if legacy_names is None:
         return False
 
     # Check if legacy has layout files
-    legacy_layouts = list(LEGACY_CONFIG_DIR.glob(LEGACY_LAYOUT_PATTERN))
-    legacy_prefs = LEGACY_PREFERENCES_PATH.exists()
+    legacy_layouts = _config_files_matching(PATHS.legacy_config_dir, _is_legacy_layout_name)
+    legacy_prefs = PATHS.legacy_preferences.name in legacy_names
 
     if not legacy_layouts and not legacy_prefs:
         return False
 
-    # Check if new config already has workspace files
-    if CONFIG_DIR.exists():
-        new_workspaces = list(CONFIG_DIR.glob(WORKSPACE_PATTERN))
-        if new_workspaces:
-            return False  # Already migrated or new config exists
+    # Check if new config already has workspace files (stop at the first match;
+    # no Path objects built)
+    config_names = _list_config_dir(PATHS.config_dir) or []
+    if any(_is_workspace_name(name) for name in config_names):
+        return False  # Already migrated or new config exists
 
     logger.debug(
         "Migration needed from legacy config",
         operation="needs_migration",
-        legacy_dir=str(LEGACY_CONFIG_DIR),
+        legacy_dir=str(PATHS.legacy_config_dir),
         legacy_layouts=len(legacy_layouts),
         legacy_prefs=legacy_prefs
     )
     return True
 
 
+def _copy_config_file(src: Path, dst: Path) -> None:
+    """
+    Copy a config file, keeping its timestamps.
+
+    Lighter than shutil.copy2: TOML configs need their contents and mtime,
+    not the mode/flags/xattr copying that copystat adds per file.
+    """
+    shutil.copyfile(src, dst)
+    st = os.stat(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
 def migrate_config_files() -> tuple[int, int]:
     """
     Migrate files from legacy to new config directory.
@@ -2534,21 +3035,21 @@ def migrate_config_files() -> tuple[int, int]:
     Returns:
         Tuple of (layouts_migrated, prefs_migrated)
     """
-
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_config_dir()
 
     layouts_migrated = 0
     prefs_migrated = 0
 
     # Migrate layout files
-    for legacy_path in LEGACY_CONFIG_DIR.glob(LEGACY_LAYOUT_PATTERN):
-        # layout-foo.toml -> workspace-foo.toml
+    for legacy_path in _config_files_matching(PATHS.legacy_config_dir, _is_legacy_layout_name):
+        # layout-foo.toml -> workspace-foo.toml (swap the prefix only;
+        # str.replace would also rewrite "layout-" inside the name)
         old_name = legacy_path.name
-        new_name = old_name.replace("layout-", "workspace-")
-        new_path = CONFIG_DIR / new_name
+        new_name = "workspace-" + old_name[len("layout-"):]
+        new_path = PATHS.config_dir / new_name
 
-        if not new_path.exists():
-            shutil.copy2(legacy_path, new_path)
+        if not os.path.lexists(new_path):
+            _copy_config_file(legacy_path, new_path)
             layouts_migrated += 1
             logger.info(
                 "Migrated layout file",
@@ -2558,16 +3059,19 @@ def migrate_config_files() -> tuple[int, int]:
             )
 
     # Migrate preferences
-    if LEGACY_PREFERENCES_PATH.exists() and not PREFERENCES_PATH.exists():
-        shutil.copy2(LEGACY_PREFERENCES_PATH, PREFERENCES_PATH)
+    if PATHS.legacy_preferences.exists() and not PATHS.preferences.exists():
+        _copy_config_file(PATHS.legacy_preferences, PATHS.preferences)
         prefs_migrated = 1
         logger.info(
             "Migrated preferences file",
             operation="migrate_config_files",
-            old_path=str(LEGACY_PREFERENCES_PATH),
-            new_path=str(PREFERENCES_PATH)
+            old_path=str(PATHS.legacy_preferences),
+            new_path=str(PATHS.preferences)
         )
 
+    # New config dir contents changed: drop its cached listing
+    _config_dir_names.pop(PATHS.config_dir, None)
+
     return layouts_migrated, prefs_migrated
 
 
@@ -2583,14 +3087,14 @@ async def run_migration_wizard(connection, window) -> bool:
         True if migration completed, False if skipped/cancelled
     """
     # Count legacy files
-    legacy_layouts = list(LEGACY_CONFIG_DIR.glob(LEGACY_LAYOUT_PATTERN))
+    legacy_layouts = _config_files_matching(PATHS.legacy_config_dir, _is_legacy_layout_name)
 
     migrate_alert = iterm2.Alert(
         "Migrate Configuration?",
         f"Found {len(legacy_layouts)} workspace(s) in legacy location:\n"
-        f"  {LEGACY_CONFIG_DIR}\n\n"
+        f"  {PATHS.legacy_config_dir}\n\n"
         f"Migrate to new location?\n"
-        f"  {CONFIG_DIR}\n\n"
+        f"  {PATHS.config_dir}\n\n"
         "Your original files will be kept as backup.",
         window_id=window.window_id
     )
@@ -2613,7 +3117,7 @@ async def run_migration_wizard(connection, window) -> bool:
         "Migration Complete",
         f"Migrated {layouts_migrated} workspace(s) and "
         f"{prefs_migrated} preference file(s).\n\n"
-        f"New location: {CONFIG_DIR}\n\n"
+        f"New location: {PATHS.config_dir}\n\n"
         "Original files kept in legacy location.",
         window_id=window.window_id
     )
@@ -2636,37 +3140,50 @@ def is_first_run() -> bool:
     Detect if this is the first run for a new user.
 
     Returns True if:
-    - No workspace-*.toml files exist in CONFIG_DIR
+    - No workspace-*.toml files exist in PATHS.config_dir
     - No legacy layout.toml exists
     - No preferences.toml exists
 
     Returns:
         True if this appears to be a first-time run
     """
-    # Check for any layout files
-    layout_files = list(CONFIG_DIR.glob(WORKSPACE_PATTERN))
-    if layout_files:
-        return False
-
-    # Check for legacy layout.toml
-    legacy_layout = CONFIG_DIR / "layout.toml"
-    if legacy_layout.exists():
-        return False
-
-    # Check for preferences (indicates previous use)
-    if PREFERENCES_PATH.exists():
-        return False
+    # One pass over the (cached) listing, stopping at the first file that
+    # indicates previous use: a workspace file, legacy layout.toml, or
+    # preferences.toml
+    markers = {"layout.toml", PATHS.preferences.name}
+    for name in _list_config_dir(PATHS.config_dir) or []:
+        if name in markers or _is_workspace_name(name):
+            return False
 
     logger.debug(
         "First-run detected",
         operation="is_first_run",
-        config_dir=str(CONFIG_DIR),
+        config_dir=str(PATHS.config_dir),
         layout_files_count=0
     )
     return True
 
 
-def generate_default_layout_content(home_dir: bool = True, project_dir: str | None = None) -> str:
+# Invariant parts of the generated layout file (blocks are joined by a
+# blank line in generate_default_layout_content)
+_DEFAULT_LAYOUT_HEADER = (
+    b"# Workspace Launcher Configuration\n"
+    b"# Auto-generated by first-run wizard\n"
+    b"# Edit this file to customize your workspace tabs\n"
+    b"\n"
+    b"[layout]\n"
+    b"left_pane_ratio = 0.25\n"
+    b"settle_time = 0.3\n"
+    b"\n"
+    b"[commands]\n"
+    b"# Safe defaults - customize after verifying tool availability\n"
+    b'left = "ls -la"    # Try: br --sort-by-type-dirs-first (requires broot)\n'
+    b'right = "zsh"      # Try: css (requires Claude Code)\n'
+)
+_DEFAULT_HOME_TAB = b'[[tabs]]\nname = "home"\ndir = "~"\n'
+
+
+def generate_default_layout_content(home_dir: bool = True, project_dir: str | None = None) -> bytes:
     """
     Generate default layout TOML content.
 
@@ -2675,47 +3192,20 @@ def generate_default_layout_content(home_dir: bool = True, project_dir: str | No
         project_dir: Optional project directory to include
 
     Returns:
-        TOML content string
+        TOML content as UTF-8 bytes (written as-is by atomic_write_file)
     """
-    lines = [
-        "# Workspace Launcher Configuration",
-        "# Auto-generated by first-run wizard",
-        "# Edit this file to customize your workspace tabs",
-        "",
-        "[layout]",
-        "left_pane_ratio = 0.25",
-        "settle_time = 0.3",
-        "",
-        "[commands]",
-        "# Safe defaults - customize after verifying tool availability",
-        'left = "ls -la"    # Try: br --sort-by-type-dirs-first (requires broot)',
-        'right = "zsh"      # Try: css (requires Claude Code)',
-        "",
-    ]
+    blocks = [_DEFAULT_LAYOUT_HEADER]
 
     if home_dir:
-        lines.extend([
-            "[[tabs]]",
-            'name = "home"',
-            'dir = "~"',
-            "",
-        ])
+        blocks.append(_DEFAULT_HOME_TAB)
 
     if project_dir:
         # Convert to ~ format if in home directory
-        home = str(Path.home())
-        if project_dir.startswith(home):
-            project_dir = "~" + project_dir[len(home):]
-
+        project_dir = _shorten_home(project_dir)
         project_name = Path(project_dir).name
-        lines.extend([
-            "[[tabs]]",
-            f'name = "{project_name}"',
-            f'dir = "{project_dir}"',
-            "",
-        ])
+        blocks.append(f'[[tabs]]\nname = "{project_name}"\ndir = "{project_dir}"\n'.encode())
 
-    return "\n".join(lines)
+    return b"\n".join(blocks)
 
 
 async def run_first_run_wizard(connection, window) -> bool:
@@ -2793,14 +3283,14 @@ async def run_first_run_wizard(connection, window) -> bool:
             )
 
     # Step 3: Create config file
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_config_dir()
 
     layout_content = generate_default_layout_content(
         home_dir=True,
         project_dir=project_dir
     )
 
-    layout_path = CONFIG_DIR / "workspace-default.toml"
+    layout_path = PATHS.config_dir / "workspace-default.toml"
 
     try:
         atomic_write_file(layout_path, layout_content)
@@ -2912,14 +3402,14 @@ async def run_setup_wizard_for_veteran(connection, window) -> bool:
         project_dir = choose_folder_native("Select your project folder:")
 
     # Step 3: Create config file
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_config_dir()
 
     layout_content = generate_default_layout_content(
         home_dir=True,
         project_dir=project_dir
     )
 
-    layout_path = CONFIG_DIR / "workspace-wizard.toml"
+    layout_path = PATHS.config_dir / "workspace-wizard.toml"
 
     try:
         atomic_write_file(layout_path, layout_content)
@@ -3053,16 +3543,23 @@ async def offer_tool_installation(
         )
 
         try:
-            # Run brew install
-            result = subprocess.run(
-                ["brew", "install", brew_package],
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 min timeout for installation
-                check=False
+            # Run brew install without blocking the event loop; stdout is
+            # never shown, so only stderr is captured
+            proc = await asyncio.create_subprocess_exec(
+                "brew", "install", brew_package,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
             )
-
-            if result.returncode == 0:
+            try:
+                # 5 min timeout for installation
+                _, stderr_bytes = await asyncio.wait_for(proc.communicate(), timeout=300)
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+            stderr = stderr_bytes.decode(errors="replace")
+
+            if proc.returncode == 0:
                 logger.info(
                     "Tool installed successfully",
                     operation="offer_tool_installation",
@@ -3085,14 +3582,14 @@ async def offer_tool_installation(
                     operation="offer_tool_installation",
                     tool=tool_name,
                     status="failed",
-                    returncode=result.returncode,
-                    stderr=result.stderr[:500] if result.stderr else None
+                    returncode=proc.returncode,
+                    stderr=stderr[:500] if stderr else None
                 )
 
                 error_alert = iterm2.Alert(
                     "Installation Failed",
                     f"Could not install {tool_name}.\n\n"
-                    f"Error: {result.stderr[:200] if result.stderr else 'Unknown error'}\n\n"
+                    f"Error: {stderr[:200] if stderr else 'Unknown error'}\n\n"
                     f"Try manually: brew install {brew_package}",
                     window_id=window.window_id
                 )
@@ -3100,7 +3597,7 @@ async def offer_tool_installation(
                 await error_alert.async_run(connection)
                 return False
 
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             logger.error(
                 "Tool installation timed out",
                 operation="offer_tool_installation",
@@ -3133,11 +3630,13 @@ async def offer_tool_installation(
 # properties are computed differently in different parts of the codebase.
 
 
+@lru_cache(maxsize=512)
 def normalize_tab_path(path: str) -> str:
     """Normalize a tab directory path for consistent comparison.
 
     Expands ~ and resolves symlinks, then strips trailing slashes.
-    Use this whenever comparing tab paths for equality.
+    Use this whenever comparing tab paths for equality. Results are cached
+    for the session (realpath issues a readlink per path component).
 
     Args:
         path: Raw path string (may contain ~ or be relative).
@@ -3184,13 +3683,17 @@ def get_tab_display_name(
     Returns:
         Display name string for the tab.
     """
-    custom_tab_names = custom_tab_names or {}
     path = tab.get("dir", "")
-    return (
-        custom_tab_names.get(path)
-        or tab.get("name")
-        or os.path.basename(expand_tab_path(path))
-    )
+    name = (custom_tab_names.get(path) if custom_tab_names else None) or tab.get("name")
+    if name:
+        return name
+
+    # basename(expanduser(path)): expansion only changes the last component
+    # for a bare "~" / "~user", so take the tail directly otherwise
+    _, sep, tail = path.rpartition("/")
+    if sep or not path.startswith("~"):
+        return tail
+    return os.path.basename(expand_tab_path(path))
 
 
 def get_tab_dir(tab: dict) -> str:
@@ -3229,9 +3732,26 @@ def get_tab_dir(tab: dict) -> str:
 HEADER_L1_WIDTH = 40
 HEADER_L2_WIDTH = 34
 
+# Static part of the checkbox dialog configs (category selector, tab
+# customization) - built once, merged into each dialog's per-call fields
+_CATEGORY_DIALOG_BASE = {
+    "titlefont": "size=18",
+    "messagefont": "size=14",
+    "appearance": "dark",  # Force dark mode for consistent toggle colors
+    "hideicon": True,
+    "checkboxstyle": {
+        "style": "switch",
+        "size": "regular"
+    },
+    "moveable": True,
+    "ontop": True,
+    "json": True
+}
+
 
+@lru_cache(maxsize=256)
 def _make_header_label(text: str, char: str, target_width: int = HEADER_L1_WIDTH) -> str:
-    """Create a centered header label with dynamic padding.
+    """Create a centered header label with dynamic padding (memoized).
 
     Args:
         text: The header text (e.g., "LAYOUT TABS", "EON/ (34)")
@@ -3250,8 +3770,28 @@ def _make_header_label(text: str, char: str, target_width: int = HEADER_L1_WIDTH
     return char * left_pad + content + char * right_pad
 
 
+@lru_cache(maxsize=256)
+def _make_group_sub_header(parent_name: str, count: int) -> str:
+    """Level 2 sub-header for a parent directory group (memoized across redraws)."""
+    # Use 🗂️ emoji on both sides + double-line ═ for Level 2 (6 chars shorter than L1)
+    return f"🗂️ {_make_header_label(f'{parent_name}/ ({count})', '═', HEADER_L2_WIDTH)} 🗂️"
+
+
+# Level 1 category headers for the tab customization dialog (constant text,
+# built once at import): 📌 emoji on both sides + block characters (▓)
+_HEADER_LAYOUT = f"📌 {_make_header_label('LAYOUT TABS', '▓')} 📌"
+_HEADER_WORKTREE = f"📌 {_make_header_label('GIT WORKTREES', '▓')} 📌"
+_HEADER_REPO = f"📌 {_make_header_label('ADDITIONAL REPOS', '▓')} 📌"
+_HEADER_UNTRACKED = f"📌 {_make_header_label('UNTRACKED FOLDERS', '▓')} 📌"
+
+
+@lru_cache(maxsize=4)
 def _get_max_dialog_height(screen_percent: float = 0.90, fallback: int = 900) -> int:
-    """Get maximum dialog height as a percentage of screen height."""
+    """Get maximum dialog height as a percentage of screen height.
+
+    Cached for the session: the main screen's height doesn't change between
+    dialogs, and each NSScreen query crosses the PyObjC bridge.
+    """
     try:
         screen = NSScreen.mainScreen()
         if screen:
@@ -3266,12 +3806,21 @@ def _is_tab_selected(
     category: str,
     remembered_selections: set[str] | None,
     custom_tab_names: dict[str, str] | None = None,
+    name: str | None = None,
+    path: str | None = None,
 ) -> bool:
-    """Determine if a tab should be pre-checked based on remembered selections."""
+    """Determine if a tab should be pre-checked based on remembered selections.
+
+    Callers that already resolved the tab's display name / dir pass them as
+    name / path to skip resolving them again.
+    """
     if remembered_selections is None:
         return category in ("layout", "worktree")
-    name = get_tab_display_name(tab, custom_tab_names)
-    return name in remembered_selections or get_tab_dir(tab) in remembered_selections
+    if name is None:
+        name = get_tab_display_name(tab, custom_tab_names)
+    if path is None:
+        path = get_tab_dir(tab)
+    return name in remembered_selections or path in remembered_selections
 
 
 def _build_category_checkboxes(
@@ -3304,7 +3853,9 @@ def _build_category_checkboxes(
         # Skip .exists() check and icons for individual items - faster rendering
         checkboxes.append({
             "label": label,
-            "checked": _is_tab_selected(tab, category_key, remembered_selections, custom_tab_names),
+            "checked": _is_tab_selected(
+                tab, category_key, remembered_selections, name=name, path=path
+            ),
         })
         all_items.append({"label": label, "tab": tab, "category": category_key})
 
@@ -3334,28 +3885,29 @@ def _build_grouped_category_checkboxes(
     # Group items by parent directory
     groups: dict[str, list[dict]] = {}
     for tab in items:
-        path = get_tab_dir(tab)
-        expanded = Path(path).expanduser()
         # Use full parent path for grouping key to handle same-name dirs
-        parent_key = str(expanded.parent)
-        if parent_key not in groups:
-            groups[parent_key] = []
-        groups[parent_key].append(tab)
-
-    # Sort groups by parent directory name, then sort items within each group
-    sorted_groups = sorted(groups.items(), key=lambda x: Path(x[0]).name.lower())
+        # (string ops: no Path objects per tab)
+        expanded = expand_tab_path(get_tab_dir(tab)).rstrip("/")
+        parent_key = os.path.dirname(expanded) or "."
+        groups.setdefault(parent_key, []).append(tab)
+
+    # Sort groups by parent directory name (resolved once per group and
+    # reused for the sub-header), then sort items within each group
+    sorted_groups = sorted(
+        ((parent_key.rpartition("/")[2], group_items)
+         for parent_key, group_items in groups.items()),
+        key=lambda group: group[0].casefold()
+    )
 
     checkboxes = [
         {"label": header_label, "checked": False, "disabled": True, "icon": header_icon}
     ]
     all_items = []
 
-    for parent_path, group_items in sorted_groups:
+    for parent_basename, group_items in sorted_groups:
         # Add sub-header for this parent directory with double-line box drawing
-        parent_name = Path(parent_path).name.upper()
-        count = len(group_items)
-        # Use 🗂️ emoji on both sides + double-line ═ for Level 2 (6 chars shorter than L1)
-        sub_header = f"🗂️ {_make_header_label(f'{parent_name}/ ({count})', '═', HEADER_L2_WIDTH)} 🗂️"
+        parent_name = parent_basename.upper()
+        sub_header = _make_group_sub_header(parent_name, len(group_items))
         checkboxes.append({
             "label": sub_header,
             "checked": False,
@@ -3363,18 +3915,23 @@ def _build_grouped_category_checkboxes(
             "icon": "SF=folder.fill.badge.gearshape",
         })
 
-        # Sort items within group alphabetically by display name
-        group_items.sort(key=lambda t: get_tab_display_name(t, custom_tab_names).lower())
+        # Sort items within group alphabetically by display name (each name
+        # is resolved once and reused for the label)
+        named_items = sorted(
+            ((get_tab_display_name(tab, custom_tab_names), tab) for tab in group_items),
+            key=lambda item: item[0].casefold()
+        )
 
-        for tab in group_items:
+        for name, tab in named_items:
             path = get_tab_dir(tab)
-            name = get_tab_display_name(tab, custom_tab_names)
             label = format_tab_label(path, name)
 
             # Skip .exists() check and icons for individual items - faster rendering
             checkboxes.append({
                 "label": label,
-                "checked": _is_tab_selected(tab, category_key, remembered_selections, custom_tab_names),
+                "checked": _is_tab_selected(
+                    tab, category_key, remembered_selections, name=name, path=path
+                ),
             })
             all_items.append({"label": label, "tab": tab, "category": category_key})
 
@@ -3411,10 +3968,14 @@ def show_category_selector_dialog(
         return None
 
     # Build checkboxes for each category (switch style for visual clarity)
+    # (label_to_name maps each label back to its category name for parsing)
     checkboxes = []
+    label_to_name = {}
     for cat in non_empty:
+        label = f"{cat['name']} ({cat['count']} items)"
+        label_to_name[label] = cat["name"]
         checkboxes.append({
-            "label": f"{cat['name']} ({cat['count']} items)",
+            "label": label,
             "icon": cat.get("icon", "SF=folder.fill"),
             "checked": False
         })
@@ -3423,21 +3984,14 @@ def show_category_selector_dialog(
     dialog_height = 140 + len(non_empty) * 40
 
     dialog_config = {
+        **_CATEGORY_DIALOG_BASE,
         "title": "Select Category to Edit",
-        "titlefont": "size=18",
         "message": "Choose a category to customize shorthand names:",
-        "messagefont": "size=14",
-        "appearance": "dark",
-        "hideicon": True,
         "checkbox": checkboxes,
-        "checkboxstyle": {"style": "switch", "size": "regular"},
         "button1text": "Edit Selected",
         "button2text": "Cancel",
         "height": str(dialog_height),
-        "width": "600",
-        "moveable": True,
-        "ontop": True,
-        "json": True
+        "width": "600"
     }
 
     logger.info(
@@ -3465,21 +4019,19 @@ def show_category_selector_dialog(
 
     # Parse selected category from checkbox output
     # SwiftDialog returns: {"Layout Tabs (5 items)": true, "Git Worktrees (3 items)": false, ...}
-    for label, selected in output.items():
-        if selected:
-            # Extract category name (strip the count suffix)
-            # "Layout Tabs (5 items)" -> "Layout Tabs"
-            category_name = label.rsplit(" (", 1)[0] if " (" in label else label
-
-            # Match back to original category names
-            for cat in non_empty:
-                if cat["name"] == category_name:
-                    logger.info(
-                        "Category selected",
-                        category=category_name,
-                        operation="show_category_selector_dialog"
-                    )
-                    return category_name
+    # First checked label that is one of ours wins
+    category_name = next(
+        (label_to_name[label] for label, selected in output.items()
+         if selected and label in label_to_name),
+        None
+    )
+    if category_name is not None:
+        logger.info(
+            "Category selected",
+            category=category_name,
+            operation="show_category_selector_dialog"
+        )
+        return category_name
 
     logger.debug(
         "No category selected",
@@ -3574,23 +4126,34 @@ def show_rename_tabs_dialog(
         "iTerm2 restarts."
     )
 
+    # Resolve each item's path, display label and basename once; pages (and
+    # Back/Next revisits) slice this list instead of recomputing per render
+    # and per parse
+    item_meta = []
+    for item in items:
+        path = item.get("dir") or item.get("path", "")
+        item_meta.append((item, path, _shorten_home(path), path.rpartition("/")[2]))
+
+    # Title prefix is the same on every page; only the page suffix varies
+    title_base = f"Rename: {category_name}" if category_name else "Rename Tabs"
+    title_base = f"{title_base} ({total_items} items)"
+
     while 0 <= current_page < total_pages:
         start = current_page * max_items_per_page
         end = min(start + max_items_per_page, total_items)
-        page_items = items[start:end]
+        # Single page (the common small-category case): use the list as-is
+        page_meta = item_meta if total_pages == 1 else item_meta[start:end]
         page_num = current_page + 1  # 1-indexed for display
 
         # Build text fields — use previously-edited values from all_results
         textfields = []
-        for item in page_items:
-            path = item.get("dir") or item.get("path", "")
+        for item, path, path_display, basename in page_meta:
             # Priority: edits from this session > saved custom names > item name
             current_name = (
                 all_results.get(path)
                 or custom_names.get(path)
-                or item.get("name", os.path.basename(path))
+                or item.get("name", basename)
             )
-            path_display = path.replace(str(Path.home()), "~")
 
             textfields.append({
                 "title": path_display,
@@ -3599,15 +4162,13 @@ def show_rename_tabs_dialog(
             })
 
         # Build title with category and page info
-        title = "Rename Tabs"
-        if category_name:
-            title = f"Rename: {category_name}"
-        title = f"{title} ({total_items} items)"
         if total_pages > 1:
-            title = f"{title} \u2014 Page {page_num}/{total_pages}"
+            title = f"{title_base} \u2014 Page {page_num}/{total_pages}"
+        else:
+            title = title_base
 
         # Calculate exact height for this page's content
-        dialog_height = message_overhead + len(page_items) * per_item_height + buttons_height
+        dialog_height = message_overhead + len(page_meta) * per_item_height + buttons_height
 
         # Button layout:
         #   button1 (rc=0): "Next" on non-last pages, "Save" on last page
@@ -3642,7 +4203,7 @@ def show_rename_tabs_dialog(
             "Showing rename dialog",
             operation="show_rename_tabs_dialog",
             category=category_name,
-            item_count=len(page_items),
+            item_count=len(page_meta),
             page=page_num,
             total_pages=total_pages,
             dialog_height=dialog_height
@@ -3652,16 +4213,18 @@ def show_rename_tabs_dialog(
         return_code, output = run_swiftdialog(dialog_config)
 
         # Collect edits from this page regardless of navigation direction
+        # (one pass over the output, keyed back to paths by textfield label)
         if output:
-            for item in page_items:
-                path = item.get("dir") or item.get("path", "")
-                path_display = path.replace(str(Path.home()), "~")
-                if path_display in output:
-                    new_name = output[path_display].strip()
-                    if new_name:
-                        all_results[path] = new_name
-                    else:
-                        all_results[path] = os.path.basename(path)
+            display_to_path = {
+                path_display: (path, basename)
+                for _item, path, path_display, basename in page_meta
+            }
+            for label, value in output.items():
+                target = display_to_path.get(label)
+                if target is not None:
+                    path, basename = target
+                    new_name = value.strip()
+                    all_results[path] = new_name or basename
 
         if return_code == 0:
             # Next / Save pressed
@@ -3691,6 +4254,59 @@ def show_rename_tabs_dialog(
     return all_results if all_results else None
 
 
+def _build_tab_customization_checkboxes(
+    layout_tabs: list[dict],
+    worktrees: list[dict],
+    additional_repos: list[dict],
+    untracked_folders: list[dict],
+    last_tab_selections: list[str] | None,
+    custom_tab_names: dict[str, str],
+) -> tuple[list[dict], list[dict]]:
+    """Build the categorized checkbox list for the tab customization dialog.
+
+    Returns:
+        Tuple of (checkboxes list for SwiftDialog, all_items metadata list).
+    """
+    remembered_selections = set(last_tab_selections) if last_tab_selections else None
+
+    # Build each category independently, then concatenate once at the end
+    sections = []
+
+    # Build category checkboxes using shared helpers (headers: _HEADER_* constants)
+    # Layout tabs and worktrees use flat list
+    flat_categories = [
+        (layout_tabs, "layout", _HEADER_LAYOUT,
+         CATEGORY_ICONS["header_layout"], CATEGORY_ICONS["layout_tab"]),
+        (worktrees, "worktree", _HEADER_WORKTREE,
+         CATEGORY_ICONS["header_worktree"], CATEGORY_ICONS["git_worktree"]),
+    ]
+    for items, cat_key, header, header_icon, item_icon in flat_categories:
+        sections.append(_build_category_checkboxes(
+            items, cat_key, header, header_icon, item_icon,
+            custom_tab_names, remembered_selections,
+        ))
+
+    # Additional repos grouped by parent directory (alphabetically: eon, fork-tools, own)
+    # Level 1 header with 📌 emoji on both sides, Level 2 sub-headers use ═ without emoji
+    sections.append(_build_grouped_category_checkboxes(
+        additional_repos, "discovered", _HEADER_REPO,
+        CATEGORY_ICONS["header_repo"], CATEGORY_ICONS["additional_repo"],
+        custom_tab_names, remembered_selections,
+    ))
+
+    # Untracked folders use flat list with 📌 emoji on both sides
+    sections.append(_build_category_checkboxes(
+        untracked_folders, "untracked", _HEADER_UNTRACKED,
+        CATEGORY_ICONS["header_untracked"], CATEGORY_ICONS["untracked"],
+        custom_tab_names, remembered_selections,
+    ))
+
+    checkboxes = list(chain.from_iterable(cat_checkboxes for cat_checkboxes, _ in sections))
+    all_items = list(chain.from_iterable(cat_items for _, cat_items in sections))
+
+    return checkboxes, all_items
+
+
 def show_tab_customization_swiftdialog(
     layout_tabs: list[dict],
     worktrees: list[dict],
@@ -3698,7 +4314,8 @@ def show_tab_customization_swiftdialog(
     untracked_folders: list[dict] | None = None,
     last_tab_selections: list[str] | None = None,
     custom_tab_names: dict[str, str] | None = None,
-    on_rename_requested: Callable | None = None
+    on_rename_requested: Callable | None = None,
+    prebuilt: tuple[list[dict], list[dict]] | None = None
 ) -> list[dict] | None:
     """
     Show Layer 2 checkbox dialog using SwiftDialog (modern macOS UI).
@@ -3714,6 +4331,8 @@ def show_tab_customization_swiftdialog(
         last_tab_selections: Previously selected tab names (for restoring state)
         custom_tab_names: Dict mapping paths to custom shorthand names
         on_rename_requested: Callback when "Rename Tabs" is clicked, receives all_items
+        prebuilt: (checkboxes, all_items) from _build_tab_customization_checkboxes,
+            skips rebuilding when the caller already has them
 
     Returns:
         List of selected tabs, or None if cancelled
@@ -3742,90 +4361,41 @@ def show_tab_customization_swiftdialog(
         }
     )
 
-    # Build checkbox JSON config with categories
-    checkboxes = []
-    all_items = []
-    remembered_selections = set(last_tab_selections) if last_tab_selections else None
-
-    # Build category checkboxes using shared helpers
-    # Level 1 headers use 📌 emoji on both sides + block characters (▓) for visual impact
-    # Layout tabs and worktrees use flat list
-    flat_categories = [
-        (layout_tabs, "layout", f"📌 {_make_header_label('LAYOUT TABS', '▓')} 📌",
-         CATEGORY_ICONS["header_layout"], CATEGORY_ICONS["layout_tab"]),
-        (worktrees, "worktree", f"📌 {_make_header_label('GIT WORKTREES', '▓')} 📌",
-         CATEGORY_ICONS["header_worktree"], CATEGORY_ICONS["git_worktree"]),
-    ]
-    for items, cat_key, header, header_icon, item_icon in flat_categories:
-        cat_checkboxes, cat_items = _build_category_checkboxes(
-            items, cat_key, header, header_icon, item_icon,
-            custom_tab_names, remembered_selections,
+    # Build checkbox JSON config with categories (reuse the caller's build
+    # when re-showing the dialog with unchanged names)
+    if prebuilt is not None:
+        checkboxes, all_items = prebuilt
+    else:
+        checkboxes, all_items = _build_tab_customization_checkboxes(
+            layout_tabs, worktrees, additional_repos, untracked_folders,
+            last_tab_selections, custom_tab_names,
         )
-        checkboxes.extend(cat_checkboxes)
-        all_items.extend(cat_items)
-
-    # Additional repos grouped by parent directory (alphabetically: eon, fork-tools, own)
-    # Level 1 header with 📌 emoji on both sides, Level 2 sub-headers use ═ without emoji
-    repo_checkboxes, repo_items = _build_grouped_category_checkboxes(
-        additional_repos, "discovered", f"📌 {_make_header_label('ADDITIONAL REPOS', '▓')} 📌",
-        CATEGORY_ICONS["header_repo"], CATEGORY_ICONS["additional_repo"],
-        custom_tab_names, remembered_selections,
-    )
-    checkboxes.extend(repo_checkboxes)
-    all_items.extend(repo_items)
-
-    # Untracked folders use flat list with 📌 emoji on both sides
-    untracked_checkboxes, untracked_items = _build_category_checkboxes(
-        untracked_folders, "untracked", f"📌 {_make_header_label('UNTRACKED FOLDERS', '▓')} 📌",
-        CATEGORY_ICONS["header_untracked"], CATEGORY_ICONS["untracked"],
-        custom_tab_names, remembered_selections,
-    )
-    checkboxes.extend(untracked_checkboxes)
-    all_items.extend(untracked_items)
 
     dialog_height = _get_max_dialog_height(0.90)
 
     # Build SwiftDialog JSON config
     # Wide compact design: larger fonts, tight spacing, path + shorthand labels
     dialog_config = {
+        **_CATEGORY_DIALOG_BASE,
         "title": "Customize Tabs",
-        "titlefont": "size=18",
         "message": f"Select tabs to open ({total_items} available):",
-        "messagefont": "size=14",
-        "appearance": "dark",  # Force dark mode for consistent toggle colors
-        "hideicon": True,
         "checkbox": checkboxes,
-        "checkboxstyle": {
-            "style": "switch",
-            "size": "regular"
-        },
         "button1text": "Open Selected",
         "button2text": "Back",  # Returns to workspace selector
         "infobuttontext": "Rename Tabs",  # Info button triggers rename dialog
         "height": str(dialog_height),
-        "width": "750",  # Match SwiftDialog's 700px checkbox area + padding
-        "moveable": True,
-        "ontop": True,
-        "json": True
+        "width": "750"  # Match SwiftDialog's 700px checkbox area + padding
     }
 
-    # Write config to temp file
+    # Pass config inline via --jsonstring (no temp file to create/clean up)
     try:
-        with tempfile.NamedTemporaryFile(
-            mode='w', suffix='.json', delete=False
-        ) as f:
-            json.dump(dialog_config, f)
-            config_path = f.name
-
-        # Run SwiftDialog
         swiftdialog_bin = find_swiftdialog_path()
-        cmd = [swiftdialog_bin, "--jsonfile", config_path, "--json"]
+        cmd = swiftdialog_command(swiftdialog_bin, dialog_config)
 
         logger.debug(
             "Running SwiftDialog",
             operation="show_tab_customization_swiftdialog",
-            trace_id=op_trace_id,
-            command=" ".join(cmd)
+            trace_id=op_trace_id
         )
 
         result = subprocess.run(
@@ -3833,12 +4403,10 @@ def show_tab_customization_swiftdialog(
             capture_output=True,
             text=True,
             timeout=300,  # 5 min timeout for user interaction
-            check=False  # We handle return codes manually (0=OK, 2=Cancel, 4=timeout)
+            check=False,  # We handle return codes manually (0=OK, 2=Cancel, 4=timeout)
+            close_fds=False
         )
 
-        # Clean up temp file
-        Path(config_path).unlink(missing_ok=True)
-
         # Check return code (0=button1/OK, 2=button2/Back, 3=info button, 4=timeout)
         if result.returncode == 2:
             logger.info(
@@ -3884,7 +4452,9 @@ def show_tab_customization_swiftdialog(
 
         # Parse JSON output
         try:
-            output = json.loads(result.stdout) if result.stdout.strip() else {}
+            stdout = result.stdout
+            # isspace() stops at the first non-blank char; strip() would copy
+            output = json.loads(stdout) if stdout and not stdout.isspace() else {}
         except json.JSONDecodeError as e:
             logger.error(
                 "Failed to parse SwiftDialog JSON output",
@@ -3898,15 +4468,13 @@ def show_tab_customization_swiftdialog(
 
         # Build selected tabs list from JSON output
         # SwiftDialog returns: {"Label": true/false, ...}
-        selected_tabs = []
-        for item in all_items:
-            label = item["label"]
-            # SwiftDialog may return label directly or in a nested structure
-            is_checked = output.get(label, False)
-            if isinstance(is_checked, dict):
-                is_checked = is_checked.get("checked", False)
-            if is_checked:
-                selected_tabs.append(item["tab"])
+        # (may also nest as {"Label": {"checked": ...}}) - normalize each output
+        # entry once, then keep dialog order (tab open order) from all_items
+        checked_labels = {
+            label for label, value in output.items()
+            if (value.get("checked", False) if isinstance(value, dict) else value)
+        }
+        selected_tabs = [item["tab"] for item in all_items if item["label"] in checked_labels]
 
         logger.info(
             "SwiftDialog tab customization complete",
@@ -3928,7 +4496,6 @@ def show_tab_customization_swiftdialog(
             status="timeout",
             trace_id=op_trace_id
         )
-        Path(config_path).unlink(missing_ok=True)
         return None
 
     except (OSError, subprocess.SubprocessError) as e:
@@ -4097,91 +4664,87 @@ async def show_tab_customization(
         )
 
         # Loop to handle rename dialog flow
-        from functools import partial
-        loop = asyncio.get_event_loop()
+        # Checkbox build is reused across rename round-trips and only redone
+        # when a rename actually changed a name (labels embed display names)
+        prebuilt = None
 
         while True:
-            result = await loop.run_in_executor(
-                None,
-                partial(
-                    show_tab_customization_swiftdialog,
-                    layout_tabs,
-                    worktrees,
-                    additional_repos,
-                    untracked_folders,
-                    last_tab_selections,
-                    custom_tab_names,
-                    None  # on_rename_requested not used - we check return value instead
+            if prebuilt is None:
+                prebuilt = _build_tab_customization_checkboxes(
+                    layout_tabs, worktrees, additional_repos, untracked_folders,
+                    last_tab_selections, custom_tab_names,
                 )
+
+            result = await asyncio.to_thread(
+                show_tab_customization_swiftdialog,
+                layout_tabs,
+                worktrees,
+                additional_repos,
+                untracked_folders,
+                last_tab_selections,
+                custom_tab_names,
+                None,  # on_rename_requested not used - we check return value instead
+                prebuilt
             )
 
             # Check if rename was requested
             if result == "RENAME_REQUESTED":
-                # Build items list with category tags for all inputs
-                # Use get_tab_display_name for consistent name resolution
-                items_to_rename = []
+                # Bucket tabs with a path by category in one sweep; counts come
+                # from the bucket sizes, and rename items are only built for
+                # the category the user picks
                 category_sources = [
-                    (layout_tabs, "Layout Tabs"),
-                    (worktrees, "Git Worktrees"),
-                    (additional_repos, "Additional Repos"),
-                    (untracked_folders, "Untracked Folders"),
+                    (layout_tabs, "Layout Tabs", CATEGORY_ICONS["layout_tab"]),
+                    (worktrees, "Git Worktrees", CATEGORY_ICONS["git_worktree"]),
+                    (additional_repos, "Additional Repos", CATEGORY_ICONS["additional_repo"]),
+                    (untracked_folders, "Untracked Folders", CATEGORY_ICONS["untracked"]),
                 ]
-                for source_list, category_name in category_sources:
+                by_category: dict[str, list[tuple[str, dict]]] = {}
+                categories = []
+                for source_list, category_name, icon in category_sources:
+                    bucket = []
                     for tab in source_list:
-                        items_to_rename.append({
-                            "dir": get_tab_dir(tab),
-                            "name": get_tab_display_name(tab, custom_tab_names),
-                            "category": category_name,
+                        tab_dir = get_tab_dir(tab)
+                        if tab_dir:  # Skip items without paths
+                            bucket.append((tab_dir, tab))
+                    by_category[category_name] = bucket
+                    if bucket:  # Only non-empty categories are selectable
+                        categories.append({
+                            "name": category_name,
+                            "count": len(bucket),
+                            "icon": icon
                         })
 
-                # Filter out items without paths
-                items_to_rename = [i for i in items_to_rename if i.get("dir")]
-
-                # Build category list with counts
-                from collections import Counter
-                category_counts = Counter(i["category"] for i in items_to_rename)
-                categories = [
-                    {
-                        "name": "Layout Tabs",
-                        "count": category_counts.get("Layout Tabs", 0),
-                        "icon": CATEGORY_ICONS["layout_tab"]
-                    },
-                    {
-                        "name": "Git Worktrees",
-                        "count": category_counts.get("Git Worktrees", 0),
-                        "icon": CATEGORY_ICONS["git_worktree"]
-                    },
-                    {
-                        "name": "Additional Repos",
-                        "count": category_counts.get("Additional Repos", 0),
-                        "icon": CATEGORY_ICONS["additional_repo"]
-                    },
-                    {
-                        "name": "Untracked Folders",
-                        "count": category_counts.get("Untracked Folders", 0),
-                        "icon": CATEGORY_ICONS["untracked"]
-                    },
-                ]
-
                 # Show category selector
-                selected_category = await loop.run_in_executor(
-                    None,
-                    partial(show_category_selector_dialog, categories)
+                selected_category = await asyncio.to_thread(
+                    show_category_selector_dialog, categories
                 )
 
                 if selected_category:
-                    # Show rename dialog filtered to selected category
-                    new_names = await loop.run_in_executor(
-                        None,
-                        partial(
-                            show_rename_tabs_dialog,
-                            items_to_rename,
-                            custom_tab_names,
-                            selected_category  # category_name filter
-                        )
+                    # Use get_tab_display_name for consistent name resolution
+                    items_to_rename = [
+                        {
+                            "dir": tab_dir,
+                            "name": get_tab_display_name(tab, custom_tab_names),
+                            "category": selected_category,
+                        }
+                        for tab_dir, tab in by_category[selected_category]
+                    ]
+
+                    # Show rename dialog for the selected category's items
+                    new_names = await asyncio.to_thread(
+                        show_rename_tabs_dialog,
+                        items_to_rename,
+                        custom_tab_names,
+                        selected_category  # dialog title
                     )
 
                     if new_names:
+                        if any(
+                            custom_tab_names.get(path) != name
+                            for path, name in new_names.items()
+                        ):
+                            prebuilt = None  # Labels changed: rebuild on re-show
+
                         # Update custom_tab_names with new values
                         custom_tab_names.update(new_names)
 
@@ -4245,22 +4808,30 @@ def show_tab_reorder_dialog(
         custom_tab_names = {}
 
     current = list(tabs)
+    # Display names are fixed for the dialog's lifetime: resolve once and keep
+    # them in step with current through each re-sort
+    names = [get_tab_display_name(tab, custom_tab_names) for tab in current]
+
+    # Two tabs can only be kept or swapped: one Keep/Swap dialog instead of
+    # the dropdown Sort/Finalize loop
+    if len(current) == 2:
+        return _show_two_tab_order_dialog(current, names)
+
     iteration = 0
 
+    # Dropdown values — 10x range with defaults at 10, 20, 30...
+    # Gives 9 slots between each tab for free insertion without conflicts.
+    # The tab count never changes across Sort iterations, so build once.
+    count = len(current)
+    values = [str(n) for n in range(1, count * 10 + 1)]
+    dialog_height = str(160 + 50 * count)
+
     while True:
-        # Build select dropdowns — 10x range with defaults at 10, 20, 30...
-        # Gives 9 slots between each tab for free insertion without conflicts
-        count = len(current)
-        max_val = count * 10
-        values = [str(n) for n in range(1, max_val + 1)]
-        selectitems = []
-        for i, tab in enumerate(current):
-            name = get_tab_display_name(tab, custom_tab_names)
-            selectitems.append({
-                "title": name,
-                "values": values,
-                "default": str((i + 1) * 10),
-            })
+        # Build select dropdowns in the current order
+        selectitems = [
+            {"title": name, "values": values, "default": str((i + 1) * 10)}
+            for i, name in enumerate(names)
+        ]
 
         if iteration == 0:
             msg = (
@@ -4287,7 +4858,7 @@ def show_tab_reorder_dialog(
             "button2text": "Cancel",
             "infobuttontext": "Finalize",
             "width": "750",
-            "height": str(160 + 50 * count),
+            "height": dialog_height,
             "moveable": True,
             "ontop": True,
             "json": True,
@@ -4298,13 +4869,13 @@ def show_tab_reorder_dialog(
         if return_code == 0:
             # Sort button (button1) — reorder and re-show
             if output:
-                current = _reorder_tabs_by_numbers(current, custom_tab_names, output)
+                current, names = _reorder_tabs_by_numbers(current, names, output)
             iteration += 1
             logger.info(
                 "Tab reorder preview",
                 operation="show_tab_reorder_dialog",
                 iteration=iteration,
-                order=[get_tab_display_name(t, custom_tab_names) for t in current],
+                order=names,
             )
             continue
 
@@ -4314,7 +4885,7 @@ def show_tab_reorder_dialog(
                 "Tab order finalized",
                 operation="show_tab_reorder_dialog",
                 iterations=iteration,
-                final_order=[get_tab_display_name(t, custom_tab_names) for t in current],
+                final_order=names,
             )
             return current
 
@@ -4328,27 +4899,74 @@ def show_tab_reorder_dialog(
             return None
 
 
+def _show_two_tab_order_dialog(tabs: list[dict], names: list[str]) -> list[dict] | None:
+    """Keep/Swap dialog for exactly two tabs (see show_tab_reorder_dialog)."""
+    dialog_config = {
+        "title": "Tab Order",
+        "titlefont": "size=18",
+        "message": f"1. **{names[0]}**\\n2. **{names[1]}**",
+        "messagefont": "size=14",
+        "appearance": "dark",
+        "hideicon": True,
+        "button1text": "Keep Order",
+        "button2text": "Cancel",
+        "infobuttontext": "Swap",
+        "width": "500",
+        "height": "220",
+        "moveable": True,
+        "ontop": True,
+        "json": True,
+    }
+
+    return_code, _ = run_swiftdialog(dialog_config)
+
+    if return_code == 0:
+        order = tabs
+    elif return_code == 3:
+        order = [tabs[1], tabs[0]]
+    else:
+        logger.debug(
+            "Tab reorder cancelled",
+            return_code=return_code,
+            operation="show_tab_reorder_dialog",
+        )
+        return None
+
+    logger.info(
+        "Tab order finalized",
+        operation="show_tab_reorder_dialog",
+        swapped=return_code == 3,
+        final_order=[names[1], names[0]] if return_code == 3 else names,
+    )
+    return order
+
+
 def _reorder_tabs_by_numbers(
     tabs: list[dict],
-    custom_tab_names: dict[str, str],
+    names: list[str],
     output: dict,
-) -> list[dict]:
-    """Sort tabs by the numeric values from the reorder dialog output."""
+) -> tuple[list[dict], list[str]]:
+    """Sort tabs (and their parallel display names) by the numeric values
+    from the reorder dialog output."""
     pairs = []
-    for tab in tabs:
-        name = get_tab_display_name(tab, custom_tab_names)
+    for i, (name, tab) in enumerate(zip(names, tabs)):
         raw = output.get(name, "999")
         # Handle both textfield ("3") and selectitems ({"selectedValue": "3"})
         if isinstance(raw, dict):
             raw = raw.get("selectedValue", "999")
-        try:
-            num = int(raw)
-        except (ValueError, TypeError):
-            num = 999
-        pairs.append((num, tab))
+        if isinstance(raw, str) and raw.isdecimal():
+            num = int(raw)  # Common case: dropdown values are digit strings
+        else:
+            try:
+                num = int(raw)
+            except (ValueError, TypeError):
+                num = 999
+        pairs.append((num, i, name, tab))
 
-    pairs.sort(key=lambda x: x[0])
-    return [tab for _, tab in pairs]
+    # Plain tuple sort: (num, i) is unique, so ties keep their current order
+    # and the dicts themselves are never compared
+    pairs.sort()
+    return [tab for *_, tab in pairs], [name for _, _, name, _ in pairs]
 
 # =============================================================================
 # Module: pane_setup.py
@@ -4362,30 +4980,119 @@ def _reorder_tabs_by_numbers(
 # Pane Setup
 # =============================================================================
 
+# Connections (by id) whose prompt API failed outright: later panes on the
+# same connection skip the probe and send their command directly
+_shell_integration_unavailable: set[int] = set()
+
+# Poll interval while waiting for the shell to show a fresh prompt after cd
+_PROMPT_POLL_INTERVAL = 0.05
+
+
+@lru_cache(maxsize=256)
+def _cd_command(directory: str) -> str:
+    """Shell line that changes to directory (memoized: both panes of a tab
+    cd to the same place)."""
+    # Expand ~ first, then quote for paths with spaces
+    return f"cd {shlex.quote(os.path.expanduser(directory))}\n"
+
+
+def _prompt_probe_failed(connection, directory: str, e: Exception) -> None:
+    """Log a failed prompt query; stop probing if the prompt API is unusable.
+
+    AttributeError/TypeError mean the prompt API itself is unusable, so later
+    panes on this connection skip it; RPC errors may be transient or
+    session-specific and are retried for the next pane.
+    """
+    if not isinstance(e, iterm2.RPCException):
+        _shell_integration_unavailable.add(id(connection))
+    logger.warning(
+        "Shell integration unavailable, falling back to direct send",
+        operation="setup_pane_and_send_command",
+        status="fallback",
+        directory=directory,
+        error=str(e),
+        error_type=type(e).__name__
+    )
+
+
+async def _wait_for_new_prompt(
+    connection, session_id: str, settle_time: float, stale_prompt_id: str | None
+):
+    """Poll until a new prompt is ready for input, for at most settle_time.
+
+    The prompt that was on screen before cd (stale_prompt_id) doesn't count:
+    it is still EDITING until the shell has read the cd line.
+
+    Returns:
+        The ready prompt, or the last prompt seen (None if shell integration
+        reported none) once settle_time has elapsed
+    """
+    deadline = time.monotonic() + settle_time
+    while True:
+        prompt = await iterm2.async_get_last_prompt(connection, session_id)
+        if (
+            prompt
+            and prompt.command_state == iterm2.PromptState.EDITING
+            and prompt.unique_id != stale_prompt_id
+        ):
+            return prompt
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return prompt
+        await asyncio.sleep(min(_PROMPT_POLL_INTERVAL, remaining))
+
 
 async def setup_pane_and_send_command(
     session, connection, directory: str, command: str, settle_time: float
 ):
     """
-    Setup a pane: cd to directory, wait briefly, then send command.
+    Setup a pane: cd to directory, wait for the shell, then send command.
+
+    With shell integration the wait ends as soon as a fresh prompt is ready
+    (settle_time is the upper bound); without it, waits settle_time.
 
     Args:
         session: iTerm2 session object
         connection: iTerm2 connection
         directory: Working directory
         command: Command to execute
-        settle_time: Wait time after cd (seconds)
+        settle_time: Maximum wait after cd (seconds)
     """
-    # Change to target directory (expand ~ first, then quote for paths with spaces)
-    expanded_path = os.path.expanduser(directory)
-    await session.async_send_text(f"cd {shlex.quote(expanded_path)}\n")
+    # Change to target directory
+    cd_text = _cd_command(directory)
+
+    # Remember the prompt on screen before cd so the wait below only accepts
+    # a newer one
+    probe = id(connection) not in _shell_integration_unavailable
+    stale_prompt_id = None
+    if probe:
+        try:
+            previous = await iterm2.async_get_last_prompt(connection, session.session_id)
+            stale_prompt_id = previous.unique_id if previous else None
+        except (iterm2.RPCException, AttributeError, TypeError) as e:
+            _prompt_probe_failed(connection, directory, e)
+            probe = False
+
+    await session.async_send_text(cd_text)
 
-    # Wait briefly for cd to complete
-    await asyncio.sleep(settle_time)
+    if not probe:
+        # No prompt API: wait briefly for cd to complete, then send
+        await asyncio.sleep(settle_time)
+        await session.async_send_text(f"{command}\n")
+        logger.debug(
+            "Command sent without prompt probe (shell integration unavailable)",
+            operation="setup_pane_and_send_command",
+            status="success",
+            directory=directory,
+            shell_integration=False
+        )
+        return True
 
     # Check if shell integration provides prompt state
     try:
-        prompt = await iterm2.async_get_last_prompt(connection, session.session_id)
+        prompt = await _wait_for_new_prompt(
+            connection, session.session_id, settle_time, stale_prompt_id
+        )
         if prompt:
             # Shell integration working - check state
             if prompt.command_state == iterm2.PromptState.EDITING:
@@ -4422,14 +5129,7 @@ async def setup_pane_and_send_command(
             return True
     except (iterm2.RPCException, AttributeError, TypeError) as e:
         # Shell integration not available or error - send command anyway
-        logger.warning(
-            "Shell integration unavailable, falling back to direct send",
-            operation="setup_pane_and_send_command",
-            status="fallback",
-            directory=directory,
-            error=str(e),
-            error_type=type(e).__name__
-        )
+        _prompt_probe_failed(connection, directory, e)
         await session.async_send_text(f"{command}\n")
         return True
 
@@ -4525,28 +5225,26 @@ async def maximize_window(window):
         # Get the visible screen area (excludes menu bar and dock)
         screen = NSScreen.mainScreen()
         if screen:
+            # Read the frame across the PyObjC bridge once, as plain ints
             visible_frame = screen.visibleFrame()
+            origin, size = visible_frame.origin, visible_frame.size
+            x, y = int(origin.x), int(origin.y)
+            width, height = int(size.width), int(size.height)
 
             # Debug output
             logger.debug(
                 "Screen dimensions retrieved",
                 operation="maximize_window",
-                width=int(visible_frame.size.width),
-                height=int(visible_frame.size.height),
-                origin_x=int(visible_frame.origin.x),
-                origin_y=int(visible_frame.origin.y)
+                width=width,
+                height=height,
+                origin_x=x,
+                origin_y=y
             )
 
             # Create iTerm2 frame using constructor
             frame = iterm2.Frame(
-                origin=iterm2.Point(
-                    int(visible_frame.origin.x),
-                    int(visible_frame.origin.y)
-                ),
-                size=iterm2.Size(
-                    int(visible_frame.size.width),
-                    int(visible_frame.size.height)
-                )
+                origin=iterm2.Point(x, y),
+                size=iterm2.Size(width, height)
             )
 
             # Set the window frame
@@ -4555,8 +5253,8 @@ async def maximize_window(window):
                 "Window maximized successfully",
                 operation="maximize_window",
                 status="success",
-                width=int(visible_frame.size.width),
-                height=int(visible_frame.size.height)
+                width=width,
+                height=height
             )
             return True
         else:
@@ -4589,10 +5287,24 @@ async def maximize_window(window):
 # =============================================================================
 
 
+async def _get_session_path(session) -> str | None:
+    """Query a session's ``path`` variable, or None if it can't be read."""
+    try:
+        return await session.async_get_variable("path")
+    except (iterm2.RPCException, AttributeError, TypeError):
+        logger.debug(
+            "Could not query session path",
+            session_id=getattr(session, "session_id", "unknown"),
+        )
+        return None
+
+
 async def get_open_tab_directories(window) -> set[str]:
     """Return normalized directory paths of all sessions in the current window.
 
     Queries each session's ``path`` variable via the iTerm2 Python API.
+    The queries are issued concurrently (one round-trip for the whole
+    window instead of one per session).
     Uses normalize_tab_path for consistent path comparison.
 
     Args:
@@ -4601,20 +5313,9 @@ async def get_open_tab_directories(window) -> set[str]:
     Returns:
         Set of absolute directory paths currently open in the window.
     """
-    open_dirs: set[str] = set()
-    for tab in window.tabs:
-        for session in tab.sessions:
-            try:
-                path = await session.async_get_variable("path")
-            except (iterm2.RPCException, AttributeError, TypeError):
-                logger.debug(
-                    "Could not query session path",
-                    session_id=getattr(session, "session_id", "unknown"),
-                )
-                continue
-            if path:
-                open_dirs.add(normalize_tab_path(path))
-    return open_dirs
+    sessions = [session for tab in window.tabs for session in tab.sessions]
+    paths = await asyncio.gather(*(_get_session_path(session) for session in sessions))
+    return {normalize_tab_path(path) for path in paths if path}
 
 
 def filter_already_open_tabs(
@@ -4632,6 +5333,10 @@ def filter_already_open_tabs(
     Returns:
         Tuple of (tabs_to_create, skipped_tab_names).
     """
+    if not open_dirs:
+        # Fresh window: nothing can match, skip the per-tab realpath
+        return list(all_tabs), []
+
     tabs_to_create: list[dict] = []
     tabs_skipped: list[str] = []
 
@@ -4660,6 +5365,15 @@ def filter_already_open_tabs(
     return tabs_to_create, tabs_skipped
 
 
+async def _get_tab_path(tab) -> str | None:
+    """Return the path of the tab's first session that reports one."""
+    for session in tab.sessions:
+        path = await _get_session_path(session)
+        if path:
+            return path
+    return None
+
+
 async def reorder_window_tabs(
     window,
     desired_order: list[str],
@@ -4680,24 +5394,19 @@ async def reorder_window_tabs(
 
     # Build map: normalized dir path → Tab object
     # First, add newly created tabs (path variable may not be set yet)
-    dir_to_tab: dict[str, object] = {}
-    for dir_path, tab in created_tabs.items():
-        dir_to_tab[normalize_tab_path(dir_path)] = tab
+    dir_to_tab: dict[str, object] = {
+        normalize_tab_path(dir_path): tab for dir_path, tab in created_tabs.items()
+    }
 
-    # Then query existing tabs (already-open before this session)
-    for tab in window.tabs:
-        if tab.tab_id in {t.tab_id for t in created_tabs.values()}:
-            continue  # Already tracked via created_tabs
-        for session in tab.sessions:
-            try:
-                path = await session.async_get_variable("path")
-            except (iterm2.RPCException, AttributeError, TypeError):
-                continue
-            if path:
-                normalized = normalize_tab_path(path)
-                if normalized not in dir_to_tab:
-                    dir_to_tab[normalized] = tab
-                break  # Use first session's path per tab
+    # Then query existing tabs (already-open before this session), all tabs
+    # concurrently; tabs created this session are already tracked
+    created_ids = {t.tab_id for t in created_tabs.values()}
+    existing_tabs = [tab for tab in window.tabs if tab.tab_id not in created_ids]
+    tab_paths = await asyncio.gather(*(_get_tab_path(tab) for tab in existing_tabs))
+    for tab, path in zip(existing_tabs, tab_paths):
+        if path:
+            # Created tabs (and earlier tabs) keep their entry
+            dir_to_tab.setdefault(normalize_tab_path(path), tab)
 
     # Build ordered tab list
     ordered_tabs: list[object] = []
@@ -4752,14 +5461,19 @@ async def main(connection):
     5. Create tabs with split panes
     6. Maximize window
     """
+    # Eager tasks (Python 3.12+): gathered coroutines run their synchronous
+    # prefix inline instead of waiting one event-loop iteration to start
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     main_trace_id = str(uuid4())
+    # Bound once: every main() log record carries operation and trace_id
+    log = logger.bind(operation="main", trace_id=main_trace_id)
     report = ErrorReport()
 
-    logger.info(
+    log.info(
         "Workspace Launcher starting",
-        operation="main",
-        status="started",
-        trace_id=main_trace_id
+        status="started"
     )
 
     # =========================================================================
@@ -4771,11 +5485,7 @@ async def main(connection):
     # Get the current window (or create one if none exists)
     window = app.current_terminal_window
     if window is None:
-        logger.info(
-            "No current window - creating a new one",
-            operation="main",
-            trace_id=main_trace_id
-        )
+        log.info("No current window - creating a new one")
         window = await iterm2.Window.async_create(connection)
 
     # =========================================================================
@@ -4783,11 +5493,9 @@ async def main(connection):
     # =========================================================================
 
     if needs_migration():
-        logger.info(
+        log.info(
             "Legacy config detected - offering migration",
-            operation="main",
-            status="migration_needed",
-            trace_id=main_trace_id
+            status="migration_needed"
         )
         await run_migration_wizard(connection, window)
 
@@ -4796,19 +5504,15 @@ async def main(connection):
     # =========================================================================
 
     if is_first_run():
-        logger.info(
+        log.info(
             "First run detected - starting wizard",
-            operation="main",
-            status="first_run",
-            trace_id=main_trace_id
+            status="first_run"
         )
         wizard_success = await run_first_run_wizard(connection, window)
         if not wizard_success:
-            logger.info(
+            log.info(
                 "First-run wizard cancelled or failed",
-                operation="main",
-                status="wizard_cancelled",
-                trace_id=main_trace_id
+                status="wizard_cancelled"
             )
             return
 
@@ -4817,36 +5521,36 @@ async def main(connection):
     # =========================================================================
 
     prefs = load_preferences()
+    # Read once; save_custom_names rebinds it when Layer 2 renames tabs
+    custom_tab_names = prefs.get("custom_tab_names", {})
 
-    while True:  # Back from tab customization restarts workspace selection
-        all_layouts = discover_layouts()
+    # Scanned once: going back from tab customization reuses the list, and
+    # only the setup wizard (which writes new workspace files) rescans
+    all_layouts = discover_layouts()
 
-        # Filter out disabled layouts for selector display
-        disabled_layouts = prefs.get("disabled_layouts", [])
+    while True:  # Back from tab customization restarts workspace selection
+        # Filter out disabled layouts for selector display (set: O(1) lookups)
+        disabled_layouts = frozenset(prefs.get("disabled_layouts", []))
         layouts = [layout for layout in all_layouts if layout["name"] not in disabled_layouts]
 
         if not all_layouts:
             # Fallback: Check for legacy layout.toml (backward compatibility)
-            if LEGACY_CONFIG_PATH.exists():
-                logger.info(
+            if PATHS.legacy_config.exists():
+                log.info(
                     "Using legacy config",
-                    operation="main",
                     status="legacy_fallback",
-                    trace_id=main_trace_id,
-                    config_path=str(LEGACY_CONFIG_PATH)
+                    config_path=str(PATHS.legacy_config)
                 )
                 config = load_config()
                 if config is None:
                     return
                 # Skip to tab creation with legacy config
-                selected_layout = {"name": "legacy", "path": LEGACY_CONFIG_PATH}
+                selected_layout = {"name": "legacy", "path": PATHS.legacy_config}
             else:
-                logger.error(
+                log.error(
                     "No workspace files found",
-                    operation="main",
                     status="failed",
-                    trace_id=main_trace_id,
-                    expected_location=f"{CONFIG_DIR}/workspace-*.toml"
+                    expected_location=f"{PATHS.config_dir}/workspace-*.toml"
                 )
                 return
         else:
@@ -4869,35 +5573,27 @@ async def main(connection):
                     )
                     if auto_result == "open":
                         selected_layout = last_layout_match
-                        logger.info(
+                        log.info(
                             "Auto-opening last workspace",
-                            operation="main",
                             status="auto_open",
-                            trace_id=main_trace_id,
                             layout_name=last_name,
                         )
                     elif auto_result == "cancel":
-                        logger.info(
+                        log.info(
                             "Auto-open cancelled",
-                            operation="main",
                             status="cancelled",
-                            trace_id=main_trace_id,
                         )
                         return
                     else:
                         # "change" — fall through to full selector
-                        logger.info(
+                        log.info(
                             "User chose to change workspace",
-                            operation="main",
                             status="change_workspace",
-                            trace_id=main_trace_id,
                         )
                 else:
-                    logger.warning(
+                    log.warning(
                         "Last workspace not found, showing selector",
-                        operation="main",
                         status="last_not_found",
-                        trace_id=main_trace_id,
                         last_layout=last_name,
                     )
 
@@ -4909,11 +5605,9 @@ async def main(connection):
                 )
 
                 if selector_result is None:
-                    logger.info(
+                    log.info(
                         "Workspace selection cancelled",
-                        operation="main",
-                        status="cancelled",
-                        trace_id=main_trace_id
+                        status="cancelled"
                     )
                     return
 
@@ -4922,33 +5616,27 @@ async def main(connection):
                     action = selector_result.get("action")
 
                     if action == "manage_directories":
-                        logger.info(
+                        log.info(
                             "Opening directory management",
-                            operation="main",
-                            status="settings",
-                            trace_id=main_trace_id
+                            status="settings"
                         )
                         # Show directory management dialog
                         updated_prefs = await show_directory_management(prefs)
                         if updated_prefs is not None:
                             prefs = updated_prefs
                             save_preferences(prefs)
-                            logger.info(
+                            log.info(
                                 "Scan directories updated",
-                                operation="main",
                                 status="directories_updated",
-                                trace_id=main_trace_id,
                                 enabled_dirs=sum(1 for d in prefs.get("scan_directories", []) if d.get("enabled"))
                             )
                         # Continue loop to show selector again
                         continue
 
                     if action == "manage_layouts":
-                        logger.info(
+                        log.info(
                             "Opening workspace management",
-                            operation="main",
-                            status="manage_layouts",
-                            trace_id=main_trace_id
+                            status="manage_layouts"
                         )
                         # Show layout management dialog with ALL layouts
                         updated_prefs = await show_manage_layouts(all_layouts, prefs)
@@ -4956,13 +5644,11 @@ async def main(connection):
                             prefs = updated_prefs
                             save_preferences(prefs)
                             # Refresh filtered layouts list
-                            disabled_layouts = prefs.get("disabled_layouts", [])
+                            disabled_layouts = frozenset(prefs.get("disabled_layouts", []))
                             layouts = [layout for layout in all_layouts if layout["name"] not in disabled_layouts]
-                            logger.info(
+                            log.info(
                                 "Workspace visibility updated",
-                                operation="main",
                                 status="layouts_updated",
-                                trace_id=main_trace_id,
                                 disabled_count=len(disabled_layouts),
                                 visible_count=len(layouts)
                             )
@@ -4970,17 +5656,15 @@ async def main(connection):
                         continue
 
                     if action == "run_wizard":
-                        logger.info(
+                        log.info(
                             "Running setup wizard (manual trigger)",
-                            operation="main",
-                            status="wizard_manual",
-                            trace_id=main_trace_id
+                            status="wizard_manual"
                         )
                         # Run wizard - creates new layout file without overwriting existing
                         await run_setup_wizard_for_veteran(connection, window)
                         # Refresh layouts after wizard
                         all_layouts = discover_layouts()
-                        disabled_layouts = prefs.get("disabled_layouts", [])
+                        disabled_layouts = frozenset(prefs.get("disabled_layouts", []))
                         layouts = [layout for layout in all_layouts if layout["name"] not in disabled_layouts]
                         # Continue loop to show selector again
                         continue
@@ -4994,22 +5678,18 @@ async def main(connection):
                 save_preferences(prefs)
 
             # Load the selected workspace config
-            logger.info(
+            log.info(
                 "Loading workspace",
-                operation="main",
                 status="loading",
-                trace_id=main_trace_id,
                 layout_name=selected_layout["name"]
             )
             config_result = load_config_from_path(selected_layout["path"])
 
             # Use collect_result to aggregate errors
             if not report.collect_result(config_result, "load_config"):
-                logger.error(
+                log.error(
                     "Failed to load workspace config",
-                    operation="main",
-                    status="config_load_failed",
-                    trace_id=main_trace_id
+                    status="config_load_failed"
                 )
                 report.log_summary(main_trace_id)
                 return
@@ -5020,125 +5700,110 @@ async def main(connection):
             return
 
         tabs = config.get("tabs", [])
+        config_path = str(selected_layout["path"])
         if not tabs:
-            logger.warning(
+            log.warning(
                 "No tabs configured in workspace",
-                operation="main",
                 status="no_tabs",
-                trace_id=main_trace_id,
-                config_path=str(selected_layout["path"])
+                config_path=config_path
             )
             return
 
-        # =========================================================================
-        # Window Activation (ensure focus before creating tabs)
-        # =========================================================================
-
-        # Ensure window has focus before creating tabs
-        await app.async_activate()
-        await window.async_activate()
-        logger.debug(
-            "Window activated and focused",
-            operation="main",
-            trace_id=main_trace_id
-        )
-
         left_pane_ratio = config["layout"]["left_pane_ratio"]
-        logger.info(
+        log.info(
             "Creating workspace",
-            operation="main",
             status="creating",
-            trace_id=main_trace_id,
             layout_name=selected_layout["name"],
             left_pane_ratio=int(left_pane_ratio * 100),
-            config_path=str(selected_layout["path"])
+            config_path=config_path
         )
 
         # =========================================================================
         # Worktree Discovery (Universal - All Git Repos)
         # =========================================================================
 
+        # Universal discovery (single filesystem pass for repos + untracked)
+        scan_directories = get_enabled_scan_directories(prefs)
+
         # Legacy worktree discovery (config-based, for backward compatibility)
-        legacy_worktrees = discover_worktrees(config)
+        # and the single-pass repo/untracked scan (plus worktrees of the repos
+        # found) are independent: run both on worker threads concurrently
+        legacy_worktrees, (all_git_repos, universal_worktrees, untracked_folders) = await asyncio.gather(
+            asyncio.to_thread(discover_worktrees, config),
+            asyncio.to_thread(
+                discover_scan_tree,
+                scan_directories=scan_directories,
+                exclude_dirs=set()
+            ),
+        )
         if legacy_worktrees:
-            logger.info(
+            log.info(
                 "Legacy worktrees discovered",
-                operation="main",
-                trace_id=main_trace_id,
                 metrics={"count": len(legacy_worktrees)},
                 worktrees=[{"name": wt["name"], "dir": wt["dir"]} for wt in legacy_worktrees]
             )
 
-        # Universal discovery (single filesystem pass for repos + untracked)
-        layout_dirs = {Path(tab["dir"]).expanduser() for tab in tabs}
-        scan_directories = get_enabled_scan_directories(prefs)
-
-        # Single-pass discovery: git repos and untracked folders together
-        all_git_repos, untracked_folders = discover_all_directories(
-            scan_directories=scan_directories,
-            exclude_dirs=set()
-        )
-        additional_repos = [r for r in all_git_repos if Path(r["dir"]).expanduser() not in layout_dirs]
-
-        # Filter untracked folders to exclude layout directories
-        untracked_folders = [
-            f for f in untracked_folders
-            if Path(f["dir"]).expanduser() not in layout_dirs
-        ]
+        # Check if user wants to skip tab customization: additional repos and
+        # untracked folders only feed the Layer 2 dialog, so skip filtering
+        # them (left as discovered; the logs below report the raw counts)
+        skip_customization = prefs.get("skip_tab_customization", False)
 
-        # Discover worktrees from git repos
-        universal_worktrees = discover_all_worktrees(all_git_repos)
+        if skip_customization:
+            additional_repos = all_git_repos
+        else:
+            layout_dirs = {os.path.normpath(expand_tab_path(tab["dir"])) for tab in tabs}
+            additional_repos = [
+                r for r in all_git_repos
+                if os.path.normpath(expand_tab_path(r["dir"])) not in layout_dirs
+            ]
+
+            # Filter untracked folders to exclude layout directories
+            untracked_folders = [
+                f for f in untracked_folders
+                if os.path.normpath(expand_tab_path(f["dir"])) not in layout_dirs
+            ]
 
         if universal_worktrees:
-            logger.info(
+            log.info(
                 "Universal worktrees discovered",
-                operation="main",
-                trace_id=main_trace_id,
                 metrics={"count": len(universal_worktrees)},
                 worktrees=[{"name": wt["name"], "dir": wt["dir"]} for wt in universal_worktrees]
             )
 
         if untracked_folders:
-            logger.info(
+            log.info(
                 "Untracked folders discovered",
-                operation="main",
-                trace_id=main_trace_id,
                 metrics={"count": len(untracked_folders)},
                 folders=[{"name": f["name"], "dir": f["dir"]} for f in untracked_folders]
             )
 
-        logger.info(
+        log.info(
             "Discovery complete",
-            operation="main",
             status="discovery_complete",
-            trace_id=main_trace_id,
             metrics={
                 "layout_tabs": len(tabs),
                 "legacy_worktrees": len(legacy_worktrees),
                 "universal_worktrees": len(universal_worktrees),
                 "additional_repos": len(additional_repos),
                 "untracked_folders": len(untracked_folders)
-            }
+            },
+            layer2_skipped=skip_customization
         )
 
         # =========================================================================
         # Layer 2: Tab Customization (Optional)
         # =========================================================================
 
-        # Check if user wants to skip tab customization
-        skip_customization = prefs.get("skip_tab_customization", False)
-
         if not skip_customization and (universal_worktrees or additional_repos or untracked_folders):
             # Show Layer 2 dialog for tab selection
-            logger.info(
+            log.info(
                 "Showing tab customization dialog",
-                operation="main",
-                status="layer2_start",
-                trace_id=main_trace_id
+                status="layer2_start"
             )
             # Callback to save custom tab names when user renames
             def save_custom_names(new_names: dict[str, str], _prefs=prefs) -> None:
-                _prefs["custom_tab_names"] = new_names
+                nonlocal custom_tab_names
+                _prefs["custom_tab_names"] = custom_tab_names = new_names
                 save_preferences(_prefs)
 
             final_tabs = await show_tab_customization(
@@ -5148,35 +5813,29 @@ async def main(connection):
                 additional_repos=additional_repos,
                 untracked_folders=untracked_folders,
                 last_tab_selections=prefs.get("last_tab_selections"),
-                custom_tab_names=prefs.get("custom_tab_names", {}),
+                custom_tab_names=custom_tab_names,
                 save_preferences_callback=save_custom_names
             )
 
             if final_tabs == "BACK_TO_SELECTOR":
-                logger.info(
+                log.info(
                     "Returning to workspace selector",
-                    operation="main",
-                    status="back_to_selector",
-                    trace_id=main_trace_id
+                    status="back_to_selector"
                 )
                 continue  # Re-enter outer workspace selection loop
 
             if final_tabs is None:
-                logger.info(
+                log.info(
                     "Workspace creation cancelled at tab customization",
-                    operation="main",
-                    status="cancelled",
-                    trace_id=main_trace_id
+                    status="cancelled"
                 )
                 return
 
             # Validate that user selected at least one tab
             if len(final_tabs) == 0:
-                logger.warning(
+                log.warning(
                     "No tabs selected - showing confirmation dialog",
-                    operation="main",
-                    status="empty_selection",
-                    trace_id=main_trace_id
+                    status="empty_selection"
                 )
                 # Show confirmation dialog for empty selection
                 confirm_alert = iterm2.Alert(
@@ -5198,7 +5857,7 @@ async def main(connection):
                         additional_repos=additional_repos,
                         untracked_folders=untracked_folders,
                         last_tab_selections=prefs.get("last_tab_selections"),
-                        custom_tab_names=prefs.get("custom_tab_names", {}),
+                        custom_tab_names=custom_tab_names,
                         save_preferences_callback=save_custom_names
                     )
                     if final_tabs is None:
@@ -5209,20 +5868,23 @@ async def main(connection):
             saved_order = prefs.get("last_tab_order")
             if saved_order and len(final_tabs) > 1:
                 order_map = {normalize_tab_path(d): i for i, d in enumerate(saved_order)}
-                final_tabs.sort(
-                    key=lambda t: order_map.get(normalize_tab_path(get_tab_dir(t)), 999)
-                )
+                # (rank, index, tab): the index keeps ties in their original
+                # order and ensures the tab dicts themselves are never compared
+                keyed = [
+                    (order_map.get(normalize_tab_path(get_tab_dir(t)), 999), i, t)
+                    for i, t in enumerate(final_tabs)
+                ]
+                keyed.sort()
+                final_tabs = [t for _, _, t in keyed]
 
             all_tabs = final_tabs
 
             # Offer tab reorder if more than 1 tab selected
             if len(all_tabs) > 1 and is_swiftdialog_available():
-                reordered = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda _tabs=all_tabs, _prefs=prefs: show_tab_reorder_dialog(
-                        _tabs,
-                        custom_tab_names=_prefs.get("custom_tab_names", {}),
-                    ),
+                reordered = await asyncio.to_thread(
+                    show_tab_reorder_dialog,
+                    all_tabs,
+                    custom_tab_names=custom_tab_names,
                 )
                 if reordered is not None:
                     all_tabs = reordered
@@ -5256,21 +5918,45 @@ async def main(connection):
             break
 
     # =========================================================================
-    # Detect Already-Open Tabs
+    # Detect Already-Open Tabs + Window Preparation
     # =========================================================================
 
-    # Get custom tab names early - used by filter and display throughout
-    custom_tab_names = prefs.get("custom_tab_names", {})
+    # Ensure window has focus before creating tabs: the two activation RPCs
+    # are sent together
+    activate_task = asyncio.gather(app.async_activate(), window.async_activate())
+
+    # Open tabs are queried only now, after the dialogs, so tabs opened while
+    # they were showing are seen. The query and the tab directory checks (on
+    # worker threads: a stat can stall on network mounts or sleeping disks)
+    # run during activation and while the window is maximized
+    open_dirs_task = asyncio.create_task(get_open_tab_directories(window))
+    tab_dirs = [get_tab_dir(t) for t in all_tabs]
+    dirs_exist_task = asyncio.gather(
+        *(asyncio.to_thread(os.path.isdir, expand_tab_path(d)) for d in tab_dirs)
+    )
+    try:
+        await activate_task
+        log.debug("Window activated and focused")
+
+        # Maximize window first
+        log.info("Maximizing window")
+        await maximize_window(window)
+
+        open_dirs = await open_dirs_task
+        dirs_exist = await dirs_exist_task
+    finally:
+        # No-ops once finished; on failure nothing is left pending
+        activate_task.cancel()
+        open_dirs_task.cancel()
+        dirs_exist_task.cancel()
 
-    open_dirs = await get_open_tab_directories(window)
     if open_dirs:
-        logger.info(
+        log.info(
             "Detected open directories",
-            operation="main",
-            trace_id=main_trace_id,
             count=len(open_dirs),
         )
 
+    dir_exists = dict(zip(tab_dirs, dirs_exist))
     tabs_to_create, tabs_skipped = filter_already_open_tabs(
         all_tabs, open_dirs, custom_tab_names
     )
@@ -5280,14 +5966,6 @@ async def main(connection):
     # Window and Tab Creation
     # =========================================================================
 
-    # Maximize window first
-    logger.info(
-        "Maximizing window",
-        operation="main",
-        trace_id=main_trace_id
-    )
-    await maximize_window(window)
-
     # Track whether we've used the initial tab (for is_first logic)
     # When tabs were skipped (already open), never reuse the active tab —
     # the user's focused tab should not be overwritten.
@@ -5295,20 +5973,21 @@ async def main(connection):
 
     # Track created tabs for reordering (dir_path → Tab object)
     created_tabs: dict[str, object] = {}
+    # Names of the tabs actually created (for the tabs_created metric)
+    created_names: list[str] = []
+
+    # Display names resolved once, in all_tabs order: used for tab creation
+    # and again for the last_tab_selections saved below
+    tab_names = [get_tab_display_name(t, custom_tab_names) for t in all_tabs]
 
     # Validate all tabs first and filter out invalid ones
     valid_tabs: list[tuple[dict, str, str]] = []  # (tab_config, tab_dir, tab_name)
-    for idx, tab_config in enumerate(all_tabs):
+    for idx, (tab_config, tab_name) in enumerate(zip(all_tabs, tab_names)):
         tab_dir = get_tab_dir(tab_config)
-        tab_name = get_tab_display_name(tab_config, custom_tab_names)
-        expanded_dir = expand_tab_path(tab_dir)
-
-        if not os.path.isdir(expanded_dir):
-            logger.warning(
+        if not dir_exists[tab_dir]:
+            log.warning(
                 "Tab skipped - directory not found",
-                operation="main",
                 status="skip",
-                trace_id=main_trace_id,
                 tab_index=idx + 1,
                 tab_name=tab_name,
                 tab_dir=tab_dir
@@ -5324,10 +6003,8 @@ async def main(connection):
     # Create first tab (reuses current tab if no tabs were skipped)
     if valid_tabs and not used_initial_tab:
         _, first_dir, first_name = valid_tabs[0]
-        logger.info(
+        log.info(
             "Creating first tab (reusing current)",
-            operation="main",
-            trace_id=main_trace_id,
             tab_index=1,
             tab_name=first_name,
             tab_dir=first_dir
@@ -5336,34 +6013,53 @@ async def main(connection):
             window, connection, first_dir, first_name, config, is_first=True
         )
         created_tabs[first_dir] = first_tab
+        created_names.append(first_name)
         remaining_tabs = valid_tabs[1:]
     else:
         remaining_tabs = valid_tabs
 
     # Create remaining tabs in PARALLEL using asyncio.gather()
     if remaining_tabs:
-        logger.info(
-            f"Creating {len(remaining_tabs)} tabs in parallel",
-            operation="main",
-            trace_id=main_trace_id
-        )
+        log.info(f"Creating {len(remaining_tabs)} tabs in parallel")
+
+        # Cap in-flight tab creations: each one is a burst of RPCs (create,
+        # split, layout, send text), and iTerm2 serves them on one connection
+        tab_slots = asyncio.Semaphore(4)
 
         async def create_single_tab(tab_info: tuple[dict, str, str]) -> tuple[str, object]:
             """Create a single tab and return (dir, tab) tuple."""
             _, tab_dir, tab_name = tab_info
-            tab = await create_tab_with_splits(
-                window, connection, tab_dir, tab_name, config, is_first=False
-            )
+            async with tab_slots:
+                tab = await create_tab_with_splits(
+                    window, connection, tab_dir, tab_name, config, is_first=False
+                )
             return (tab_dir, tab)
 
-        # Create all remaining tabs concurrently
-        results = await asyncio.gather(*[
-            create_single_tab(tab_info) for tab_info in remaining_tabs
-        ])
+        # Create all remaining tabs concurrently (at most 4 at a time); one
+        # failed tab is reported and skipped instead of aborting the others
+        results = await asyncio.gather(
+            *[create_single_tab(tab_info) for tab_info in remaining_tabs],
+            return_exceptions=True
+        )
 
         # Collect results into created_tabs dict
-        for tab_dir, tab in results:
-            created_tabs[tab_dir] = tab
+        for (_, tab_dir, tab_name), result in zip(remaining_tabs, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result  # Cancellation etc. is not a per-tab failure
+                report.add_warning(Error(
+                    error_type=ErrorType.ASYNC_ERROR,
+                    message=f"Tab creation failed: {tab_name}",
+                    context={
+                        "tab_name": tab_name,
+                        "tab_dir": tab_dir,
+                        "error": f"{type(result).__name__}: {result}",
+                    },
+                    original_exception=result
+                ))
+                continue
+            created_tabs[tab_dir] = result[1]
+            created_names.append(tab_name)
 
     # Reorder all window tabs to match the finalized order
     # Pass created_tabs to bypass path query for newly created tabs
@@ -5372,27 +6068,21 @@ async def main(connection):
 
     # Save updated preferences with all selected tabs (including skipped ones
     # that were already open — they are still part of the workspace selection)
-    # Use get_tab_display_name for consistent name resolution with custom names
-    all_tab_names = list(tabs_skipped) + [
-        get_tab_display_name(t, custom_tab_names) for t in all_tabs
-    ]
+    # Names come from get_tab_display_name for consistent resolution with custom names
+    all_tab_names = list(tabs_skipped) + tab_names
     prefs["last_tab_selections"] = all_tab_names
     save_preferences(prefs)
 
-    logger.info(
+    log.info(
         "Workspace created successfully",
-        operation="main",
-        status="complete",
-        trace_id=main_trace_id
+        status="complete"
     )
 
-    logger.info(
+    log.info(
         "Workspace creation complete",
-        operation="main",
         status="success",
-        trace_id=main_trace_id,
         metrics={
-            "tabs_created": len(all_tabs),
+            "tabs_created": len(created_names),
             "warnings": len(report.warnings),
             "errors": len(report.errors)
         }